@@ -1,10 +1,22 @@
 from .api import AuctusAPI
+from .session import AuctusSession
+from .download import stream_download
 from .models import Dataset, Metadata
-from .collection import DatasetCollection
+from .columnar import ColumnarDatasets
+from .collection import DatasetCollection, SearchContext
+from .json_backends import JSONBackend, resolve_json_backend
+from .query import DatasetQuery
 
 __all__ = [
     "AuctusAPI",
+    "AuctusSession",
+    "stream_download",
     "Dataset",
     "Metadata",
+    "ColumnarDatasets",
     "DatasetCollection",
+    "SearchContext",
+    "JSONBackend",
+    "resolve_json_backend",
+    "DatasetQuery",
 ]
@@ -1,16 +1,20 @@
-from beartype import beartype
+from typing import Optional
 
+from auctus_search.helpers.typecheck import typechecked
 
-@beartype
+
+@typechecked
 class AuctusAPI:
     BASE_URL: str = "https://auctus.vida-nyu.org/api/v1"
 
     @classmethod
-    @beartype
-    def search(cls, page: int = 1, size: int = 10) -> str:
-        return f"{cls.BASE_URL}/search?page={page}&size={size}"
+    @typechecked
+    def search(cls, page: Optional[int] = None, size: Optional[int] = None) -> str:
+        if page is None and size is None:
+            return f"{cls.BASE_URL}/search"
+        return f"{cls.BASE_URL}/search?page={page or 1}&size={size or 10}"
 
     @classmethod
-    @beartype
+    @typechecked
     def download(cls, dataset_id: str, dataset_format: str = "csv") -> str:
         return f"{cls.BASE_URL}/download/{dataset_id}?format={dataset_format}"
@@ -1,53 +1,263 @@
-from typing import List, Callable, Any, Union
+import functools
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
-from beartype import beartype
+import numpy
 
+from auctus_search.API.columnar import ColumnarDatasets
 from auctus_search.API.models import Dataset
+from auctus_search.API.query import BoundingBox, validate_bounding_box
+from auctus_search.helpers.ensure_metadata_fields import ensure_metadata_fields
+from auctus_search.helpers.typecheck import typechecked
+from auctus_search.index.column_index import ColumnIndex
+from auctus_search.index.coverage_index import SpatialIndex, TemporalIndex
 
-from functools import wraps
+if TYPE_CHECKING:
+    import pandas
 
 
-def ensure_metadata_fields(fields: List[str]) -> Callable:
-    def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def wrapper(self, *args, **kwargs):
-            for dataset in self.datasets:
-                for field in fields:
-                    if field == "score":
-                        if not hasattr(dataset, "score"):
-                            raise ValueError(
-                                f"Dataset {dataset.id} is missing 'score'."
-                            )
-                    else:
-                        if not hasattr(dataset.metadata, field):
-                            raise ValueError(
-                                f"Dataset {dataset.id} is missing metadata field '{field}'."
-                            )
-            return func(self, *args, **kwargs)
+@dataclass(frozen=True)
+class DatasetPredicate:
+    name: str
+    value: Any
+    fields: Tuple[str, ...]
+    condition: Callable[[Dataset], bool]
+    mask: Optional[Callable[[ColumnarDatasets], numpy.ndarray]] = None
+    # Sorted source positions, for predicates answered by an index.
+    positions: Optional[numpy.ndarray] = None
 
-        return wrapper
 
-    return decorator
+@dataclass(frozen=True)
+class SearchContext:
+    """The query a collection was fetched with, frozen at search time."""
 
+    search_query: Optional[Union[str, Tuple[str, ...]]] = None
+    page: Optional[int] = None
+    size: Optional[int] = None
 
-@beartype
+    @classmethod
+    def from_query(
+        cls,
+        search_query: Optional[Union[str, List[str]]] = None,
+        page: Optional[int] = None,
+        size: Optional[int] = None,
+    ) -> "SearchContext":
+        if isinstance(search_query, list):
+            search_query = tuple(search_query)
+        return cls(search_query, page, size)
+
+
+@typechecked
 class DatasetCollection:
     def __init__(
-        self, datasets: List[Dataset], auctus_search, filters: List[str] = None
+        self,
+        datasets: List[Dataset],
+        auctus_search,
+        filters: List[str] = None,
+        search_query: Optional[Union[str, List[str]]] = None,
+        columnar: bool = False,
+        context: Optional[SearchContext] = None,
     ):
-        self.datasets = datasets
+        self._source: List[Dataset] = datasets
+        self._predicates: Tuple[DatasetPredicate, ...] = ()
+        self._datasets: Optional[List[Dataset]] = datasets
+        self._columnar: Optional[ColumnarDatasets] = (
+            ColumnarDatasets(datasets) if columnar else None
+        )
+        self._column_index: Optional[ColumnIndex] = None
+        self._spatial_index: Optional[SpatialIndex] = None
+        self._temporal_index: Optional[TemporalIndex] = None
         self.auctus_search = auctus_search
         self.filters = filters or []
+        self.context: SearchContext = (
+            context if context is not None else SearchContext.from_query(search_query)
+        )
+
+    @property
+    def search_query(self) -> Optional[Union[str, List[str]]]:
+        search_query = self.context.search_query
+        return list(search_query) if isinstance(search_query, tuple) else search_query
+
+    @property
+    def datasets(self) -> List[Dataset]:
+        if self._datasets is None:
+            self._datasets = self._materialise()
+        return self._datasets
+
+    @datasets.setter
+    def datasets(self, datasets: List[Dataset]) -> None:
+        self._source = datasets
+        self._predicates = ()
+        self._datasets = datasets
+        self._column_index = None
+        self._spatial_index = None
+        self._temporal_index = None
+        if self._columnar is not None:
+            self._columnar = ColumnarDatasets(datasets)
+
+    @property
+    def is_columnar(self) -> bool:
+        return self._columnar is not None
+
+    def _materialise(self) -> List[Dataset]:
+        candidates = self._source
+        row_predicates = self._predicates
+        if self._columnar is not None:
+            mask = numpy.ones(len(self._columnar), dtype=bool)
+            for predicate in self._predicates:
+                if predicate.mask is not None:
+                    mask &= predicate.mask(self._columnar)
+            candidates = [
+                self._source[position] for position in numpy.flatnonzero(mask)
+            ]
+            row_predicates = tuple(
+                predicate for predicate in self._predicates if predicate.mask is None
+            )
+        elif any(predicate.positions is not None for predicate in row_predicates):
+            positions = functools.reduce(
+                numpy.intersect1d,
+                [
+                    predicate.positions
+                    for predicate in row_predicates
+                    if predicate.positions is not None
+                ],
+            )
+            candidates = [self._source[position] for position in positions]
+            row_predicates = tuple(
+                predicate for predicate in row_predicates if predicate.positions is None
+            )
+
+        required_fields = {
+            field for predicate in row_predicates for field in predicate.fields
+        }
+        conditions = [predicate.condition for predicate in row_predicates]
+        if not conditions:
+            return list(candidates)
+        filtered_datasets = []
+        # One pass over the source validates and applies the whole filter chain.
+        for dataset in candidates:
+            if required_fields:
+                ensure_metadata_fields(dataset, required_fields)
+            for condition in conditions:
+                if not condition(dataset):
+                    break
+            else:
+                filtered_datasets.append(dataset)
+        return filtered_datasets
 
     def _filter(
-        self, condition: Callable[[Dataset], bool], filter_name: str, filter_value: Any
+        self,
+        condition: Callable[[Dataset], bool],
+        filter_name: str,
+        filter_value: Any,
+        fields: Tuple[str, ...] = (),
+        mask: Optional[Callable[[ColumnarDatasets], numpy.ndarray]] = None,
+        positions: Optional[numpy.ndarray] = None,
+    ):
+        predicate = DatasetPredicate(
+            filter_name, filter_value, fields, condition, mask, positions
+        )
+        # Columnar collections and index lookups keep their source, so masks
+        # and positions stay aligned with it.
+        if self._datasets is not None and self._columnar is None and positions is None:
+            source, predicates = self._datasets, (predicate,)
+        else:
+            source, predicates = self._source, (*self._predicates, predicate)
+        collection = DatasetCollection(
+            source,
+            self.auctus_search,
+            self.filters + [f"{filter_name}: {filter_value}"],
+            context=self.context,
+        )
+        collection._predicates = predicates
+        collection._datasets = None
+        collection._columnar = self._columnar
+        # Index positions refer to the source, so share them only along with it.
+        if source is self._source:
+            collection._column_index = self._column_index
+            collection._spatial_index = self._spatial_index
+            collection._temporal_index = self._temporal_index
+        return collection
+
+    def _filter_positions(
+        self, positions: numpy.ndarray, filter_name: str, filter_value: Any
     ):
-        filtered_datasets = [dataset for dataset in self.datasets if condition(dataset)]
-        new_filters = self.filters + [f"{filter_name}: {filter_value}"]
-        return DatasetCollection(filtered_datasets, self.auctus_search, new_filters)
+        """Keep the source datasets at ``positions``, as found by an index.
+
+        The collection is then built from the positions themselves rather than
+        by testing every dataset in the source.
+        """
+        # Identity, not dataset ids: a merged source may repeat an id.
+        matching = {id(self._source[position]) for position in positions}
+
+        def mask(columnar: ColumnarDatasets) -> numpy.ndarray:
+            selected = numpy.zeros(len(columnar), dtype=bool)
+            selected[positions] = True
+            return selected
+
+        # Building the index already read the metadata the filter needs.
+        return self._filter(
+            lambda dataset: id(dataset) in matching,
+            filter_name,
+            filter_value,
+            mask=mask,
+            positions=positions,
+        )
+
+    @property
+    def column_index(self) -> ColumnIndex:
+        """Column lookup tables over the source, built on first use."""
+        if self._column_index is None:
+            self._column_index = ColumnIndex(self._source)
+        return self._column_index
+
+    @property
+    def spatial_index(self) -> SpatialIndex:
+        """R-tree over the spatial coverage of the source, built on first use."""
+        if self._spatial_index is None:
+            self._spatial_index = SpatialIndex(self._source)
+        return self._spatial_index
 
-    @ensure_metadata_fields(["types"])
-    @beartype
+    @property
+    def temporal_index(self) -> TemporalIndex:
+        """Sorted temporal coverage of the source, built on first use."""
+        if self._temporal_index is None:
+            self._temporal_index = TemporalIndex(self._source)
+        return self._temporal_index
+
+    @typechecked
+    def to_columnar(self) -> "DatasetCollection":
+        return DatasetCollection(
+            self.datasets,
+            self.auctus_search,
+            list(self.filters),
+            columnar=True,
+            context=self.context,
+        )
+
+    @typechecked
+    def to_frame(self) -> "pandas.DataFrame":
+        if self._columnar is not None and not self._predicates:
+            return self._columnar.to_frame()
+        return ColumnarDatasets(self.datasets).to_frame()
+
+    def __len__(self) -> int:
+        return len(self.datasets)
+
+    def __iter__(self) -> Iterator[Dataset]:
+        return iter(self.datasets)
+
+    @typechecked
     def with_types(self, types: List[str]):
         return self._filter(
             lambda dataset: any(
@@ -55,83 +265,107 @@ class DatasetCollection:
             ),
             "with_types",
             types,
+            fields=("types",),
+            mask=lambda columnar: columnar.types_mask(
+                [type_.lower() for type_ in types]
+            ),
         )
 
-    @ensure_metadata_fields(["nb_rows"])
-    @beartype
+    @typechecked
     def with_number_of_rows_greater_than(self, min_rows: int):
         return self._filter(
-            lambda dataset: dataset.metadata.nb_rows is not None
-            and dataset.metadata.nb_rows > min_rows,
+            lambda dataset: (
+                dataset.metadata.nb_rows is not None
+                and dataset.metadata.nb_rows > min_rows
+            ),
             "with_number_of_rows_greater_than",
             min_rows,
+            fields=("nb_rows",),
+            mask=lambda columnar: columnar.nb_rows > min_rows,
         )
 
-    @ensure_metadata_fields(["nb_rows"])
-    @beartype
+    @typechecked
     def with_number_of_rows_less_than(self, max_rows: int):
         return self._filter(
-            lambda dataset: dataset.metadata.nb_rows is not None
-            and dataset.metadata.nb_rows < max_rows,
+            lambda dataset: (
+                dataset.metadata.nb_rows is not None
+                and dataset.metadata.nb_rows < max_rows
+            ),
             "with_number_of_rows_less_than",
             max_rows,
+            fields=("nb_rows",),
+            mask=lambda columnar: columnar.nb_rows < max_rows,
         )
 
-    @ensure_metadata_fields(["nb_rows"])
-    @beartype
+    @typechecked
     def with_number_of_rows_between(self, min_rows: int, max_rows: int):
         return self._filter(
-            lambda dataset: dataset.metadata.nb_rows is not None
-            and min_rows <= dataset.metadata.nb_rows <= max_rows,
+            lambda dataset: (
+                dataset.metadata.nb_rows is not None
+                and min_rows <= dataset.metadata.nb_rows <= max_rows
+            ),
             "with_number_of_rows_between",
             (min_rows, max_rows),
+            fields=("nb_rows",),
+            mask=lambda columnar: (
+                (min_rows <= columnar.nb_rows) & (columnar.nb_rows <= max_rows)
+            ),
         )
 
-    @ensure_metadata_fields(["columns"])
-    @beartype
+    @typechecked
     def with_number_of_columns_greater_than(self, min_columns: int):
         return self._filter(
             lambda dataset: len(dataset.metadata.columns) > min_columns,
             "with_number_of_columns_greater_than",
             min_columns,
+            fields=("columns",),
+            mask=lambda columnar: columnar.nb_columns > min_columns,
         )
 
-    @ensure_metadata_fields(["columns"])
-    @beartype
+    @typechecked
     def with_number_of_columns_less_than(self, max_columns: int):
         return self._filter(
             lambda dataset: len(dataset.metadata.columns) < max_columns,
             "with_number_of_columns_less_than",
             max_columns,
+            fields=("columns",),
+            mask=lambda columnar: columnar.nb_columns < max_columns,
         )
 
-    @ensure_metadata_fields(["columns"])
-    @beartype
+    @typechecked
     def with_number_of_columns_between(self, min_columns: int, max_columns: int):
         return self._filter(
             lambda dataset: min_columns <= len(dataset.metadata.columns) <= max_columns,
             "with_number_of_columns_between",
             (min_columns, max_columns),
+            fields=("columns",),
+            mask=lambda columnar: (
+                (min_columns <= columnar.nb_columns)
+                & (columnar.nb_columns <= max_columns)
+            ),
         )
 
-    @ensure_metadata_fields(["score"])
-    @beartype
+    @typechecked
     def with_score_greater_than(self, min_score: Union[int, float]):
         return self._filter(
             lambda dataset: dataset.score > min_score,
             "with_score_greater_than",
             min_score,
+            fields=("score",),
+            mask=lambda columnar: columnar.scores > min_score,
         )
 
-    @ensure_metadata_fields(["score"])
-    @beartype
+    @typechecked
     def with_score_less_than(self, max_score: Union[int, float]):
         return self._filter(
-            lambda dataset: dataset.score < max_score, "with_score_less_than", max_score
+            lambda dataset: dataset.score < max_score,
+            "with_score_less_than",
+            max_score,
+            fields=("score",),
+            mask=lambda columnar: columnar.scores < max_score,
         )
 
-    @ensure_metadata_fields(["score"])
-    @beartype
+    @typechecked
     def with_score_between(
         self, min_score: Union[int, float], max_score: Union[int, float]
     ):
@@ -139,13 +373,72 @@ class DatasetCollection:
             lambda dataset: min_score <= dataset.score <= max_score,
             "with_score_between",
             (min_score, max_score),
+            fields=("score",),
+            mask=lambda columnar: (
+                (min_score <= columnar.scores) & (columnar.scores <= max_score)
+            ),
+        )
+
+    @typechecked
+    def with_column(
+        self,
+        name: Optional[str] = None,
+        structural_type: Optional[str] = None,
+        semantic_type: Optional[str] = None,
+    ):
+        positions = self.column_index.matching_positions(
+            name, structural_type, semantic_type
+        )
+        criteria = {
+            "name": name,
+            "structural_type": structural_type,
+            "semantic_type": semantic_type,
+        }
+        return self._filter_positions(
+            numpy.array(sorted(positions), dtype=numpy.intp),
+            "with_column",
+            {key: value for key, value in criteria.items() if value is not None},
         )
 
-    @beartype
+    @typechecked
+    def with_spatial_overlap(self, bbox: BoundingBox):
+        validate_bounding_box(bbox)
+        return self._filter_positions(
+            self.spatial_index.overlapping_positions(bbox),
+            "with_spatial_overlap",
+            tuple(bbox),
+        )
+
+    @typechecked
+    def with_temporal_overlap(self, start: str, end: str):
+        start_seconds, end_seconds = TemporalIndex.query_bounds(start, end)
+        return self._filter_positions(
+            self.temporal_index.overlapping_positions(start_seconds, end_seconds),
+            "with_temporal_overlap",
+            (start, end),
+        )
+
+    @typechecked
+    def find_columns(
+        self,
+        name: Optional[str] = None,
+        structural_type: Optional[str] = None,
+        semantic_type: Optional[str] = None,
+    ) -> List[Tuple[Dataset, Dict[str, Any]]]:
+        matches = self.column_index.find_columns(name, structural_type, semantic_type)
+        if self._datasets is self._source:
+            return matches
+        visible = {id(dataset) for dataset in self.datasets}
+        return [
+            (dataset, column) for dataset, column in matches if id(dataset) in visible
+        ]
+
+    @typechecked
     def preview(self) -> None:
         steps = ["Dataset Collection Preview:", "├── Search Query: <Not Set>"]
-        if self.auctus_search.search_query:
-            steps[1] = f"├── Search Query: {self.auctus_search.search_query}"
+        search_query = self.search_query
+        if search_query:
+            steps[1] = f"├── Search Query: {search_query}"
         steps.append("├── Filters Applied:")
         if not self.filters:
             steps.append("│   └── None")
@@ -162,6 +455,11 @@ class DatasetCollection:
             steps.append(f"    └── {len(self.datasets)}")
         print("\n".join(steps))
 
-    @beartype
-    def display(self) -> None:
-        self.auctus_search._render_results(self.datasets)
+    @typechecked
+    def display(self, page_size: Optional[int] = None) -> None:
+        if not hasattr(self.auctus_search, "_render_results"):
+            raise ValueError(
+                "display() needs the widget-based AuctusSearch; "
+                "AuctusClient is headless."
+            )
+        self.auctus_search._render_results(self.datasets, page_size)
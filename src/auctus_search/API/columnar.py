@@ -0,0 +1,88 @@
+from typing import TYPE_CHECKING, Dict, FrozenSet, List
+
+import numpy
+
+from auctus_search.API.models import Dataset
+from auctus_search.helpers.ensure_metadata_fields import ensure_metadata_fields
+from auctus_search.helpers.typecheck import typechecked
+
+if TYPE_CHECKING:
+    import pandas
+
+
+# The fields read into arrays; masks then never run on a missing field.
+COLUMNAR_FIELDS: FrozenSet[str] = frozenset({"score", "name", "types", "nb_rows", "columns", "size", "date"})
+
+
+@typechecked
+class ColumnarDatasets:
+    def __init__(self, datasets: List[Dataset]) -> None:
+        count = len(datasets)
+        self.ids: numpy.ndarray = numpy.empty(count, dtype=object)
+        self.names: numpy.ndarray = numpy.empty(count, dtype=object)
+        self.scores: numpy.ndarray = numpy.empty(count, dtype=numpy.float64)
+        self.nb_rows: numpy.ndarray = numpy.empty(count, dtype=numpy.float64)
+        self.nb_columns: numpy.ndarray = numpy.empty(count, dtype=numpy.int64)
+        self.sizes: numpy.ndarray = numpy.empty(count, dtype=numpy.float64)
+        dates: List[object] = [None] * count
+        type_positions: Dict[str, List[int]] = {}
+        try:
+            for position, dataset in enumerate(datasets):
+                metadata = dataset.metadata
+                self.ids[position] = dataset.id
+                self.names[position] = metadata.name
+                self.scores[position] = dataset.score
+                self.nb_rows[position] = numpy.nan if metadata.nb_rows is None else metadata.nb_rows
+                self.nb_columns[position] = len(metadata.columns)
+                self.sizes[position] = numpy.nan if metadata.size is None else metadata.size
+                dates[position] = metadata.date
+                for type_ in metadata.types:
+                    type_positions.setdefault(type_, []).append(position)
+        except AttributeError:
+            # Report the missing field the same way the row filters do.
+            ensure_metadata_fields(dataset, COLUMNAR_FIELDS)
+            raise
+        self.dates: numpy.ndarray = self._parse_dates(dates)
+        self.type_masks: Dict[str, numpy.ndarray] = {}
+        for type_, positions in type_positions.items():
+            mask = numpy.zeros(count, dtype=bool)
+            mask[positions] = True
+            self.type_masks[type_] = mask
+
+    @staticmethod
+    def _parse_dates(dates: List[object]) -> numpy.ndarray:
+        import pandas
+
+        parsed = pandas.to_datetime(pandas.Series(dates, dtype=object), errors="coerce", utc=True)
+        return parsed.dt.tz_localize(None).to_numpy(dtype="datetime64[ns]")
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @typechecked
+    def types_mask(self, types: List[str]) -> numpy.ndarray:
+        mask = numpy.zeros(len(self), dtype=bool)
+        for type_ in types:
+            type_mask = self.type_masks.get(type_)
+            if type_mask is not None:
+                mask |= type_mask
+        return mask
+
+    @typechecked
+    def to_frame(self) -> "pandas.DataFrame":
+        import pandas
+
+        frame = pandas.DataFrame(
+            {
+                "id": self.ids,
+                "name": self.names,
+                "score": self.scores,
+                "nb_rows": pandas.array(self.nb_rows, dtype="Float64").astype("Int64"),
+                "nb_columns": self.nb_columns,
+                "size": pandas.array(self.sizes, dtype="Float64").astype("Int64"),
+                "date": self.dates,
+            },
+        )
+        for type_, type_mask in sorted(self.type_masks.items()):
+            frame[f"is_{type_}"] = type_mask
+        return frame
@@ -0,0 +1,98 @@
+import os
+from http import HTTPStatus
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+import requests
+
+from auctus_search.API.session import AuctusSession
+from auctus_search.helpers.typecheck import typechecked
+
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+
+@typechecked
+def partial_download_path(destination: Path) -> Path:
+    return destination.with_name(destination.name + ".part")
+
+
+def _validator_path(destination: Path) -> Path:
+    return destination.with_name(destination.name + ".part.validator")
+
+
+@typechecked
+def remove_partial_download(destination: Path) -> None:
+    for path in (partial_download_path(destination), _validator_path(destination)):
+        path.unlink(missing_ok=True)
+
+
+def _range_validator(response: requests.Response) -> Optional[str]:
+    # If-Range only accepts strong ETags; fall back to the modification date.
+    etag = response.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.headers.get("Last-Modified")
+
+
+@typechecked
+def stream_download(
+    session: AuctusSession,
+    url: str,
+    destination: Path,
+    *,
+    headers: Optional[Dict[str, str]] = None,
+    chunk_size: int = 1024 * 1024,
+    progress: Optional[ProgressCallback] = None,
+    resume: bool = True,
+) -> requests.Response:
+    partial_path = partial_download_path(destination)
+    validator_path = _validator_path(destination)
+    partial_path.parent.mkdir(parents=True, exist_ok=True)
+    request_headers: Dict[str, str] = dict(headers or {})
+    offset = partial_path.stat().st_size if resume and partial_path.exists() else 0
+    validator = validator_path.read_text() if validator_path.exists() else None
+    if offset and validator:
+        # If-Range makes the server send the whole file if it changed since.
+        request_headers["Range"] = f"bytes={offset}-"
+        request_headers["If-Range"] = validator
+    else:
+        # Without a validator the partial file cannot be trusted.
+        offset = 0
+
+    response = session.get(url, headers=request_headers, stream=True)
+    with response:
+        if response.status_code == HTTPStatus.NOT_MODIFIED:
+            return response
+        if response.status_code == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE and offset:
+            # The partial file is stale or already complete; start over.
+            remove_partial_download(destination)
+            return stream_download(
+                session,
+                url,
+                destination,
+                headers=headers,
+                chunk_size=chunk_size,
+                progress=progress,
+                resume=resume,
+            )
+        response.raise_for_status()
+        if response.status_code != HTTPStatus.PARTIAL_CONTENT:
+            offset = 0
+            validator = _range_validator(response)
+            if validator:
+                validator_path.write_text(validator)
+            else:
+                validator_path.unlink(missing_ok=True)
+
+        content_length = response.headers.get("Content-Length")
+        total_bytes = int(content_length) + offset if content_length else None
+        downloaded_bytes = offset
+        with open(partial_path, "ab" if offset else "wb") as partial_file:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                partial_file.write(chunk)
+                downloaded_bytes += len(chunk)
+                if progress is not None:
+                    progress(downloaded_bytes, total_bytes)
+    os.replace(partial_path, destination)
+    validator_path.unlink(missing_ok=True)
+    return response
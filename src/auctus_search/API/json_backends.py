@@ -0,0 +1,166 @@
+import json
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Union
+
+from auctus_search.API.models import METADATA_FIELDS
+from auctus_search.helpers.typecheck import typechecked
+
+JSONText = Union[str, bytes]
+
+
+@typechecked
+class JSONBackend:
+    """Standard-library decoder. Always decodes every metadata sub-tree."""
+
+    name: str = "json"
+    lazy_decoder: Optional[Callable[[Any], Any]] = None
+
+    @typechecked
+    def loads(self, data: JSONText) -> Any:
+        return json.loads(data)
+
+    @typechecked
+    def dumps(self, data: Any) -> str:
+        return json.dumps(data)
+
+    @typechecked
+    def decode_response(
+        self,
+        body: JSONText,
+        lazy_fields: FrozenSet[str] = frozenset(),  # noqa: ARG002
+    ) -> List[Dict[str, Any]]:
+        return self.loads(body).get("results", [])
+
+    @typechecked
+    def decode_results(
+        self,
+        results: JSONText,
+        lazy_fields: FrozenSet[str] = frozenset(),  # noqa: ARG002
+    ) -> List[Dict[str, Any]]:
+        return self.loads(results)
+
+
+@typechecked
+class OrjsonBackend(JSONBackend):
+    name = "orjson"
+
+    def __init__(self) -> None:
+        try:
+            import orjson
+        except ImportError as error:
+            raise ImportError(
+                "The orjson JSON backend requires orjson. Install it with `pip install auctus-search[fast-json]`.",
+            ) from error
+        self._orjson = orjson
+
+    @typechecked
+    def loads(self, data: JSONText) -> Any:
+        return self._orjson.loads(data)
+
+    @typechecked
+    def dumps(self, data: Any) -> str:
+        return self._orjson.dumps(data).decode("utf-8")
+
+
+@typechecked
+class MsgspecBackend(JSONBackend):
+    """Schema-driven decoder that can leave metadata sub-trees undecoded.
+
+    Fields in ``lazy_fields`` are kept as ``msgspec.Raw`` slices of the
+    response and only decoded by ``lazy_decoder`` when first accessed.
+    Unknown keys are skipped without being materialised.
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        try:
+            import msgspec
+        except ImportError as error:
+            raise ImportError(
+                "The msgspec JSON backend requires msgspec. Install it with `pip install auctus-search[fast-json]`.",
+            ) from error
+        self._msgspec = msgspec
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+        self.lazy_decoder = self._decoder.decode
+        self._schema_decoders: Dict[FrozenSet[str], Dict[str, Any]] = {}
+
+    @typechecked
+    def loads(self, data: JSONText) -> Any:
+        return self._decoder.decode(data)
+
+    @typechecked
+    def dumps(self, data: Any) -> str:
+        return self._encoder.encode(data).decode("utf-8")
+
+    def _decoders(self, lazy_fields: FrozenSet[str]) -> Dict[str, Any]:
+        if lazy_fields in self._schema_decoders:
+            return self._schema_decoders[lazy_fields]
+        msgspec = self._msgspec
+        metadata_type = msgspec.defstruct(
+            "RawMetadata",
+            [(name, msgspec.Raw if name in lazy_fields else Any, msgspec.UNSET) for name, _, _, _ in METADATA_FIELDS],
+        )
+        result_type = msgspec.defstruct(
+            "RawResult",
+            [
+                ("id", Any),
+                ("score", Any, 0.0),
+                ("metadata", metadata_type, msgspec.UNSET),
+            ],
+        )
+        response_type = msgspec.defstruct("RawSearchResponse", [("results", List[result_type], [])])
+        decoders = {
+            "response": msgspec.json.Decoder(response_type),
+            "results": msgspec.json.Decoder(List[result_type]),
+        }
+        self._schema_decoders[lazy_fields] = decoders
+        return decoders
+
+    def _to_dicts(self, results: List[Any]) -> List[Dict[str, Any]]:
+        unset = self._msgspec.UNSET
+        decoded = []
+        for result in results:
+            metadata = {}
+            if result.metadata is not unset:
+                for name, _, _, _ in METADATA_FIELDS:
+                    value = getattr(result.metadata, name)
+                    if value is not unset:
+                        metadata[name] = value
+            decoded.append({"id": result.id, "score": result.score, "metadata": metadata})
+        return decoded
+
+    @typechecked
+    def decode_response(self, body: JSONText, lazy_fields: FrozenSet[str] = frozenset()) -> List[Dict[str, Any]]:
+        response = self._decoders(lazy_fields)["response"].decode(body)
+        return self._to_dicts(response.results)
+
+    @typechecked
+    def decode_results(self, results: JSONText, lazy_fields: FrozenSet[str] = frozenset()) -> List[Dict[str, Any]]:
+        return self._to_dicts(self._decoders(lazy_fields)["results"].decode(results))
+
+
+JSON_BACKENDS: Dict[str, Callable[[], JSONBackend]] = {
+    "json": JSONBackend,
+    "orjson": OrjsonBackend,
+    "msgspec": MsgspecBackend,
+}
+
+
+@typechecked
+def resolve_json_backend(
+    backend: Optional[Union[str, JSONBackend]] = None,
+) -> JSONBackend:
+    if isinstance(backend, JSONBackend):
+        return backend
+    if backend is not None:
+        if backend not in JSON_BACKENDS:
+            raise ValueError(f"Unknown JSON backend '{backend}'. Available backends: {', '.join(JSON_BACKENDS)}.")
+        return JSON_BACKENDS[backend]()
+    # Prefer the partial-decoding backend, then the fastest full decoder.
+    for name in ("msgspec", "orjson"):
+        try:
+            return JSON_BACKENDS[name]()
+        except ImportError:
+            continue
+    return JSONBackend()
@@ -1,12 +1,71 @@
 import dataclasses
+import sys
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    no_type_check,
+)
 
-from beartype import beartype
+from auctus_search.helpers.typecheck import typechecked
 
+# Slotted dataclasses need Python 3.10; older interpreters keep a __dict__.
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
-@beartype
+HEAVY_METADATA_FIELDS: FrozenSet[str] = frozenset(
+    {"columns", "sample", "spatial_coverage", "temporal_coverage"}
+)
+
+
+class LazyField:
+    __slots__ = ("decode", "raw")
+
+    def __init__(self, raw: Any, decode: Optional[Callable[[Any], Any]] = None):
+        self.raw = raw
+        self.decode = decode
+
+    def resolve(self, default: Any) -> Any:
+        value = self.raw if self.decode is None else self.decode(self.raw)
+        return default if value is None else value
+
+
+class _LazySlot:
+    """Resolves a LazyField stored in a dataclass field on first access."""
+
+    def __init__(self, name: str, storage: Any, default_factory: Callable[[], Any]):
+        self.name = name
+        self.storage = storage
+        self.default_factory = default_factory
+
+    def _raw(self, instance: Any) -> Any:
+        if self.storage is None:
+            return instance.__dict__[self.name]
+        return self.storage.__get__(instance, type(instance))
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if instance is None:
+            return self
+        value = self._raw(instance)
+        if isinstance(value, LazyField):
+            value = value.resolve(self.default_factory())
+            self.__set__(instance, value)
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        if self.storage is None:
+            instance.__dict__[self.name] = value
+        else:
+            self.storage.__set__(instance, value)
+
+
+@dataclass(**_SLOTS)
+@typechecked
 class Metadata:
     name: Optional[str] = None
     description: Optional[str] = None
@@ -26,10 +85,83 @@ class Metadata:
     def to_dict(self) -> Dict[str, Any]:
         return dataclasses.asdict(self)
 
+    # Hot path for search responses: skips __init__ and writes the storage
+    # behind each field directly, in an order computed once at import.
+    @classmethod
+    @no_type_check
+    def from_payload(
+        cls,
+        payload: Mapping[str, Any],
+        lazy_fields: FrozenSet[str] = frozenset(),
+        decode: Optional[Callable[[Any], Any]] = None,
+    ) -> "Metadata":
+        metadata = object.__new__(cls)
+        for name, default, default_factory, set_field in METADATA_FIELDS:
+            if name not in payload:
+                value = default if default_factory is None else default_factory()
+            else:
+                value = payload[name]
+                if value is not None and name in lazy_fields:
+                    value = LazyField(value, decode)
+            set_field(metadata, value)
+        return metadata
+
+
+def _wrap_lazy_field(name: str, field_: dataclasses.Field) -> None:
+    storage = Metadata.__dict__.get(name) if _SLOTS else None
+    default_factory = field_.default_factory
+    if default_factory is dataclasses.MISSING:
+        default_factory = lambda: field_.default  # noqa: E731
+    setattr(Metadata, name, _LazySlot(name, storage, default_factory))
+
+
+def _field_setter(name: str) -> Callable[[Any, Any], None]:
+    attribute = Metadata.__dict__.get(name)
+    if isinstance(attribute, _LazySlot):
+        attribute = attribute.storage
+    if attribute is not None and hasattr(attribute, "__set__"):
+        return attribute.__set__
+    return lambda instance, value: instance.__dict__.__setitem__(name, value)
 
-@dataclass
-@beartype
+
+for _field in dataclasses.fields(Metadata):
+    if _field.name in HEAVY_METADATA_FIELDS:
+        _wrap_lazy_field(_field.name, _field)
+
+METADATA_FIELDS: Tuple[
+    Tuple[str, Any, Optional[Callable[[], Any]], Callable[[Any, Any], None]], ...
+] = tuple(
+    (
+        _field.name,
+        None if _field.default is dataclasses.MISSING else _field.default,
+        None
+        if _field.default_factory is dataclasses.MISSING
+        else _field.default_factory,
+        _field_setter(_field.name),
+    )
+    for _field in dataclasses.fields(Metadata)
+)
+
+
+@dataclass(**_SLOTS)
+@typechecked
 class Dataset:
     id: str
     score: float
     metadata: Metadata
+
+    @classmethod
+    @no_type_check
+    def from_result(
+        cls,
+        result: Mapping[str, Any],
+        lazy_fields: FrozenSet[str] = frozenset(),
+        decode: Optional[Callable[[Any], Any]] = None,
+    ) -> "Dataset":
+        return cls(
+            id=result.get("id"),
+            score=result.get("score", 0.0),
+            metadata=Metadata.from_payload(
+                result.get("metadata") or {}, lazy_fields, decode
+            ),
+        )
@@ -0,0 +1,236 @@
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+import numpy
+
+from auctus_search.helpers.typecheck import typechecked
+
+if TYPE_CHECKING:
+    import auctus_search
+
+Coordinate = Union[int, float]
+BoundingBox = Tuple[Coordinate, Coordinate, Coordinate, Coordinate]
+MAX_LATITUDE = 90
+
+
+@typechecked
+def validate_bounding_box(bbox: BoundingBox) -> None:
+    min_longitude, min_latitude, max_longitude, max_latitude = bbox
+    if min_longitude > max_longitude or min_latitude > max_latitude:
+        raise ValueError("bbox must be (min_longitude, min_latitude, max_longitude, max_latitude).")
+    if not -MAX_LATITUDE <= min_latitude <= max_latitude <= MAX_LATITUDE:
+        raise ValueError("Latitudes must be between -90 and 90.")
+
+
+@typechecked
+def temporal_bounds(start: str, end: str) -> Tuple[float, float]:
+    """Unix seconds for ``[start, end)``, ``end`` covering its last unit.
+
+    ``("2019", "2019")`` is the whole of 2019 and ``("2019-01-01",
+    "2019-01-31")`` includes January 31st.
+    """
+    start_time = numpy.datetime64(start)
+    end_time = numpy.datetime64(end)
+    end_time = end_time + numpy.timedelta64(1, numpy.datetime_data(end_time.dtype)[0])
+    if start_time >= end_time:
+        raise ValueError("start must not be after end.")
+    epoch, second = numpy.datetime64(0, "s"), numpy.timedelta64(1, "s")
+    return float((start_time - epoch) / second), float((end_time - epoch) / second)
+
+
+def _iso_timestamp(seconds: float) -> str:
+    return str(numpy.datetime64(int(seconds), "s"))
+
+
+@dataclass(frozen=True)
+class QueryPredicate:
+    name: str
+    args: Tuple[Any, ...]
+    pushed_down: bool
+
+    def describe(self) -> str:
+        value = self.args[0] if len(self.args) == 1 else self.args
+        return f"{self.name}: {value}"
+
+
+@typechecked
+class DatasetQuery:
+    """A search query with filters declared before the request is sent.
+
+    Filters the Auctus search API understands (dataset types, spatial and
+    temporal overlap) are sent with the query, so non-matching datasets are
+    never transferred. The others run client-side on the returned
+    collection, exactly as the ``DatasetCollection.with_*`` filters do.
+    """
+
+    def __init__(
+        self,
+        search_query: Union[str, List[str]],
+        predicates: Tuple[QueryPredicate, ...] = (),
+    ) -> None:
+        if not search_query or (isinstance(search_query, str) and not search_query.strip()):
+            raise ValueError("Search query cannot be empty.")
+        self.search_query: Union[str, List[str]] = search_query
+        self.predicates: Tuple[QueryPredicate, ...] = predicates
+
+    @property
+    def keywords(self) -> List[str]:
+        if isinstance(self.search_query, str):
+            return self.search_query.split()
+        return list(self.search_query)
+
+    @property
+    def pushed_down(self) -> Tuple[QueryPredicate, ...]:
+        return tuple(predicate for predicate in self.predicates if predicate.pushed_down)
+
+    @property
+    def client_side(self) -> Tuple[QueryPredicate, ...]:
+        return tuple(predicate for predicate in self.predicates if not predicate.pushed_down)
+
+    def _with(self, name: str, *args: Any, pushed_down: bool = False) -> "DatasetQuery":
+        predicate = QueryPredicate(name, args, pushed_down)
+        return DatasetQuery(self.search_query, (*self.predicates, predicate))
+
+    @typechecked
+    def with_types(self, types: List[str]) -> "DatasetQuery":
+        # Auctus takes a single "any of these types" list; later calls narrow
+        # the result further, which only the client can do.
+        already_pushed = any(predicate.name == "with_types" for predicate in self.pushed_down)
+        return self._with("with_types", list(types), pushed_down=not already_pushed)
+
+    @typechecked
+    def with_spatial_overlap(self, bbox: BoundingBox) -> "DatasetQuery":
+        validate_bounding_box(bbox)
+        return self._with("with_spatial_overlap", tuple(bbox), pushed_down=True)
+
+    @typechecked
+    def with_temporal_overlap(self, start: str, end: str) -> "DatasetQuery":
+        temporal_bounds(start, end)
+        return self._with("with_temporal_overlap", start, end, pushed_down=True)
+
+    @typechecked
+    def with_number_of_rows_greater_than(self, min_rows: int) -> "DatasetQuery":
+        return self._with("with_number_of_rows_greater_than", min_rows)
+
+    @typechecked
+    def with_number_of_rows_less_than(self, max_rows: int) -> "DatasetQuery":
+        return self._with("with_number_of_rows_less_than", max_rows)
+
+    @typechecked
+    def with_number_of_rows_between(self, min_rows: int, max_rows: int) -> "DatasetQuery":
+        return self._with("with_number_of_rows_between", min_rows, max_rows)
+
+    @typechecked
+    def with_number_of_columns_greater_than(self, min_columns: int) -> "DatasetQuery":
+        return self._with("with_number_of_columns_greater_than", min_columns)
+
+    @typechecked
+    def with_number_of_columns_less_than(self, max_columns: int) -> "DatasetQuery":
+        return self._with("with_number_of_columns_less_than", max_columns)
+
+    @typechecked
+    def with_number_of_columns_between(self, min_columns: int, max_columns: int) -> "DatasetQuery":
+        return self._with("with_number_of_columns_between", min_columns, max_columns)
+
+    @typechecked
+    def with_score_greater_than(self, min_score: Union[int, float]) -> "DatasetQuery":
+        return self._with("with_score_greater_than", min_score)
+
+    @typechecked
+    def with_score_less_than(self, max_score: Union[int, float]) -> "DatasetQuery":
+        return self._with("with_score_less_than", max_score)
+
+    @typechecked
+    def with_score_between(self, min_score: Union[int, float], max_score: Union[int, float]) -> "DatasetQuery":
+        return self._with("with_score_between", min_score, max_score)
+
+    @typechecked
+    def with_column(
+        self,
+        name: Optional[str] = None,
+        structural_type: Optional[str] = None,
+        semantic_type: Optional[str] = None,
+    ) -> "DatasetQuery":
+        if name is None and structural_type is None and semantic_type is None:
+            raise ValueError("Give at least one of name, structural_type or semantic_type.")
+        return self._with("with_column", name, structural_type, semantic_type)
+
+    @typechecked
+    def to_payload(self) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {"keywords": self.keywords}
+        variables: List[Dict[str, Any]] = []
+        for predicate in self.pushed_down:
+            if predicate.name == "with_types":
+                payload["types"] = [type_.lower() for type_ in predicate.args[0]]
+            elif predicate.name == "with_spatial_overlap":
+                min_longitude, min_latitude, max_longitude, max_latitude = predicate.args[0]
+                # Auctus expects the top-left and bottom-right corners.
+                variables.append(
+                    {
+                        "type": "geospatial_variable",
+                        "latitude1": max_latitude,
+                        "longitude1": min_longitude,
+                        "latitude2": min_latitude,
+                        "longitude2": max_longitude,
+                    },
+                )
+            elif predicate.name == "with_temporal_overlap":
+                start, end = temporal_bounds(*predicate.args)
+                # Same period as the collection filter: the last second of
+                # `end`'s unit is the last one included.
+                variables.append(
+                    {
+                        "type": "temporal_variable",
+                        "start": _iso_timestamp(start),
+                        "end": _iso_timestamp(end - 1),
+                    },
+                )
+        if variables:
+            payload["variables"] = variables
+        return payload
+
+    @typechecked
+    def server_filters(self) -> List[str]:
+        return [f"{predicate.describe()} (server)" for predicate in self.pushed_down]
+
+    @typechecked
+    def apply_client_filters(
+        self,
+        collection: "auctus_search.API.collection.DatasetCollection",
+    ) -> "auctus_search.API.collection.DatasetCollection":
+        for predicate in self.client_side:
+            collection = getattr(collection, predicate.name)(*predicate.args)
+        return collection
+
+    @typechecked
+    def apply_all_filters(
+        self,
+        collection: "auctus_search.API.collection.DatasetCollection",
+    ) -> "auctus_search.API.collection.DatasetCollection":
+        # For results Auctus did not filter, such as a local index search.
+        for predicate in self.predicates:
+            collection = getattr(collection, predicate.name)(*predicate.args)
+        return collection
+
+    @typechecked
+    def explain(self) -> str:
+        steps = ["Dataset Query Plan:", f"├── Search Query: {self.search_query}"]
+        for title, predicates in (
+            ("Pushed down to Auctus:", self.pushed_down),
+            ("Applied client-side:", self.client_side),
+        ):
+            steps.append(f"├── {title}")
+            if not predicates:
+                steps.append("│   └── None")
+            for i, predicate in enumerate(predicates):
+                branch = "└──" if i == len(predicates) - 1 else "├──"
+                steps.append(f"│   {branch} {predicate.describe()}")
+        steps.append(f"└── Request: {json.dumps(self.to_payload())}")
+        return "\n".join(steps)
+
+    def __repr__(self) -> str:
+        return f"DatasetQuery({self.search_query!r}, predicates={len(self.predicates)})"
+
+
+SearchQuery = Union[str, List[str], DatasetQuery]
@@ -1,7 +1,17 @@
 from .auctus import AuctusSearch
+from .client import AuctusClient
 from .API import DatasetCollection as AuctusDatasetCollection
+from .API import AuctusSession, DatasetQuery
+from .cache import DatasetCache, SearchCache
+from .index import LocalIndex
 
 __all__ = [
     "AuctusSearch",
+    "AuctusClient",
     "AuctusDatasetCollection",
+    "AuctusSession",
+    "DatasetQuery",
+    "DatasetCache",
+    "SearchCache",
+    "LocalIndex",
 ]
@@ -1,18 +1,41 @@
-from beartype import beartype
+from typing import Optional, Union
+
+from .API import AuctusSession, JSONBackend
+from .cache import DatasetCache, SearchCache
+from .index import LocalIndex
+from .client import AuctusClient
 from .mixins import (
-    AuctusSearchMixin,
-    AuctusSearchLoaderMixin,
+    AuctusSearchWidgetsMixin,
     AuctusSearchDisplayMixin,
     DataProfileViewerMixin,
 )
 
+from auctus_search.helpers.typecheck import typechecked
+
 
-@beartype
+@typechecked
 class AuctusSearch(
-    AuctusSearchMixin,
-    AuctusSearchLoaderMixin,
+    AuctusSearchWidgetsMixin,
     AuctusSearchDisplayMixin,
     DataProfileViewerMixin,
+    AuctusClient,
 ):
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(
+        self,
+        session: Optional[AuctusSession] = None,
+        search_cache: Optional[SearchCache] = None,
+        dataset_cache: Optional[DatasetCache] = None,
+        lazy_metadata: bool = False,
+        json_backend: Optional[Union[str, JSONBackend]] = None,
+        local_index: Optional[LocalIndex] = None,
+    ) -> None:
+        AuctusClient.__init__(
+            self,
+            session=session,
+            search_cache=search_cache,
+            dataset_cache=dataset_cache,
+            lazy_metadata=lazy_metadata,
+            json_backend=json_backend,
+            local_index=local_index,
+        )
+        AuctusSearchWidgetsMixin.__init__(self)
@@ -0,0 +1,8 @@
+from .dataset_cache import DatasetCache, DatasetCacheEntry
+from .search_cache import SearchCache
+
+__all__ = [
+    "DatasetCache",
+    "DatasetCacheEntry",
+    "SearchCache",
+]
@@ -0,0 +1,272 @@
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from auctus_search.helpers.default_cache_directory import default_cache_directory
+from auctus_search.helpers.typecheck import typechecked
+
+
+@dataclass
+@typechecked
+class DatasetCacheEntry:
+    key: str
+    dataset_id: str
+    dataset_format: str
+    version: Optional[str]
+    size: int
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    accessed_at: float = 0.0
+
+
+@typechecked
+class DatasetCache:
+    def __init__(
+        self,
+        directory: Optional[Union[str, Path]] = None,
+        max_bytes: Optional[int] = 5 * 1024**3,
+        revalidate: bool = True,
+    ) -> None:
+        self.directory: Path = Path(directory) if directory is not None else default_cache_directory() / "datasets"
+        self.max_bytes: Optional[int] = max_bytes
+        self.revalidate: bool = revalidate
+        self.hits: int = 0
+        self.misses: int = 0
+        self._lock = threading.RLock()
+        self._download_locks: Dict[str, threading.Lock] = {}
+        # Keys handed out to readers; eviction skips them until released.
+        self._pins: Dict[str, int] = {}
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    @typechecked
+    def make_key(dataset_id: str, dataset_format: str, version: Optional[str] = None) -> str:
+        raw_key = "\0".join([dataset_id, dataset_format, version or ""])
+        return hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
+
+    @typechecked
+    def data_path(self, key: str, dataset_format: str) -> Path:
+        return self.directory / f"{key}.{dataset_format}"
+
+    @staticmethod
+    def _path_key(data_path: Path) -> str:
+        return data_path.name.partition(".")[0]
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _write_entry(self, entry: DatasetCacheEntry) -> None:
+        destination = self._entry_path(entry.key)
+        content = json.dumps(asdict(entry)).encode("utf-8")
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=self.directory,
+            prefix=f".{destination.name}.",
+            suffix=".tmp",
+        )
+        try:
+            with os.fdopen(file_descriptor, "wb") as temporary_file:
+                temporary_file.write(content)
+            os.replace(temporary_path, destination)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.unlink(temporary_path)
+            raise
+
+    def _read_entry(self, key: str) -> Optional[DatasetCacheEntry]:
+        try:
+            with open(self._entry_path(key), encoding="utf-8") as entry_file:
+                entry = DatasetCacheEntry(**json.load(entry_file))
+        except (OSError, ValueError, TypeError):
+            return None
+        if not self.data_path(key, entry.dataset_format).exists():
+            return None
+        return entry
+
+    def _entries(self) -> List[DatasetCacheEntry]:
+        entries = []
+        for entry_path in self.directory.glob("*.json"):
+            entry = self._read_entry(entry_path.stem)
+            if entry is not None:
+                entries.append(entry)
+        return entries
+
+    @typechecked
+    def lookup(
+        self,
+        dataset_id: str,
+        dataset_format: str,
+        version: Optional[str] = None,
+    ) -> Optional[DatasetCacheEntry]:
+        with self._lock:
+            return self._read_entry(self.make_key(dataset_id, dataset_format, version))
+
+    @typechecked
+    def touch(self, entry: DatasetCacheEntry) -> Path:
+        with self._lock:
+            entry.accessed_at = time.time()
+            self._write_entry(entry)
+            self.hits += 1
+            return self.data_path(entry.key, entry.dataset_format)
+
+    @typechecked
+    def pin(self, data_path: Path) -> None:
+        """Keep the entry at ``data_path`` from being evicted until `unpin`."""
+        key = self._path_key(data_path)
+        with self._lock:
+            self._pins[key] = self._pins.get(key, 0) + 1
+
+    @typechecked
+    def unpin(self, data_path: Path) -> None:
+        key = self._path_key(data_path)
+        with self._lock:
+            pins = self._pins.pop(key, 0) - 1
+            if pins > 0:
+                self._pins[key] = pins
+            else:
+                # Stores made while the entry was in use may have overrun.
+                self._evict()
+
+    @typechecked
+    def download_path(self, dataset_id: str, dataset_format: str, version: Optional[str] = None) -> Path:
+        key = self.make_key(dataset_id, dataset_format, version)
+        return self.directory / ".downloads" / f"{key}.{dataset_format}"
+
+    @typechecked
+    def download_lock(self, dataset_id: str, dataset_format: str, version: Optional[str] = None) -> threading.Lock:
+        # Downloads resume from a shared partial file, so one writer per key.
+        key = self.make_key(dataset_id, dataset_format, version)
+        with self._lock:
+            return self._download_locks.setdefault(key, threading.Lock())
+
+    @typechecked
+    def store_file(
+        self,
+        dataset_id: str,
+        dataset_format: str,
+        source: Path,
+        *,
+        version: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> Path:
+        key = self.make_key(dataset_id, dataset_format, version)
+        destination = self.data_path(key, dataset_format)
+        with self._lock:
+            size = source.stat().st_size
+            self._remove_converted(key)
+            os.replace(source, destination)
+            self._write_entry(
+                DatasetCacheEntry(
+                    key=key,
+                    dataset_id=dataset_id,
+                    dataset_format=dataset_format,
+                    version=version,
+                    size=size,
+                    etag=etag,
+                    last_modified=last_modified,
+                    accessed_at=time.time(),
+                ),
+            )
+            self.misses += 1
+            self._evict(keep=key)
+        return destination
+
+    @typechecked
+    def converted_path(self, data_path: Path, converted_format: str) -> Path:
+        return data_path.with_name(f"{data_path.name}.{converted_format}")
+
+    @typechecked
+    def write_converted(
+        self,
+        data_path: Path,
+        converted_format: str,
+        writer: Callable[[Path], None],
+    ) -> Path:
+        destination = self.converted_path(data_path, converted_format)
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=self.directory,
+            prefix=f".{destination.name}.",
+            suffix=".tmp",
+        )
+        os.close(file_descriptor)
+        try:
+            writer(Path(temporary_path))
+            os.replace(temporary_path, destination)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.unlink(temporary_path)
+            raise
+        key = self._path_key(data_path)
+        with self._lock:
+            self._evict(keep=key)
+        return destination
+
+    def _converted_paths(self, key: str) -> List[Path]:
+        return list(self.directory.glob(f"{key}.*.*"))
+
+    def _remove_converted(self, key: str) -> None:
+        for converted_path in self._converted_paths(key):
+            converted_path.unlink()
+
+    def _entry_bytes(self, entry: DatasetCacheEntry) -> int:
+        # Converted copies count against max_bytes along with the download.
+        converted_bytes = 0
+        for converted_path in self._converted_paths(entry.key):
+            with contextlib.suppress(FileNotFoundError):
+                converted_bytes += converted_path.stat().st_size
+        return entry.size + converted_bytes
+
+    def _remove(self, entry: DatasetCacheEntry) -> None:
+        self._remove_converted(entry.key)
+        for path in (
+            self.data_path(entry.key, entry.dataset_format),
+            self._entry_path(entry.key),
+        ):
+            path.unlink(missing_ok=True)
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        if self.max_bytes is None:
+            return
+        entries = sorted(self._entries(), key=lambda entry: entry.accessed_at)
+        entry_bytes = {entry.key: self._entry_bytes(entry) for entry in entries}
+        total_bytes = sum(entry_bytes.values())
+        for entry in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            if entry.key == keep or entry.key in self._pins:
+                continue
+            self._remove(entry)
+            total_bytes -= entry_bytes[entry.key]
+
+    @typechecked
+    def cache_info(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = self._entries()
+            return {
+                "directory": str(self.directory),
+                "entries": len(entries),
+                "bytes": sum(self._entry_bytes(entry) for entry in entries),
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    @typechecked
+    def clear_cache(self, dataset_id: Optional[str] = None) -> int:
+        with self._lock:
+            removed = 0
+            for entry in self._entries():
+                if dataset_id is None or entry.dataset_id == dataset_id:
+                    self._remove(entry)
+                    removed += 1
+            if dataset_id is None:
+                for partial_path in (self.directory / ".downloads").glob("*"):
+                    partial_path.unlink()
+            return removed
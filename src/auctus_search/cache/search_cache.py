@@ -0,0 +1,133 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from auctus_search.helpers.default_cache_directory import default_cache_directory
+from auctus_search.helpers.typecheck import typechecked
+
+
+@typechecked
+class SearchCache:
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        ttl: Optional[Union[int, float]] = 24 * 60 * 60,
+        max_entries: Optional[int] = 10_000,
+    ) -> None:
+        self.path: Path = Path(path) if path is not None else default_cache_directory() / "search_cache.sqlite"
+        self.ttl: Optional[Union[int, float]] = ttl
+        self.max_entries: Optional[int] = max_entries
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS search_results ("
+                "key TEXT PRIMARY KEY, keywords TEXT NOT NULL, results TEXT NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)",
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS search_results_accessed_at ON search_results (accessed_at)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        connection = sqlite3.connect(self.path, timeout=30)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    @staticmethod
+    @typechecked
+    def normalise_keywords(keywords: Union[str, List[str]]) -> str:
+        if isinstance(keywords, str):
+            keywords = keywords.split()
+        return " ".join(sorted(keyword.strip().lower() for keyword in keywords))
+
+    @classmethod
+    @typechecked
+    def make_key(cls, base_url: str, query_payload: Dict[str, Any], page: int, size: int) -> str:
+        normalised_payload = {
+            **query_payload,
+            "keywords": cls.normalise_keywords(query_payload.get("keywords", [])),
+        }
+        raw_key = json.dumps([base_url, normalised_payload, page, size], sort_keys=True, default=str)
+        return hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
+
+    @typechecked
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        results = self.get_raw(key)
+        return None if results is None else json.loads(results)
+
+    @typechecked
+    def get_raw(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock, self._connect() as connection:
+            row = connection.execute("SELECT results, created_at FROM search_results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            results, created_at = row
+            if self.ttl is not None and now - created_at > self.ttl:
+                connection.execute("DELETE FROM search_results WHERE key = ?", (key,))
+                return None
+            connection.execute("UPDATE search_results SET accessed_at = ? WHERE key = ?", (now, key))
+        return results
+
+    @typechecked
+    def set(
+        self,
+        key: str,
+        keywords: Union[str, List[str]],
+        results: List[Dict[str, Any]],
+    ) -> None:
+        self.set_raw(key, keywords, json.dumps(results))
+
+    @typechecked
+    def set_raw(self, key: str, keywords: Union[str, List[str]], results: str) -> None:
+        now = time.time()
+        with self._lock, self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO search_results "
+                "(key, keywords, results, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, self.normalise_keywords(keywords), results, now, now),
+            )
+            if self.max_entries is not None:
+                connection.execute(
+                    "DELETE FROM search_results WHERE key IN ("
+                    "SELECT key FROM search_results ORDER BY accessed_at ASC "
+                    "LIMIT max((SELECT COUNT(*) FROM search_results) - ?, 0))",
+                    (self.max_entries,),
+                )
+
+    @typechecked
+    def invalidate(self, keywords: Optional[Union[str, List[str]]] = None) -> int:
+        with self._lock, self._connect() as connection:
+            if keywords is None:
+                cursor = connection.execute("DELETE FROM search_results")
+            else:
+                cursor = connection.execute(
+                    "DELETE FROM search_results WHERE keywords = ?",
+                    (self.normalise_keywords(keywords),),
+                )
+            return cursor.rowcount
+
+    @typechecked
+    def purge_expired(self) -> int:
+        if self.ttl is None:
+            return 0
+        with self._lock, self._connect() as connection:
+            cursor = connection.execute(
+                "DELETE FROM search_results WHERE created_at < ?",
+                (time.time() - self.ttl,),
+            )
+            return cursor.rowcount
+
+    def __len__(self) -> int:
+        with self._connect() as connection:
+            (count,) = connection.execute("SELECT COUNT(*) FROM search_results").fetchone()
+        return count
@@ -0,0 +1,46 @@
+from typing import Optional, Union
+
+from auctus_search.helpers.typecheck import typechecked
+
+from .API import AuctusSession, JSONBackend
+from .cache import DatasetCache, SearchCache
+from .index import LocalIndex
+from .mixins import (
+    AuctusAsyncSearchMixin,
+    AuctusBulkLoaderMixin,
+    AuctusSearchLoaderMixin,
+    AuctusSearchMixin,
+)
+
+
+@typechecked
+class AuctusClient(
+    AuctusSearchMixin,
+    AuctusAsyncSearchMixin,
+    AuctusSearchLoaderMixin,
+    AuctusBulkLoaderMixin,
+):
+    """Search, filter, cache and load Auctus datasets without any widgets.
+
+    Safe to build in worker threads/processes and services: nothing from
+    ipywidgets, IPython, skrub or DataProfileViewer is imported.
+    """
+
+    def __init__(
+        self,
+        session: Optional[AuctusSession] = None,
+        search_cache: Optional[SearchCache] = None,
+        dataset_cache: Optional[DatasetCache] = None,
+        lazy_metadata: bool = False,
+        json_backend: Optional[Union[str, JSONBackend]] = None,
+        local_index: Optional[LocalIndex] = None,
+    ) -> None:
+        AuctusSearchMixin.__init__(
+            self,
+            session=session,
+            search_cache=search_cache,
+            lazy_metadata=lazy_metadata,
+            json_backend=json_backend,
+            local_index=local_index,
+        )
+        AuctusSearchLoaderMixin.__init__(self, dataset_cache=dataset_cache)
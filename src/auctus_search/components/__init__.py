@@ -1,5 +1,8 @@
+from .card_template import CardTemplate, card_template
 from .dataset_card import AuctusDatasetCard
 
 __all__ = [
     "AuctusDatasetCard",
+    "CardTemplate",
+    "card_template",
 ]
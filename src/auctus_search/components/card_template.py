@@ -0,0 +1,251 @@
+import functools
+import html
+import re
+from datetime import datetime
+from typing import Dict, FrozenSet, Optional, Sequence, Tuple, Union
+
+from millify import millify
+
+from auctus_search.API.models import Dataset
+from auctus_search.helpers.typecheck import typechecked
+
+StyleOverrides = Dict[str, Dict[str, str]]
+
+DEFAULT_CARD_STYLES: StyleOverrides = {
+    "card": {
+        "border-radius": "21px",
+        "box-shadow": "0 4px 10px rgba(0,0,0,0.1)",
+        "padding": "20px",
+        "margin": "10px",
+        "width": "338px",
+        "height": "354px",
+        "background-color": "#ffffff",
+        "display": "flex",
+        "flex-direction": "column",
+        "font-family": "'SF Pro', Arial, sans-serif",
+        "position": "relative",
+        "overflow": "hidden",
+    },
+    "card_number": {
+        "position": "absolute",
+        "top": "14px",
+        "right": "18px",
+        "font-size": "12px",
+        "font-weight": "700",
+        "color": "rgba(0, 0, 0, 0.3)",
+    },
+    "title": {
+        "margin": "0 0 2px 0",
+        "font-size": "24px",
+        "font-weight": "700",
+        "color": "#333",
+    },
+    "source_paragraph": {"font-size": "15px", "color": "#007aff", "margin": "2px 0"},
+    "source_anchor": {"text-decoration": "none", "color": "#007aff"},
+    "date": {"font-size": "12px", "color": "#999", "margin": "2px 0"},
+    "description": {
+        "font-size": "12px",
+        "color": "#666",
+        "margin": "2px 0 0 0",
+        "max-height": "150px",
+        "overflow-y": "scroll",
+        "line-height": "20px",
+        "padding-right": "10px",
+        "text-align": "justify",
+        "word-wrap": "break-word",
+        "width": "100%",
+    },
+    "tag": {
+        "border-radius": "15px",
+        "background-color": "white",
+        "box-shadow": "0px 2px 16px rgba(0, 0, 0, 0.15)",
+        "width": "110px",
+        "height": "55px",
+        "display": "grid",
+        "grid-template-rows": "1fr 2fr 1fr",
+        "justify-items": "center",
+        "align-items": "center",
+        "text-align": "center",
+        "font-weight": "700",
+        "z-index": "10",
+    },
+    "tag_label": {
+        "font-size": "8px",
+        "color": "rgba(0, 0, 0, 0.3)",
+        "margin-bottom": "-10px",
+    },
+    "tag_value": {"font-size": "14px", "color": "#007AFF", "margin": "-10px 0"},
+    "additional_info": {"font-size": "8px", "color": "#007AFF", "margin-top": "-10px"},
+    "relevancy_gauge_container": {
+        "position": "absolute",
+        "bottom": "30px",
+        "left": "50%",
+        "transform": "translateX(-50%)",
+        "width": "72px",
+        "height": "72px",
+        "display": "flex",
+        "justify-content": "center",
+        "align-items": "center",
+        "background": "white",
+        "border-radius": "50%",
+        "box-shadow": "0px 2px 16px rgba(0, 0, 0, 0.15)",
+        "z-index": "10",
+    },
+    "relevancy_label": {
+        "position": "absolute",
+        "bottom": "0px",
+        "left": "50%",
+        "transform": "translateX(-50%)",
+        "font-size": "8px",
+        "font-weight": "700",
+        "color": "rgba(0, 0, 0, 0.3)",
+        "z-index": "10",
+    },
+    "page": {
+        "display": "grid",
+        "grid-template-columns": "repeat(3, max-content)",
+        "justify-content": "center",
+        "padding": "10px",
+    },
+}
+
+_URL_PATTERN = re.compile(r"(https?://[^\s]+)")
+_URL_REPLACEMENT = r'<a href="\1" target="_blank" style="color: #007aff; text-decoration: none;">\1</a>'
+_QUOTES = str.maketrans("", "", "\"'“”")
+
+
+@typechecked
+class CardTemplate:
+    """Dataset card markup with every style string resolved up front.
+
+    Build it through ``card_template`` so one instance is shared per set
+    of style overrides.
+    """
+
+    def __init__(self, style_overrides: Optional[StyleOverrides] = None) -> None:
+        style_overrides = style_overrides or {}
+        self.styles: Dict[str, str] = {
+            component_key: "; ".join(
+                f"{style_property}: {style_value}"
+                for style_property, style_value in {
+                    **default_styles,
+                    **style_overrides.get(component_key, {}),
+                }.items()
+            )
+            for component_key, default_styles in DEFAULT_CARD_STYLES.items()
+        }
+        tag_style = self.styles["tag"]
+        self._left_tag_style = f"position: absolute; bottom: 20px; left: 15px; {tag_style}"
+        self._right_tag_style = f"position: absolute; bottom: 20px; right: 15px; {tag_style}"
+
+    @staticmethod
+    def format_description(description: Optional[str]) -> str:
+        description = " ".join((description or "No description available.").split())
+        # Escape before linkifying, so only the generated anchors are markup.
+        description = html.escape(description.translate(_QUOTES))
+        if "http" not in description:
+            return description
+        return _URL_PATTERN.sub(_URL_REPLACEMENT, description)
+
+    @staticmethod
+    def format_date(date: Optional[str]) -> str:
+        if not date or date == "N/A":
+            return "N/A"
+        try:
+            return datetime.fromisoformat(date.replace("Z", "+00:00")).strftime("%B %d, %Y")
+        except ValueError:
+            return "Invalid date"
+
+    @staticmethod
+    def format_size(dataset_size_value: Union[int, str]) -> str:
+        try:
+            dataset_size_integer: int = int(dataset_size_value)
+        except (ValueError, TypeError):
+            return "N/A"
+        return millify(dataset_size_integer, precision=0)
+
+    def _render_tag(self, container_style: str, label: str, value: str, additional_info: str) -> str:
+        styles = self.styles
+        return f"""
+        <div style="{container_style}">
+            <span style="{styles["tag_label"]}">{label}</span>
+            <span style="{styles["tag_value"]}">{value}</span>
+            <span style="{styles["additional_info"]}">{additional_info}</span>
+        </div>
+        """
+
+    @typechecked(boundary=False)
+    def render_card(self, dataset: Dataset, number: Optional[int] = None) -> str:
+        styles = self.styles
+        metadata = dataset.metadata
+
+        dataset_types = metadata.types or ["Unknown"]
+        lowered_types = [t.lower() for t in dataset_types]
+        primary_type = "Spatial" if "spatial" in lowered_types else dataset_types[0].capitalize()
+        additional_types = [html.escape(t.capitalize()) for t in dataset_types if t.lower() != primary_type.lower()]
+        type_additional_info = (
+            f'<span style="cursor: pointer;" title="{", ".join(additional_types)}">{len(additional_types)} more</span>'
+            if additional_types
+            else ""
+        )
+
+        columns = metadata.columns if isinstance(metadata.columns, list) else []
+        column_names = [html.escape(column.get("name", "Unknown")) for column in columns if isinstance(column, dict)]
+        columns_info = (
+            f'<span style="cursor: pointer;" title="{", ".join(column_names)}">{len(columns)} columns</span>'
+            if column_names
+            else f"{len(columns)} columns"
+        )
+
+        source_url = metadata.source or "#"
+        if not source_url.startswith(("http://", "https://")):
+            source_url = "https://" + source_url
+        source_url = html.escape(source_url)
+        relevancy_score = round(dataset.score, 2)
+        gauge_dash_offset: float = 251 - (relevancy_score / 100) * 251
+        card_number = f'<span style="{styles["card_number"]}">#{number}</span>' if number is not None else ""
+
+        return f"""
+        <div style="{styles["card"]}">
+            {card_number}
+            <h3 style="{styles["title"]}">{html.escape(metadata.name or "Unknown Name")}</h3>
+            <p style="{styles["source_paragraph"]}"><a href="{source_url}" target="_blank" style="{styles["source_anchor"]}">{source_url}</a></p>
+            <p style="{styles["date"]}">Upload date: {self.format_date(metadata.date)}</p>
+            <p style="{styles["description"]}">{self.format_description(metadata.description)}</p>
+            {self._render_tag(self._left_tag_style, "Type", html.escape(primary_type), type_additional_info)}
+            {self._render_tag(self._right_tag_style, "Size", self.format_size(metadata.nb_rows or "N/A"), columns_info)}
+            <div style="{styles["relevancy_gauge_container"]}">
+                <svg width="72" height="72" viewBox="0 0 100 100">
+                    <circle cx="50" cy="50" r="40" stroke="#EEE" stroke-width="10" fill="none"/>
+                    <circle cx="50" cy="50" r="40" stroke="#007AFF" stroke-width="10" fill="none"
+                        stroke-dasharray="251" stroke-dashoffset="{gauge_dash_offset}" transform="rotate(-90,50,50)"/>
+                    <text x="50" y="55" font-size="16" font-weight="bold" text-anchor="middle" fill="#007AFF">
+                        {relevancy_score}%
+                    </text>
+                </svg>
+            </div>
+            <p style="{styles["relevancy_label"]}">Relevancy</p>
+        </div>
+        """
+
+    @typechecked
+    def render_page(self, datasets: Sequence[Dataset], first_number: int = 1) -> str:
+        cards = "".join(
+            self.render_card(dataset, number) for number, dataset in enumerate(datasets, start=first_number)
+        )
+        return f'<div style="{self.styles["page"]}">{cards}</div>'
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_card_template(
+    style_key: FrozenSet[Tuple[str, FrozenSet[Tuple[str, str]]]],
+) -> CardTemplate:
+    return CardTemplate({component_key: dict(styles) for component_key, styles in style_key})
+
+
+@typechecked
+def card_template(style_overrides: Optional[StyleOverrides] = None) -> CardTemplate:
+    style_key = frozenset(
+        (component_key, frozenset(styles.items())) for component_key, styles in (style_overrides or {}).items()
+    )
+    return _cached_card_template(style_key)
@@ -1,5 +1,14 @@
 from .check_dict_keys import check_dict_keys
+from .default_cache_directory import default_cache_directory
+from .ensure_metadata_fields import ensure_metadata_fields
+from .run_coroutine_sync import run_coroutine_sync
+from .typecheck import typecheck_level, typechecked
 
 __all__ = [
     "check_dict_keys",
+    "default_cache_directory",
+    "ensure_metadata_fields",
+    "run_coroutine_sync",
+    "typecheck_level",
+    "typechecked",
 ]
@@ -2,10 +2,10 @@ import functools
 import inspect
 from typing import Callable
 
-from beartype import beartype
+from auctus_search.helpers.typecheck import typechecked
 
 
-@beartype
+@typechecked
 def check_dict_keys(param: str, keys: tuple) -> Callable:
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
@@ -0,0 +1,10 @@
+import os
+from pathlib import Path
+
+from auctus_search.helpers.typecheck import typechecked
+
+
+@typechecked
+def default_cache_directory() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(cache_home) / "auctus_search"
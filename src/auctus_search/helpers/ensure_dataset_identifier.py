@@ -1,10 +1,10 @@
 import functools
 from typing import Callable, Any
 
-from beartype import beartype
+from auctus_search.helpers.typecheck import typechecked
 
 
-@beartype
+@typechecked
 def ensure_dataset_identifier(func: Callable) -> Callable:
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs) -> Any:
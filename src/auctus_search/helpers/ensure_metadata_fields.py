@@ -0,0 +1,16 @@
+from typing import TYPE_CHECKING, AbstractSet
+
+from auctus_search.helpers.typecheck import typechecked
+
+if TYPE_CHECKING:
+    import auctus_search
+
+
+@typechecked(boundary=False)
+def ensure_metadata_fields(dataset: "auctus_search.API.models.Dataset", fields: AbstractSet[str]) -> None:
+    for field in fields:
+        if field == "score":
+            if not hasattr(dataset, "score"):
+                raise ValueError(f"Dataset {dataset.id} is missing 'score'.")
+        elif not hasattr(dataset.metadata, field):
+            raise ValueError(f"Dataset {dataset.id} is missing metadata field '{field}'.")
@@ -1,10 +1,10 @@
 import functools
 from typing import Callable, Any
 
-from beartype import beartype
+from auctus_search.helpers.typecheck import typechecked
 
 
-@beartype
+@typechecked
 def ensure_non_empty_search_query(func: Callable) -> Callable:
     @functools.wraps(func)
     def wrapper(self, search_query, *args, **kwargs) -> Any:
@@ -0,0 +1,16 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Coroutine
+
+from auctus_search.helpers.typecheck import typechecked
+
+
+@typechecked
+def run_coroutine_sync(coroutine: Coroutine) -> Any:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    # Jupyter kernels already run an event loop, so run ours in a worker thread.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
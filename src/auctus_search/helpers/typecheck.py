@@ -0,0 +1,49 @@
+import os
+from typing import Any, Optional
+
+from beartype import beartype
+
+TYPECHECK_ENV_VAR = "AUCTUS_SEARCH_TYPECHECK"
+TYPECHECK_LEVELS = ("full", "boundary", "off")
+
+
+def _resolve_typecheck_level() -> str:
+    level = os.environ.get(TYPECHECK_ENV_VAR, "full").strip().lower()
+    if level not in TYPECHECK_LEVELS:
+        raise ValueError(f"{TYPECHECK_ENV_VAR} must be one of {', '.join(TYPECHECK_LEVELS)}, got '{level}'.")
+    return level
+
+
+# Decorators run at import time, so the level is fixed once per interpreter.
+TYPECHECK_LEVEL = _resolve_typecheck_level()
+
+
+def _is_private(name: str) -> bool:
+    is_dunder = name.startswith("__") and name.endswith("__")
+    return name.startswith("_") and not is_dunder
+
+
+def typechecked(obj: Any = None, *, boundary: Optional[bool] = None) -> Any:
+    """Apply ``beartype`` according to ``AUCTUS_SEARCH_TYPECHECK``.
+
+    ``full`` checks everything, ``off`` nothing. ``boundary`` only checks
+    public callables; pass ``boundary=False`` to mark a public-looking
+    helper that sits on a hot path as internal. Class-level decoration is
+    skipped in ``boundary`` mode, since the methods are decorated one by one.
+    """
+    if obj is None:
+        return lambda decorated: typechecked(decorated, boundary=boundary)
+    if TYPECHECK_LEVEL == "off":
+        return obj
+    if TYPECHECK_LEVEL == "boundary":
+        if isinstance(obj, type):
+            return obj
+        if boundary is None:
+            boundary = not _is_private(getattr(obj, "__name__", ""))
+        if not boundary:
+            return obj
+    return beartype(obj)
+
+
+def typecheck_level() -> str:
+    return TYPECHECK_LEVEL
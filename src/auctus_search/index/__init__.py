@@ -0,0 +1,10 @@
+from .column_index import ColumnIndex
+from .coverage_index import SpatialIndex, TemporalIndex
+from .local_index import LocalIndex
+
+__all__ = [
+    "ColumnIndex",
+    "LocalIndex",
+    "SpatialIndex",
+    "TemporalIndex",
+]
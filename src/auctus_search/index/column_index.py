@@ -0,0 +1,108 @@
+import bisect
+import fnmatch
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from auctus_search.API.models import Dataset
+from auctus_search.helpers.typecheck import typechecked
+
+_WILDCARDS = frozenset("*?[")
+
+
+def _type_keys(type_uri: Any) -> Tuple[str, ...]:
+    # Match "http://schema.org/Text" by its full URI or its last segment.
+    if not isinstance(type_uri, str) or not type_uri:
+        return ()
+    full = type_uri.lower()
+    short = full.rstrip("/").rsplit("/", 1)[-1].rsplit("#", 1)[-1]
+    return (full,) if short == full else (full, short)
+
+
+@typechecked
+class ColumnIndex:
+    """Hash maps from column names and profiler types to dataset columns.
+
+    Every column of every dataset gets an entry number; names and types map
+    to sets of entries, so a query intersects a few sets instead of walking
+    each dataset's ``Metadata.columns``. Names are case-insensitive.
+    """
+
+    def __init__(self, datasets: Iterable[Dataset]) -> None:
+        self.datasets: List[Dataset] = list(datasets)
+        self._entry_dataset: List[int] = []
+        self._entry_column: List[Dict[str, Any]] = []
+        self._by_name: Dict[str, Set[int]] = {}
+        self._by_structural_type: Dict[str, Set[int]] = {}
+        self._by_semantic_type: Dict[str, Set[int]] = {}
+        for position, dataset in enumerate(self.datasets):
+            for column in dataset.metadata.columns:
+                if not isinstance(column, dict):
+                    continue
+                entry = len(self._entry_column)
+                self._entry_dataset.append(position)
+                self._entry_column.append(column)
+                name = str(column.get("name", "")).lower()
+                self._by_name.setdefault(name, set()).add(entry)
+                for key in _type_keys(column.get("structural_type")):
+                    self._by_structural_type.setdefault(key, set()).add(entry)
+                for semantic_type in column.get("semantic_types") or ():
+                    for key in _type_keys(semantic_type):
+                        self._by_semantic_type.setdefault(key, set()).add(entry)
+        self._sorted_names: List[str] = sorted(self._by_name)
+
+    def __len__(self) -> int:
+        return len(self._entry_column)
+
+    def _names_matching(self, pattern: str) -> List[str]:
+        pattern = pattern.lower()
+        if not _WILDCARDS.intersection(pattern):
+            return [pattern] if pattern in self._by_name else []
+        prefix = pattern[:-1]
+        if pattern.endswith("*") and not _WILDCARDS.intersection(prefix):
+            # Prefix query: a range scan over the sorted names.
+            start = bisect.bisect_left(self._sorted_names, prefix)
+            end = bisect.bisect_left(self._sorted_names, prefix + "\U0010ffff")
+            return self._sorted_names[start:end]
+        return fnmatch.filter(self._sorted_names, pattern)
+
+    def _entries(
+        self,
+        name: Optional[str] = None,
+        structural_type: Optional[str] = None,
+        semantic_type: Optional[str] = None,
+    ) -> Set[int]:
+        if name is None and structural_type is None and semantic_type is None:
+            raise ValueError("Give at least one of name, structural_type or semantic_type.")
+        candidates: List[Set[int]] = []
+        if name is not None:
+            entries: Set[int] = set()
+            for matching_name in self._names_matching(name):
+                entries |= self._by_name[matching_name]
+            candidates.append(entries)
+        if structural_type is not None:
+            candidates.append(self._by_structural_type.get(structural_type.lower(), set()))
+        if semantic_type is not None:
+            candidates.append(self._by_semantic_type.get(semantic_type.lower(), set()))
+        candidates.sort(key=len)
+        return candidates[0].intersection(*candidates[1:])
+
+    @typechecked
+    def matching_positions(
+        self,
+        name: Optional[str] = None,
+        structural_type: Optional[str] = None,
+        semantic_type: Optional[str] = None,
+    ) -> Set[int]:
+        """Positions of the datasets with one column meeting every condition."""
+        return {self._entry_dataset[entry] for entry in self._entries(name, structural_type, semantic_type)}
+
+    @typechecked
+    def find_columns(
+        self,
+        name: Optional[str] = None,
+        structural_type: Optional[str] = None,
+        semantic_type: Optional[str] = None,
+    ) -> List[Tuple[Dataset, Dict[str, Any]]]:
+        return [
+            (self.datasets[self._entry_dataset[entry]], self._entry_column[entry])
+            for entry in sorted(self._entries(name, structural_type, semantic_type))
+        ]
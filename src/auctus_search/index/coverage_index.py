@@ -0,0 +1,106 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy
+
+from auctus_search.API.models import Dataset
+from auctus_search.API.query import BoundingBox, temporal_bounds
+from auctus_search.helpers.typecheck import typechecked
+
+_EMPTY_POSITIONS = numpy.empty(0, dtype=numpy.intp)
+
+
+def _envelope_bounds(coverage_range: Dict[str, Any]) -> Optional[BoundingBox]:
+    # Auctus stores envelopes as [[min_lon, max_lat], [max_lon, min_lat]].
+    envelope = coverage_range.get("range", coverage_range)
+    try:
+        (longitude1, latitude1), (longitude2, latitude2) = envelope["coordinates"]
+        return (
+            min(longitude1, longitude2),
+            min(latitude1, latitude2),
+            max(longitude1, longitude2),
+            max(latitude1, latitude2),
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+@typechecked
+class SpatialIndex:
+    """R-tree over the bounding boxes of each dataset's spatial coverage.
+
+    A dataset contributes one box per coverage range, so a query returns the
+    positions of the datasets with at least one box overlapping it.
+    """
+
+    def __init__(self, datasets: Sequence[Dataset]) -> None:
+        boxes: List[BoundingBox] = []
+        positions: List[int] = []
+        for position, dataset in enumerate(datasets):
+            for coverage in dataset.metadata.spatial_coverage:
+                for coverage_range in coverage.get("ranges") or ():
+                    bounds = _envelope_bounds(coverage_range)
+                    if bounds is not None:
+                        boxes.append(bounds)
+                        positions.append(position)
+        self._positions: numpy.ndarray = numpy.asarray(positions, dtype=numpy.intp)
+        self._tree: Any = None
+        if boxes:
+            import shapely
+
+            bounds = numpy.asarray(boxes, dtype=numpy.float64)
+            self._tree = shapely.STRtree(shapely.box(bounds[:, 0], bounds[:, 1], bounds[:, 2], bounds[:, 3]))
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    @typechecked
+    def overlapping_positions(self, bbox: BoundingBox) -> numpy.ndarray:
+        if self._tree is None:
+            return _EMPTY_POSITIONS
+        import shapely
+
+        # Without a predicate the tree compares envelopes, exact for boxes.
+        hits = self._tree.query(shapely.box(*bbox))
+        return numpy.unique(self._positions[hits])
+
+
+@typechecked
+class TemporalIndex:
+    """Temporal coverage intervals, in Unix seconds, sorted by start.
+
+    Intervals starting after the query ends are cut off with a binary
+    search; the remaining prefix is compared against the query start in one
+    vectorised pass.
+    """
+
+    def __init__(self, datasets: Sequence[Dataset]) -> None:
+        starts: List[float] = []
+        ends: List[float] = []
+        positions: List[int] = []
+        for position, dataset in enumerate(datasets):
+            for coverage in dataset.metadata.temporal_coverage:
+                for coverage_range in coverage.get("ranges") or ():
+                    interval = coverage_range.get("range", coverage_range)
+                    start, end = interval.get("gte"), interval.get("lte")
+                    if isinstance(start, (int, float)) and isinstance(end, (int, float)):
+                        starts.append(float(start))
+                        ends.append(float(end))
+                        positions.append(position)
+        order = numpy.argsort(numpy.asarray(starts, dtype=numpy.float64), kind="stable")
+        self._starts: numpy.ndarray = numpy.asarray(starts, dtype=numpy.float64)[order]
+        self._ends: numpy.ndarray = numpy.asarray(ends, dtype=numpy.float64)[order]
+        self._positions: numpy.ndarray = numpy.asarray(positions, dtype=numpy.intp)[order]
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    @staticmethod
+    def query_bounds(start: str, end: str) -> Tuple[float, float]:
+        return temporal_bounds(start, end)
+
+    @typechecked
+    def overlapping_positions(self, start: float, end: float) -> numpy.ndarray:
+        """Positions of datasets with an interval overlapping ``[start, end)``."""
+        candidates = numpy.searchsorted(self._starts, end, side="left")
+        hits = numpy.flatnonzero(self._ends[:candidates] >= start)
+        return numpy.unique(self._positions[hits])
@@ -0,0 +1,195 @@
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from auctus_search.API.models import Dataset
+from auctus_search.helpers.default_cache_directory import default_cache_directory
+from auctus_search.helpers.typecheck import typechecked
+
+
+@typechecked
+class LocalIndex:
+    """Offline keyword search over datasets seen in past searches.
+
+    Records are kept in SQLite with an FTS5 full-text table over the name,
+    description and column names, ranked with BM25. Scores are BM25
+    relevance (higher is better), not Auctus scores. The full-text rows
+    share the integer key of their record, so replacing one is an indexed
+    delete rather than a scan of the full-text table.
+    """
+
+    # BM25 weights for the name, description and columns.
+    FIELD_WEIGHTS = (3.0, 1.0, 2.0)
+
+    def __init__(self, path: Optional[Union[str, Path]] = None) -> None:
+        self.path: Path = Path(path) if path is not None else default_cache_directory() / "local_index.sqlite"
+        self._lock = threading.Lock()
+        self._writer_lock = threading.Lock()
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Future] = []
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS datasets ("
+                "key INTEGER PRIMARY KEY, id TEXT NOT NULL UNIQUE, "
+                "result TEXT NOT NULL, indexed_at REAL NOT NULL)",
+            )
+            try:
+                connection.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS datasets_fts USING fts5("
+                    "name, description, columns, tokenize='porter unicode61')",
+                )
+            except sqlite3.OperationalError as error:
+                raise RuntimeError(
+                    "LocalIndex requires SQLite with the FTS5 extension, which this Python's sqlite3 module lacks.",
+                ) from error
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        connection = sqlite3.connect(self.path, timeout=30)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    @staticmethod
+    @typechecked
+    def match_expression(search_query: Union[str, List[str]]) -> str:
+        if isinstance(search_query, str):
+            search_query = search_query.split()
+        # Quoted terms keep FTS5 operators in user input from being parsed.
+        terms = ['"' + keyword.replace('"', "") + '"' for keyword in search_query if keyword.replace('"', "").strip()]
+        return " OR ".join(terms)
+
+    @staticmethod
+    def _records(
+        datasets: Iterable[Dataset],
+    ) -> List[Tuple[str, str, str, str, str]]:
+        records = []
+        for dataset in datasets:
+            metadata = dataset.metadata.to_dict()
+            column_names = " ".join(
+                str(column.get("name", "")) for column in metadata["columns"] if isinstance(column, dict)
+            )
+            result = json.dumps({"id": dataset.id, "score": dataset.score, "metadata": metadata})
+            records.append(
+                (
+                    dataset.id,
+                    result,
+                    metadata["name"] or "",
+                    metadata["description"] or "",
+                    column_names,
+                ),
+            )
+        return records
+
+    @staticmethod
+    def _write(
+        connection: sqlite3.Connection,
+        records: List[Tuple[str, str, str, str, str]],
+    ) -> None:
+        now = time.time()
+        for dataset_id, result, name, description, column_names in records:
+            # An upsert keeps the record's key, so its full-text row is found
+            # by rowid.
+            connection.execute(
+                "INSERT INTO datasets (id, result, indexed_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET "
+                "result = excluded.result, indexed_at = excluded.indexed_at",
+                (dataset_id, result, now),
+            )
+            (key,) = connection.execute("SELECT key FROM datasets WHERE id = ?", (dataset_id,)).fetchone()
+            connection.execute("DELETE FROM datasets_fts WHERE rowid = ?", (key,))
+            connection.execute(
+                "INSERT INTO datasets_fts (rowid, name, description, columns) VALUES (?, ?, ?, ?)",
+                (key, name, description, column_names),
+            )
+
+    @typechecked
+    def add(self, datasets: Iterable[Dataset]) -> int:
+        records = self._records(datasets)
+        with self._lock, self._connect() as connection:
+            self._write(connection, records)
+        return len(records)
+
+    @typechecked
+    def add_in_background(self, datasets: Iterable[Dataset]) -> Future:
+        """Queue ``add`` on a writer thread, so searches don't wait on disk.
+
+        Writes run one at a time, in order. ``search`` waits for the pending
+        ones first, so it always sees the datasets queued before it.
+        """
+        datasets = list(datasets)
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="auctus-local-index")
+            future = self._writer.submit(self.add, datasets)
+            # Failed writes stay queued until ``flush`` reports them.
+            self._pending = [
+                pending for pending in self._pending if not pending.done() or pending.exception() is not None
+            ] + [future]
+        return future
+
+    @typechecked
+    def flush(self) -> None:
+        """Wait for the writes queued by ``add_in_background``.
+
+        Re-raises the first of them that failed since the previous flush.
+        """
+        with self._writer_lock:
+            pending, self._pending = self._pending, []
+        wait(pending)
+        for future in pending:
+            future.result()
+
+    @typechecked
+    def search(self, search_query: Union[str, List[str]], page: int = 1, size: int = 10) -> List[Dataset]:
+        match_expression = self.match_expression(search_query)
+        if not match_expression:
+            return []
+        self.flush()
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT datasets.result, bm25(datasets_fts, ?, ?, ?) AS rank "
+                "FROM datasets_fts JOIN datasets ON datasets.key = datasets_fts.rowid "
+                "WHERE datasets_fts MATCH ? ORDER BY rank LIMIT ? OFFSET ?",
+                (*self.FIELD_WEIGHTS, match_expression, size, (page - 1) * size),
+            ).fetchall()
+        datasets = []
+        for raw_result, rank in rows:
+            result = json.loads(raw_result)
+            # FTS5 ranks are negated BM25 scores.
+            result["score"] = -rank
+            datasets.append(Dataset.from_result(result))
+        return datasets
+
+    @typechecked
+    def remove(self, dataset_id: str) -> bool:
+        self.flush()
+        with self._lock, self._connect() as connection:
+            row = connection.execute("SELECT key FROM datasets WHERE id = ?", (dataset_id,)).fetchone()
+            if row is None:
+                return False
+            connection.execute("DELETE FROM datasets_fts WHERE rowid = ?", row)
+            connection.execute("DELETE FROM datasets WHERE key = ?", row)
+            return True
+
+    @typechecked
+    def clear(self) -> int:
+        self.flush()
+        with self._lock, self._connect() as connection:
+            connection.execute("DELETE FROM datasets_fts")
+            return connection.execute("DELETE FROM datasets").rowcount
+
+    def __len__(self) -> int:
+        self.flush()
+        with self._connect() as connection:
+            (count,) = connection.execute("SELECT COUNT(*) FROM datasets").fetchone()
+        return count
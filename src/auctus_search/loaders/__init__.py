@@ -0,0 +1,43 @@
+import importlib
+from typing import Any
+
+from .bulk import DatasetLoadResult, parse_dataset_file, read_with_dtype_hints
+from .file_loaders import (
+    ArrowCSVLoader,
+    FeatherLoader,
+    FileLoader,
+    PandasCSVLoader,
+    ParquetLoader,
+)
+from .registry import LoaderRegistry, default_loader_registry
+
+# pandas/numpy/geopandas-backed helpers are only imported on first access.
+_LAZY_ATTRIBUTES = {
+    "dtype_hints_from_profile": ".dtypes",
+    "optimise_dataframe_dtypes": ".dtypes",
+    "to_geodataframe": ".geo",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+    return getattr(module, name)
+
+
+__all__ = [
+    "ArrowCSVLoader",
+    "DatasetLoadResult",
+    "FeatherLoader",
+    "FileLoader",
+    "LoaderRegistry",
+    "PandasCSVLoader",
+    "ParquetLoader",
+    "default_loader_registry",
+    "dtype_hints_from_profile",
+    "optimise_dataframe_dtypes",
+    "parse_dataset_file",
+    "read_with_dtype_hints",
+    "to_geodataframe",
+]
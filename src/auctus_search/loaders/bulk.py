@@ -0,0 +1,68 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+from auctus_search.helpers.typecheck import typechecked
+from auctus_search.loaders.file_loaders import FileLoader
+
+if TYPE_CHECKING:
+    import geopandas
+    import pandas
+
+
+@dataclass
+@typechecked
+class DatasetLoadResult:
+    """Outcome of one dataset in a ``load_datasets`` run.
+
+    Exactly one of ``dataframe`` and ``error`` is set. ``index`` is the
+    dataset's position in the input, since results arrive as they complete.
+    """
+
+    index: int
+    dataset_id: str
+    dataframe: Optional[Union["pandas.DataFrame", "geopandas.GeoDataFrame"]] = None
+    error: Optional[BaseException] = None
+    dtype_optimisation_report: Optional[Dict[str, int]] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@typechecked
+def read_with_dtype_hints(
+    loader: FileLoader,
+    source: Path,
+    columns: Optional[List[str]] = None,
+    dtypes: Optional[Dict[str, str]] = None,
+) -> "pandas.DataFrame":
+    if not dtypes:
+        return loader.load(source, columns)
+    try:
+        return loader.load(source, columns, dtypes)
+    except (ValueError, TypeError):
+        # Profiles are computed on a sample; fall back to inference on mismatch.
+        return loader.load(source, columns)
+
+
+@typechecked
+def parse_dataset_file(
+    loader: FileLoader,
+    source: Path,
+    columns: Optional[List[str]] = None,
+    dtypes: Optional[Dict[str, str]] = None,
+    profile_columns: Optional[List[Dict[str, Any]]] = None,
+    nb_profiled_rows: Optional[int] = None,
+) -> Tuple["pandas.DataFrame", Optional[Dict[str, int]]]:
+    """Parse a downloaded file; module-level so process pools can pickle it.
+
+    ``profile_columns`` enables dtype optimisation from the Auctus profile.
+    """
+    dataframe = read_with_dtype_hints(loader, source, columns, dtypes)
+    if profile_columns is None:
+        return dataframe, None
+    from auctus_search.loaders.dtypes import optimise_dataframe_dtypes
+
+    return optimise_dataframe_dtypes(dataframe, profile_columns, nb_profiled_rows)
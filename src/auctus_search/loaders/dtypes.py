@@ -0,0 +1,113 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy
+import pandas
+
+from auctus_search.helpers.typecheck import typechecked
+
+PANDAS_DTYPES_BY_STRUCTURAL_TYPE: Dict[str, str] = {
+    "http://schema.org/Integer": "Int64",
+    "http://schema.org/Float": "float64",
+    "http://schema.org/Boolean": "boolean",
+    "http://schema.org/Text": "string",
+}
+DATETIME_SEMANTIC_TYPE = "http://schema.org/DateTime"
+ENUMERATION_SEMANTIC_TYPE = "http://schema.org/Enumeration"
+
+
+@typechecked
+def _is_categorical(
+    column: Dict[str, Any],
+    series: pandas.Series,
+    nb_profiled_rows: Optional[int],
+    category_threshold: float,
+) -> bool:
+    if column.get("structural_type") != "http://schema.org/Text":
+        return False
+    if ENUMERATION_SEMANTIC_TYPE in column.get("semantic_types", []):
+        return True
+    num_distinct_values = column.get("num_distinct_values")
+    if num_distinct_values and nb_profiled_rows:
+        # Distinct values are counted on the profiled sample, not the full file.
+        return num_distinct_values / nb_profiled_rows <= category_threshold
+    if len(series) == 0:
+        return False
+    return series.nunique() / len(series) <= category_threshold
+
+
+@typechecked
+def dtype_hints_from_profile(columns: List[Dict[str, Any]]) -> Dict[str, str]:
+    dtype_hints: Dict[str, str] = {}
+    for column in columns:
+        column_name = column.get("name")
+        dtype = PANDAS_DTYPES_BY_STRUCTURAL_TYPE.get(column.get("structural_type", ""))
+        if column_name and dtype:
+            dtype_hints[column_name] = dtype
+    return dtype_hints
+
+
+@typechecked
+def _downcast_integers(series: pandas.Series) -> pandas.Series:
+    numeric = pandas.to_numeric(series, errors="coerce")
+    if numeric.notna().sum() != series.notna().sum():
+        return series
+    if not numeric.isna().any():
+        return pandas.to_numeric(numeric, downcast="integer")
+    minimum, maximum = numeric.min(), numeric.max()
+    for dtype in ("Int8", "Int16", "Int32", "Int64"):
+        bounds = numpy.iinfo(dtype.lower())
+        if bounds.min <= minimum and maximum <= bounds.max:
+            return numeric.astype(dtype)
+    return series
+
+
+@typechecked
+def _downcast_floats(series: pandas.Series) -> pandas.Series:
+    numeric = pandas.to_numeric(series, errors="coerce")
+    if numeric.notna().sum() != series.notna().sum():
+        return series
+    downcast = numeric.astype("float32")
+    # Only keep float32 when it is lossless for every value.
+    round_trips = (downcast.astype("float64") == numeric) | numeric.isna()
+    return downcast if bool(round_trips.all()) else numeric
+
+
+@typechecked
+def _parse_datetimes(series: pandas.Series) -> pandas.Series:
+    parsed = pandas.to_datetime(series, errors="coerce", utc=True)
+    if parsed.notna().sum() != series.notna().sum():
+        return series
+    return parsed
+
+
+@typechecked
+def optimise_dataframe_dtypes(
+    dataframe: pandas.DataFrame,
+    columns: List[Dict[str, Any]],
+    nb_profiled_rows: Optional[int] = None,
+    *,
+    category_threshold: float = 0.05,
+    categorical: bool = True,
+) -> Tuple[pandas.DataFrame, Dict[str, int]]:
+    memory_before = int(dataframe.memory_usage(deep=True).sum())
+    optimised = dataframe.copy(deep=False)
+    for column in columns:
+        column_name = column.get("name")
+        if column_name not in optimised.columns:
+            continue
+        series = optimised[column_name]
+        structural_type = column.get("structural_type")
+        if DATETIME_SEMANTIC_TYPE in column.get("semantic_types", []):
+            optimised[column_name] = _parse_datetimes(series)
+        elif structural_type == "http://schema.org/Integer":
+            optimised[column_name] = _downcast_integers(series)
+        elif structural_type == "http://schema.org/Float":
+            optimised[column_name] = _downcast_floats(series)
+        elif categorical and _is_categorical(column, series, nb_profiled_rows, category_threshold):
+            optimised[column_name] = series.astype("category")
+    memory_after = int(optimised.memory_usage(deep=True).sum())
+    return optimised, {
+        "memory_before": memory_before,
+        "memory_after": memory_after,
+        "memory_saved": memory_before - memory_after,
+    }
@@ -0,0 +1,211 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+
+from auctus_search.helpers.typecheck import typechecked
+
+if TYPE_CHECKING:
+    import pandas
+
+ARROW_TYPES_BY_DTYPE: Dict[str, str] = {
+    "Int64": "int64",
+    "float64": "float64",
+    "boolean": "bool_",
+    "string": "string",
+}
+
+
+@typechecked
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow
+        import pyarrow.csv
+        import pyarrow.feather
+        import pyarrow.parquet
+    except ImportError as error:
+        raise ImportError(
+            "Arrow, Parquet and Feather loading require pyarrow. Install it with `pip install auctus-search[arrow]`.",
+        ) from error
+    return pyarrow
+
+
+@typechecked
+class FileLoader(ABC):
+    engine: str = "default"
+
+    @abstractmethod
+    @typechecked
+    def load(
+        self,
+        source: Path,
+        columns: Optional[List[str]] = None,
+        dtypes: Optional[Dict[str, str]] = None,
+    ) -> "pandas.DataFrame": ...
+
+    @typechecked
+    def iter_chunks(
+        self,
+        source: Path,
+        chunksize: int,
+        columns: Optional[List[str]] = None,
+        dtypes: Optional[Dict[str, str]] = None,
+    ) -> Iterator["pandas.DataFrame"]:
+        raise ValueError(
+            f"{type(self).__name__} does not support chunked loading. Use another engine or load the dataset whole.",
+        )
+
+    @typechecked
+    def write(self, dataframe: "pandas.DataFrame", destination: Path) -> None:
+        raise ValueError(f"{type(self).__name__} cannot write converted copies.")
+
+
+@typechecked
+class PandasCSVLoader(FileLoader):
+    engine = "pandas"
+
+    @typechecked
+    def load(
+        self,
+        source: Path,
+        columns: Optional[List[str]] = None,
+        dtypes: Optional[Dict[str, str]] = None,
+    ) -> "pandas.DataFrame":
+        import pandas
+
+        return pandas.read_csv(source, usecols=columns, dtype=dtypes)
+
+    @typechecked
+    def iter_chunks(
+        self,
+        source: Path,
+        chunksize: int,
+        columns: Optional[List[str]] = None,
+        dtypes: Optional[Dict[str, str]] = None,
+    ) -> Iterator["pandas.DataFrame"]:
+        import pandas
+
+        with pandas.read_csv(source, usecols=columns, dtype=dtypes, chunksize=chunksize) as chunks:
+            yield from chunks
+
+
+@typechecked
+class ArrowCSVLoader(FileLoader):
+    engine = "pyarrow"
+
+    @typechecked
+    def _options(self, columns: Optional[List[str]], dtypes: Optional[Dict[str, str]]) -> Dict[str, Any]:
+        pyarrow = _import_pyarrow()
+        column_types = {
+            column: getattr(pyarrow, ARROW_TYPES_BY_DTYPE[dtype])()
+            for column, dtype in (dtypes or {}).items()
+            if dtype in ARROW_TYPES_BY_DTYPE
+        }
+        return {
+            "read_options": pyarrow.csv.ReadOptions(use_threads=True),
+            "convert_options": pyarrow.csv.ConvertOptions(include_columns=columns, column_types=column_types),
+        }
+
+    @typechecked
+    def load(
+        self,
+        source: Path,
+        columns: Optional[List[str]] = None,
+        dtypes: Optional[Dict[str, str]] = None,
+    ) -> "pandas.DataFrame":
+        pyarrow = _import_pyarrow()
+        table = pyarrow.csv.read_csv(source, **self._options(columns, dtypes))
+        return table.to_pandas()
+
+    @typechecked
+    def iter_chunks(
+        self,
+        source: Path,
+        chunksize: int,
+        columns: Optional[List[str]] = None,
+        dtypes: Optional[Dict[str, str]] = None,
+    ) -> Iterator["pandas.DataFrame"]:
+        pyarrow = _import_pyarrow()
+        pending = []
+        pending_rows = 0
+        with pyarrow.csv.open_csv(source, **self._options(columns, dtypes)) as reader:
+            for batch in reader:
+                pending.append(batch)
+                pending_rows += batch.num_rows
+                while pending_rows >= chunksize:
+                    table = pyarrow.Table.from_batches(pending)
+                    yield table.slice(0, chunksize).to_pandas()
+                    pending = table.slice(chunksize).to_batches()
+                    pending_rows -= chunksize
+        if pending_rows:
+            yield pyarrow.Table.from_batches(pending).to_pandas()
+
+
+@typechecked
+class ParquetLoader(FileLoader):
+    engine = "pyarrow"
+
+    @typechecked
+    def load(
+        self,
+        source: Path,
+        columns: Optional[List[str]] = None,
+        dtypes: Optional[Dict[str, str]] = None,
+    ) -> "pandas.DataFrame":
+        _import_pyarrow()
+        import pandas
+
+        return pandas.read_parquet(source, columns=columns)
+
+    @typechecked
+    def iter_chunks(
+        self,
+        source: Path,
+        chunksize: int,
+        columns: Optional[List[str]] = None,
+        dtypes: Optional[Dict[str, str]] = None,
+    ) -> Iterator["pandas.DataFrame"]:
+        pyarrow = _import_pyarrow()
+        parquet_file = pyarrow.parquet.ParquetFile(source)
+        for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+
+    @typechecked
+    def write(self, dataframe: "pandas.DataFrame", destination: Path) -> None:
+        _import_pyarrow()
+        dataframe.to_parquet(destination, index=False)
+
+
+@typechecked
+class FeatherLoader(FileLoader):
+    engine = "pyarrow"
+
+    @typechecked
+    def load(
+        self,
+        source: Path,
+        columns: Optional[List[str]] = None,
+        dtypes: Optional[Dict[str, str]] = None,
+    ) -> "pandas.DataFrame":
+        _import_pyarrow()
+        import pandas
+
+        return pandas.read_feather(source, columns=columns)
+
+    @typechecked
+    def iter_chunks(
+        self,
+        source: Path,
+        chunksize: int,
+        columns: Optional[List[str]] = None,
+        dtypes: Optional[Dict[str, str]] = None,
+    ) -> Iterator["pandas.DataFrame"]:
+        pyarrow = _import_pyarrow()
+        # Memory-mapped, so only the batch being converted is resident.
+        table = pyarrow.feather.read_table(source, columns=columns, memory_map=True)
+        for batch in table.to_batches(max_chunksize=chunksize):
+            yield batch.to_pandas()
+
+    @typechecked
+    def write(self, dataframe: "pandas.DataFrame", destination: Path) -> None:
+        _import_pyarrow()
+        dataframe.reset_index(drop=True).to_feather(destination)
@@ -0,0 +1,48 @@
+from typing import Any, Dict, List, Optional
+
+import geopandas
+import pandas
+
+from auctus_search.helpers.typecheck import typechecked
+
+GEOMETRY_CRS = "EPSG:4326"
+# Auctus lists the latitude column, then the longitude column.
+LATLONG_COLUMNS = 2
+
+
+@typechecked
+def _point_geometry(dataframe: pandas.DataFrame, coverage: Dict[str, Any]) -> Optional[geopandas.GeoSeries]:
+    coverage_type = coverage.get("type")
+    column_names = coverage.get("column_names") or []
+    if not all(column_name in dataframe.columns for column_name in column_names):
+        return None
+    if coverage_type == "latlong" and len(column_names) == LATLONG_COLUMNS:
+        latitude_column, longitude_column = column_names
+        return geopandas.GeoSeries(
+            geopandas.points_from_xy(
+                pandas.to_numeric(dataframe[longitude_column], errors="coerce"),
+                pandas.to_numeric(dataframe[latitude_column], errors="coerce"),
+            ),
+            index=dataframe.index,
+            crs=GEOMETRY_CRS,
+        )
+    if coverage_type == "point" and len(column_names) == 1:
+        return geopandas.GeoSeries.from_wkt(dataframe[column_names[0]], on_invalid="ignore", crs=GEOMETRY_CRS)
+    return None
+
+
+@typechecked
+def to_geodataframe(
+    dataframe: pandas.DataFrame,
+    spatial_coverage: List[Dict[str, Any]],
+    build_spatial_index: bool = False,
+) -> Optional[geopandas.GeoDataFrame]:
+    for coverage in spatial_coverage:
+        geometry = _point_geometry(dataframe, coverage)
+        if geometry is None:
+            continue
+        geodataframe = geopandas.GeoDataFrame(dataframe, geometry=geometry)
+        if build_spatial_index:
+            _ = geodataframe.sindex
+        return geodataframe
+    return None
@@ -0,0 +1,52 @@
+from typing import Dict, List, Optional
+
+from auctus_search.helpers.typecheck import typechecked
+from auctus_search.loaders.file_loaders import (
+    ArrowCSVLoader,
+    FeatherLoader,
+    FileLoader,
+    PandasCSVLoader,
+    ParquetLoader,
+)
+
+
+@typechecked
+class LoaderRegistry:
+    def __init__(self) -> None:
+        self._loaders: Dict[str, Dict[str, FileLoader]] = {}
+        self._default_engines: Dict[str, str] = {}
+
+    @typechecked
+    def register(self, dataset_format: str, loader: FileLoader, *, default: bool = False) -> None:
+        engines = self._loaders.setdefault(dataset_format, {})
+        engines[loader.engine] = loader
+        if default or dataset_format not in self._default_engines:
+            self._default_engines[dataset_format] = loader.engine
+
+    @typechecked
+    def get(self, dataset_format: str, engine: Optional[str] = None) -> Optional[FileLoader]:
+        engines = self._loaders.get(dataset_format)
+        if engines is None:
+            return None
+        return engines.get(engine or self._default_engines[dataset_format])
+
+    @typechecked
+    def engines(self, dataset_format: str) -> List[str]:
+        return list(self._loaders.get(dataset_format, {}))
+
+    @typechecked
+    def keys(self) -> List[str]:
+        return list(self._loaders)
+
+    def __contains__(self, dataset_format: object) -> bool:
+        return dataset_format in self._loaders
+
+
+@typechecked
+def default_loader_registry() -> LoaderRegistry:
+    registry = LoaderRegistry()
+    registry.register("csv", PandasCSVLoader(), default=True)
+    registry.register("csv", ArrowCSVLoader())
+    registry.register("parquet", ParquetLoader())
+    registry.register("feather", FeatherLoader())
+    return registry
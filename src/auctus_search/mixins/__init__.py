@@ -1,11 +1,17 @@
 from .display import AuctusSearchDisplayMixin
 from .loader import AuctusSearchLoaderMixin
+from .bulk_loader import AuctusBulkLoaderMixin
 from .search import AuctusSearchMixin
+from .async_search import AuctusAsyncSearchMixin
 from .profile import DataProfileViewerMixin
+from .widgets import AuctusSearchWidgetsMixin
 
 __all__ = [
     "AuctusSearchDisplayMixin",
     "AuctusSearchLoaderMixin",
+    "AuctusBulkLoaderMixin",
     "AuctusSearchMixin",
+    "AuctusAsyncSearchMixin",
     "DataProfileViewerMixin",
+    "AuctusSearchWidgetsMixin",
 ]
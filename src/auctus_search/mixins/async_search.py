@@ -0,0 +1,89 @@
+import asyncio
+from typing import Dict, List, Optional, Sequence, Union
+
+from auctus_search.API.collection import DatasetCollection
+from auctus_search.API.models import Dataset
+from auctus_search.API.query import DatasetQuery, SearchQuery
+from auctus_search.helpers.ensure_non_empty_search_query import (
+    ensure_non_empty_search_query,
+)
+from auctus_search.helpers.run_coroutine_sync import run_coroutine_sync
+from auctus_search.helpers.typecheck import typechecked
+from auctus_search.mixins.search import AuctusSearchMixin
+
+
+@typechecked
+class AuctusAsyncSearchMixin:
+    @ensure_non_empty_search_query
+    @typechecked
+    async def asearch_datasets(
+        self: "AuctusSearchMixin",
+        search_query: SearchQuery,
+        page: int = 1,
+        size: int = 10,
+    ) -> DatasetCollection:
+        datasets = await asyncio.to_thread(self._fetch_datasets, search_query, page, size)
+        return self._collection_from_results(search_query, datasets, page, size)
+
+    @typechecked
+    async def asearch_many(
+        self: "AuctusAsyncSearchMixin",
+        search_queries: Sequence[SearchQuery],
+        page: int = 1,
+        size: int = 10,
+        max_concurrency: int = 8,
+        merge: bool = False,
+    ) -> Union[List[DatasetCollection], DatasetCollection]:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded_search(
+            search_query: SearchQuery,
+        ) -> DatasetCollection:
+            async with semaphore:
+                return await self.asearch_datasets(search_query, page, size)
+
+        collections = list(await asyncio.gather(*(bounded_search(search_query) for search_query in search_queries)))
+        if merge:
+            return self._merge_collections(collections, search_queries)
+        return collections
+
+    @typechecked
+    def search_many(
+        self: "AuctusAsyncSearchMixin",
+        search_queries: Sequence[SearchQuery],
+        page: int = 1,
+        size: int = 10,
+        max_concurrency: int = 8,
+        merge: bool = False,
+    ) -> Union[List[DatasetCollection], DatasetCollection]:
+        return run_coroutine_sync(self.asearch_many(search_queries, page, size, max_concurrency, merge))
+
+    @typechecked
+    def _merge_collections(
+        self,
+        collections: List[DatasetCollection],
+        search_queries: Optional[Sequence[SearchQuery]] = None,
+    ) -> DatasetCollection:
+        best_by_id: Dict[str, Dataset] = {}
+        for collection in collections:
+            for dataset in collection.datasets:
+                best = best_by_id.get(dataset.id)
+                if best is None or dataset.score > best.score:
+                    best_by_id[dataset.id] = dataset
+        merged = sorted(best_by_id.values(), key=lambda d: d.score, reverse=True)
+        return DatasetCollection(
+            merged,
+            self,
+            # One entry per query, so their keywords stay apart in preview().
+            search_query=[_query_text(query) for query in search_queries] if search_queries else None,
+        )
+
+
+def _query_text(search_query: SearchQuery) -> str:
+    if isinstance(search_query, DatasetQuery):
+        search_query = search_query.search_query
+    if isinstance(search_query, str):
+        return search_query
+    return " ".join(search_query)
@@ -0,0 +1,169 @@
+import multiprocessing
+import time
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from auctus_search.API.collection import DatasetCollection
+from auctus_search.API.models import Dataset
+from auctus_search.helpers.typecheck import typechecked
+from auctus_search.loaders.bulk import DatasetLoadResult, parse_dataset_file
+from auctus_search.mixins.loader import AuctusSearchLoaderMixin
+
+if TYPE_CHECKING:
+    import geopandas
+    import pandas
+
+
+@typechecked
+class AuctusBulkLoaderMixin:
+    @typechecked
+    def load_datasets(
+        self: "AuctusSearchLoaderMixin",
+        datasets: Union[DatasetCollection, Iterable[Union[Dataset, str]]],
+        max_workers: int = 8,
+        parse_workers: Optional[int] = None,
+        engine: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        use_profile_dtypes: bool = False,
+        columnar_cache: Optional[str] = None,
+        optimise_dtypes: bool = False,
+        as_geodataframe: Optional[bool] = None,
+        build_spatial_index: bool = False,
+    ) -> Iterator[DatasetLoadResult]:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        if parse_workers is not None and parse_workers < 1:
+            raise ValueError("parse_workers must be at least 1.")
+        if parse_workers is not None and columnar_cache is not None:
+            raise ValueError(
+                "columnar_cache cannot be combined with parse_workers; "
+                "converted copies are written by the loading thread.",
+            )
+        load_options: Dict[str, Any] = {
+            "engine": engine,
+            "columns": columns,
+            "use_profile_dtypes": use_profile_dtypes,
+            "optimise_dtypes": optimise_dtypes,
+            "as_geodataframe": as_geodataframe,
+            "build_spatial_index": build_spatial_index,
+        }
+        if parse_workers is None:
+            load_options["columnar_cache"] = columnar_cache
+        # Resolve up front so a bad engine fails the call, not every dataset.
+        self._resolve_file_loader("csv", engine)
+        return self._iter_loaded_datasets(list(datasets), max_workers, parse_workers, load_options)
+
+    def _iter_loaded_datasets(
+        self,
+        datasets: List[Union[Dataset, str]],
+        max_workers: int,
+        parse_workers: Optional[int],
+        load_options: Dict[str, Any],
+    ) -> Iterator[DatasetLoadResult]:
+        parse_pool: Optional[Executor] = None
+        if parse_workers is not None:
+            # Parsers are started from loading threads, where forking is unsafe.
+            start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            parse_pool = ProcessPoolExecutor(
+                max_workers=parse_workers,
+                mp_context=multiprocessing.get_context(start_method),
+            )
+        io_pool = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            pending: List[Future] = [
+                io_pool.submit(self._load_one_of_many, index, dataset, parse_pool, load_options)
+                for index, dataset in enumerate(datasets)
+            ]
+            for future in as_completed(pending):
+                yield future.result()
+        finally:
+            # Stopping iteration early drops the datasets not started yet.
+            io_pool.shutdown(wait=True, cancel_futures=True)
+            if parse_pool is not None:
+                parse_pool.shutdown(wait=True, cancel_futures=True)
+
+    def _load_one_of_many(
+        self: "AuctusSearchLoaderMixin",
+        index: int,
+        dataset: Union[Dataset, str],
+        parse_pool: Optional[Executor],
+        load_options: Dict[str, Any],
+    ) -> DatasetLoadResult:
+        dataset_id = dataset.id if isinstance(dataset, Dataset) else dataset
+        started = time.perf_counter()
+        try:
+            if parse_pool is None:
+                dataframe, dtype_optimisation_report = self._load(dataset, **load_options)
+            else:
+                dataframe, dtype_optimisation_report = self._load_in_process(dataset, parse_pool, **load_options)
+        except Exception as error:  # noqa: BLE001
+            # Any failure belongs to this dataset's result; the others go on.
+            return DatasetLoadResult(
+                index,
+                dataset_id,
+                error=error,
+                elapsed=time.perf_counter() - started,
+            )
+        return DatasetLoadResult(
+            index,
+            dataset_id,
+            dataframe=dataframe,
+            dtype_optimisation_report=dtype_optimisation_report,
+            elapsed=time.perf_counter() - started,
+        )
+
+    def _load_in_process(
+        self: "AuctusSearchLoaderMixin",
+        dataset: Union[Dataset, str],
+        parse_pool: Executor,
+        *,
+        engine: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        use_profile_dtypes: bool = False,
+        optimise_dtypes: bool = False,
+        as_geodataframe: Optional[bool] = None,
+        build_spatial_index: bool = False,
+    ) -> Tuple[Union["pandas.DataFrame", "geopandas.GeoDataFrame"], Optional[Dict[str, int]]]:
+        if isinstance(dataset, Dataset):
+            dataset_identifier, metadata = dataset.id, dataset.metadata
+        else:
+            dataset_identifier, metadata = dataset, None
+        loader = self._resolve_file_loader("csv", engine)
+        dtypes = self._profile_dtype_hints(metadata, columns, use_profile_dtypes or optimise_dtypes)
+        dataset_path = self._download_dataset(
+            dataset_identifier,
+            "csv",
+            metadata.version if metadata is not None else None,
+        )
+        # Only plain, picklable values cross into the parsing process.
+        profile_columns = list(metadata.columns) if optimise_dtypes and metadata is not None else None
+        try:
+            dataframe, dtype_optimisation_report = parse_pool.submit(
+                parse_dataset_file,
+                loader,
+                dataset_path,
+                columns,
+                dtypes,
+                profile_columns,
+                metadata.nb_profiled_rows if metadata is not None else None,
+            ).result()
+        finally:
+            self._release_download(dataset_path)
+        dataframe = self._as_geodataframe(dataframe, metadata, as_geodataframe, build_spatial_index)
+        return dataframe, dtype_optimisation_report
@@ -1,21 +1,35 @@
-from typing import Dict, List, Optional, Union
-
-import geopandas
-import pandas
-from IPython.display import display, HTML
-from skrub import TableReport
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Union
 
+from auctus_search.helpers.typecheck import typechecked
+from auctus_search.mixins.loader import AuctusSearchLoaderMixin
 from auctus_search.mixins.search import AuctusSearchMixin
 
-from beartype import beartype
+if TYPE_CHECKING:
+    import geopandas
+    import pandas
 
 
-@beartype
+@typechecked
 class AuctusSearchDisplayMixin:
-    @beartype
+    @typechecked
+    def load_selected_dataset(
+        self: "AuctusSearchLoaderMixin",
+        display_table: bool = True,
+        **load_options: Any,
+    ) -> Union[
+        "pandas.DataFrame",
+        "geopandas.GeoDataFrame",
+        Iterator[Union["pandas.DataFrame", "geopandas.GeoDataFrame"]],
+    ]:
+        dataset = super().load_selected_dataset(**load_options)
+        if display_table and load_options.get("chunksize") is None:
+            self.interactive_table_display(dataset)
+        return dataset
+
+    @typechecked
     def interactive_table_display(
         self: "AuctusSearchMixin",
-        dataframe: Union[pandas.DataFrame, geopandas.GeoDataFrame],
+        dataframe: "pandas.DataFrame",
         n_rows: int = 10,
         order_by: Optional[Union[str, List[str]]] = None,
         title: Optional[str] = "Table Report",
@@ -23,6 +37,9 @@ class AuctusSearchDisplayMixin:
         verbose: int = 1,
     ) -> None:
         if dataframe is not None and 0 < n_rows < len(dataframe):
+            from IPython.display import HTML, display
+            from skrub import TableReport
+
             report = TableReport(
                 dataframe=dataframe,
                 n_rows=n_rows,
@@ -1,61 +1,521 @@
-from typing import Any, Optional, Union
-import io
-import pandas
-import geopandas
-import requests
-from beartype import beartype
-from auctus_search.API import AuctusAPI
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union
+import os
+import tempfile
+import weakref
+from http import HTTPStatus
+from pathlib import Path
+
+from auctus_search.API import AuctusAPI, Dataset, Metadata
+from auctus_search.API.download import (
+    ProgressCallback,
+    remove_partial_download,
+    stream_download,
+)
+from auctus_search.cache import DatasetCache
+from auctus_search.helpers.typecheck import typechecked
+from auctus_search.loaders import FileLoader, LoaderRegistry, default_loader_registry
+from auctus_search.loaders.bulk import read_with_dtype_hints
 from auctus_search.helpers.ensure_dataset_identifier import ensure_dataset_identifier
-from auctus_search.mixins import AuctusSearchDisplayMixin
 from auctus_search.mixins.search import AuctusSearchMixin
 
+if TYPE_CHECKING:
+    import geopandas
+    import pandas
+
 
-@beartype
+@typechecked
 class AuctusSearchLoaderMixin:
-    FILE_LOADER_FACTORY = {
-        "csv": lambda content: pandas.read_csv(io.BytesIO(content)),
-    }
+    FILE_LOADER_FACTORY: LoaderRegistry = default_loader_registry()
 
-    def __init__(self: "AuctusSearchMixin") -> None:
+    def __init__(
+        self: "AuctusSearchMixin", dataset_cache: Optional[DatasetCache] = None
+    ) -> None:
+        self.dataset_cache: Optional[DatasetCache] = dataset_cache
+        self.dtype_optimisation_report: Optional[Dict[str, int]] = None
         self.current_selected_dataset: Optional[
             Union[pandas.DataFrame, geopandas.GeoDataFrame]
         ] = None
 
-    @beartype
+    @typechecked
+    def load_dataset(
+        self: Union["AuctusSearchLoaderMixin", "AuctusSearchMixin"],
+        dataset: Union[Dataset, str],
+        progress: Optional[ProgressCallback] = None,
+        chunksize: Optional[int] = None,
+        engine: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        use_profile_dtypes: bool = False,
+        columnar_cache: Optional[str] = None,
+        optimise_dtypes: bool = False,
+        as_geodataframe: Optional[bool] = None,
+        build_spatial_index: bool = False,
+    ) -> Union[
+        "pandas.DataFrame",
+        "geopandas.GeoDataFrame",
+        Iterator[Union["pandas.DataFrame", "geopandas.GeoDataFrame"]],
+    ]:
+        loaded_dataset, _ = self._load(
+            dataset,
+            progress=progress,
+            chunksize=chunksize,
+            engine=engine,
+            columns=columns,
+            use_profile_dtypes=use_profile_dtypes,
+            columnar_cache=columnar_cache,
+            optimise_dtypes=optimise_dtypes,
+            as_geodataframe=as_geodataframe,
+            build_spatial_index=build_spatial_index,
+        )
+        return loaded_dataset
+
+    @ensure_dataset_identifier
+    @typechecked
     def load_selected_dataset(
         self: Union["AuctusSearchLoaderMixin", "AuctusSearchMixin"],
-        display_table: bool = True,
-    ) -> Union[pandas.DataFrame, geopandas.GeoDataFrame]:
-        dataset = self._load_dataset(self.selected_dataset_identifier)
-        if dataset is None:
+        progress: Optional[ProgressCallback] = None,
+        chunksize: Optional[int] = None,
+        engine: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        use_profile_dtypes: bool = False,
+        columnar_cache: Optional[str] = None,
+        optimise_dtypes: bool = False,
+        as_geodataframe: Optional[bool] = None,
+        build_spatial_index: bool = False,
+    ) -> Union[
+        "pandas.DataFrame",
+        "geopandas.GeoDataFrame",
+        Iterator[Union["pandas.DataFrame", "geopandas.GeoDataFrame"]],
+    ]:
+        selected_dataset, selected_dataset_identifier = self._selection()
+        if (
+            selected_dataset is None
+            or selected_dataset.id != selected_dataset_identifier
+        ):
+            selected_dataset = selected_dataset_identifier
+        loaded_dataset, dtype_optimisation_report = self._load(
+            selected_dataset,
+            progress=progress,
+            chunksize=chunksize,
+            engine=engine,
+            columns=columns,
+            use_profile_dtypes=use_profile_dtypes,
+            columnar_cache=columnar_cache,
+            optimise_dtypes=optimise_dtypes,
+            as_geodataframe=as_geodataframe,
+            build_spatial_index=build_spatial_index,
+        )
+        if chunksize is None:
+            with self._state_lock:
+                self.current_selected_dataset = loaded_dataset
+                self.dtype_optimisation_report = dtype_optimisation_report
+        return loaded_dataset
+
+    @typechecked
+    def _load(
+        self,
+        dataset: Union[Dataset, Any],
+        chunksize: Optional[int] = None,
+        **load_options: Any,
+    ) -> Tuple[
+        Union[
+            "pandas.DataFrame",
+            "geopandas.GeoDataFrame",
+            Iterator[Union["pandas.DataFrame", "geopandas.GeoDataFrame"]],
+        ],
+        Optional[Dict[str, int]],
+    ]:
+        # Works on locals only, so concurrent loads never see each other's state.
+        if isinstance(dataset, Dataset):
+            dataset_identifier, metadata = dataset.id, dataset.metadata
+        else:
+            dataset_identifier, metadata = dataset, None
+        if chunksize is not None:
+            return (
+                self._load_dataset_chunks(
+                    dataset_identifier, chunksize, metadata=metadata, **load_options
+                ),
+                None,
+            )
+        loaded_dataset, dtype_optimisation_report = self._load_dataset(
+            dataset_identifier, metadata=metadata, **load_options
+        )
+        if loaded_dataset is None:
             raise ValueError(
                 "No dataset loaded! Search & Select then you can load selected dataset."
             )
-        if display_table:
-            self._show_dataset(dataset)
-        return dataset
+        return loaded_dataset, dtype_optimisation_report
 
-    @ensure_dataset_identifier
-    @beartype
+    @typechecked
     def _load_dataset(
-        self, dataset_identifier: Any, dataset_format: str = "csv"
-    ) -> Optional[Union[pandas.DataFrame, geopandas.GeoDataFrame]]:
-        response = requests.get(AuctusAPI.download(dataset_identifier, dataset_format))
-        response.raise_for_status()
+        self,
+        dataset_identifier: Any,
+        dataset_format: str = "csv",
+        dataset_version: Optional[str] = None,
+        metadata: Optional[Metadata] = None,
+        progress: Optional[ProgressCallback] = None,
+        engine: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        use_profile_dtypes: bool = False,
+        columnar_cache: Optional[str] = None,
+        optimise_dtypes: bool = False,
+        as_geodataframe: Optional[bool] = None,
+        build_spatial_index: bool = False,
+    ) -> Tuple[
+        Optional[Union["pandas.DataFrame", "geopandas.GeoDataFrame"]],
+        Optional[Dict[str, int]],
+    ]:
+        loader = self._resolve_file_loader(dataset_format, engine)
+        if metadata is None:
+            metadata = self._selected_dataset_metadata(dataset_identifier)
+        if dataset_version is None and metadata is not None:
+            dataset_version = metadata.version
+        dtypes = self._profile_dtype_hints(
+            metadata, columns, use_profile_dtypes or optimise_dtypes
+        )
+        converted_loader = (
+            self._resolve_columnar_cache(columnar_cache)
+            if columnar_cache is not None
+            else None
+        )
+
+        dataset_path = self._download_dataset(
+            dataset_identifier, dataset_format, dataset_version, progress
+        )
+        try:
+            if converted_loader is None:
+                dataset = read_with_dtype_hints(loader, dataset_path, columns, dtypes)
+            else:
+                dataset = self._load_converted_copy(
+                    loader,
+                    converted_loader,
+                    columnar_cache,
+                    dataset_path,
+                    columns,
+                    dtypes,
+                )
+        finally:
+            self._release_download(dataset_path)
+        dtype_optimisation_report: Optional[Dict[str, int]] = None
+        if optimise_dtypes and metadata is not None:
+            from auctus_search.loaders.dtypes import optimise_dataframe_dtypes
+
+            dataset, dtype_optimisation_report = optimise_dataframe_dtypes(
+                dataset, metadata.columns, metadata.nb_profiled_rows
+            )
+        dataset = self._as_geodataframe(
+            dataset, metadata, as_geodataframe, build_spatial_index
+        )
+        return dataset, dtype_optimisation_report
+
+    @typechecked
+    def _load_dataset_chunks(
+        self,
+        dataset_identifier: Any,
+        chunksize: int,
+        dataset_format: str = "csv",
+        dataset_version: Optional[str] = None,
+        metadata: Optional[Metadata] = None,
+        progress: Optional[ProgressCallback] = None,
+        engine: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        use_profile_dtypes: bool = False,
+        columnar_cache: Optional[str] = None,
+        optimise_dtypes: bool = False,
+        as_geodataframe: Optional[bool] = None,
+        build_spatial_index: bool = False,
+    ) -> Iterator[Union["pandas.DataFrame", "geopandas.GeoDataFrame"]]:
+        if chunksize < 1:
+            raise ValueError("chunksize must be at least 1.")
+        loader = self._resolve_file_loader(dataset_format, engine)
+        if metadata is None:
+            metadata = self._selected_dataset_metadata(dataset_identifier)
+        if dataset_version is None and metadata is not None:
+            dataset_version = metadata.version
+        dtypes = self._profile_dtype_hints(
+            metadata, columns, use_profile_dtypes or optimise_dtypes
+        )
+        converted_loader = (
+            self._resolve_columnar_cache(columnar_cache)
+            if columnar_cache is not None
+            else None
+        )
 
-        loader_func = self.FILE_LOADER_FACTORY.get(dataset_format)
-        if loader_func is None:
+        download_path = dataset_path = self._download_dataset(
+            dataset_identifier, dataset_format, dataset_version, progress
+        )
+        if converted_loader is not None:
+            converted_path = self.dataset_cache.converted_path(
+                dataset_path, columnar_cache
+            )
+            if converted_path.exists():
+                loader, dataset_path, dtypes = converted_loader, converted_path, None
+
+        from auctus_search.loaders.dtypes import optimise_dataframe_dtypes
+
+        def iterate_chunks() -> Iterator[
+            Union["pandas.DataFrame", "geopandas.GeoDataFrame"]
+        ]:
+            try:
+                for raw_chunk in loader.iter_chunks(
+                    dataset_path, chunksize, columns, dtypes
+                ):
+                    chunk = raw_chunk
+                    if optimise_dtypes and metadata is not None:
+                        # Per-chunk categories would not concatenate cleanly.
+                        chunk, _ = optimise_dataframe_dtypes(
+                            raw_chunk,
+                            metadata.columns,
+                            metadata.nb_profiled_rows,
+                            categorical=False,
+                        )
+                    yield self._as_geodataframe(
+                        chunk, metadata, as_geodataframe, build_spatial_index
+                    )
+            finally:
+                release_download()
+
+        chunks = iterate_chunks()
+        # A generator's finally only runs once it is started, so an iterator
+        # that is dropped unconsumed releases the download when collected.
+        release_download = weakref.finalize(
+            chunks, self._release_download, download_path
+        )
+        return chunks
+
+    @typechecked
+    def _resolve_file_loader(
+        self, dataset_format: str, engine: Optional[str] = None
+    ) -> FileLoader:
+        if dataset_format not in self.FILE_LOADER_FACTORY:
             raise ValueError(
                 f"Unsupported format '{dataset_format}'. "
-                f"Supported formats: {list(self.FILE_LOADER_FACTORY.keys())}"
+                f"Supported formats: {self.FILE_LOADER_FACTORY.keys()}"
+            )
+        loader = self.FILE_LOADER_FACTORY.get(dataset_format, engine)
+        if loader is None:
+            raise ValueError(
+                f"Unsupported engine '{engine}' for format '{dataset_format}'. "
+                f"Supported engines: {self.FILE_LOADER_FACTORY.engines(dataset_format)}"
             )
+        return loader
 
-        self.current_selected_dataset = loader_func(response.content)
-        return self.current_selected_dataset
+    @typechecked
+    def _resolve_columnar_cache(self, columnar_cache: str) -> FileLoader:
+        if self.dataset_cache is None:
+            raise ValueError(
+                "columnar_cache requires a dataset cache. "
+                "Use AuctusSearch(dataset_cache=DatasetCache())."
+            )
+        if columnar_cache not in ("parquet", "feather"):
+            raise ValueError(
+                f"Unsupported columnar_cache '{columnar_cache}'. "
+                "Supported formats: ['parquet', 'feather']"
+            )
+        return self._resolve_file_loader(columnar_cache)
 
-    @beartype
-    def _show_dataset(
-        self: "AuctusSearchDisplayMixin",
-        dataset: Union[pandas.DataFrame, geopandas.GeoDataFrame],
-    ) -> None:
-        self.interactive_table_display(dataset)
+    @typechecked
+    def _load_converted_copy(
+        self,
+        loader: FileLoader,
+        converted_loader: FileLoader,
+        columnar_cache: str,
+        dataset_path: Path,
+        columns: Optional[List[str]],
+        dtypes: Optional[Dict[str, str]],
+    ) -> "pandas.DataFrame":
+        converted_path = self.dataset_cache.converted_path(dataset_path, columnar_cache)
+        if converted_path.exists():
+            return converted_loader.load(converted_path, columns)
+
+        # The converted copy holds every column so later projections can reuse it.
+        dataset = read_with_dtype_hints(loader, dataset_path, None, dtypes)
+        self.dataset_cache.write_converted(
+            dataset_path,
+            columnar_cache,
+            lambda destination: converted_loader.write(dataset, destination),
+        )
+        return dataset[columns] if columns is not None else dataset
+
+    @typechecked
+    def _as_geodataframe(
+        self,
+        dataset: "pandas.DataFrame",
+        metadata: Optional[Metadata],
+        as_geodataframe: Optional[bool],
+        build_spatial_index: bool,
+    ) -> Union["pandas.DataFrame", "geopandas.GeoDataFrame"]:
+        if as_geodataframe is False:
+            return dataset
+        is_spatial = metadata is not None and (
+            "spatial" in metadata.types or bool(metadata.spatial_coverage)
+        )
+        if not is_spatial and as_geodataframe is None:
+            return dataset
+        import geopandas
+
+        from auctus_search.loaders.geo import to_geodataframe
+
+        if isinstance(dataset, geopandas.GeoDataFrame):
+            return dataset
+        geodataframe = (
+            to_geodataframe(dataset, metadata.spatial_coverage, build_spatial_index)
+            if is_spatial
+            else None
+        )
+        if geodataframe is not None:
+            return geodataframe
+        if as_geodataframe:
+            raise ValueError(
+                "Cannot build a GeoDataFrame: no latitude/longitude or point columns "
+                "found in the dataset's spatial coverage."
+            )
+        return dataset
+
+    @typechecked
+    def _profile_dtype_hints(
+        self,
+        metadata: Optional[Metadata],
+        columns: Optional[List[str]],
+        use_profile_dtypes: bool,
+    ) -> Optional[Dict[str, str]]:
+        if not use_profile_dtypes or metadata is None:
+            return None
+        from auctus_search.loaders.dtypes import dtype_hints_from_profile
+
+        dtypes = dtype_hints_from_profile(metadata.columns)
+        if columns is not None:
+            dtypes = {
+                column: dtype for column, dtype in dtypes.items() if column in columns
+            }
+        return dtypes
+
+    @typechecked
+    def _download_dataset(
+        self,
+        dataset_identifier: Any,
+        dataset_format: str,
+        dataset_version: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Path:
+        download_url = AuctusAPI.download(dataset_identifier, dataset_format)
+        dataset_id = str(dataset_identifier)
+        download_key = DatasetCache.make_key(dataset_id, dataset_format, dataset_version)
+        if self.dataset_cache is None:
+            return self._download_temporary_file(
+                download_url, download_key, dataset_format, progress
+            )
+
+        data_path = self.dataset_cache.data_path(download_key, dataset_format)
+        # Pinned until released, so eviction never removes a file being read.
+        self.dataset_cache.pin(data_path)
+        try:
+            return self._download_cached_file(
+                download_url, dataset_id, dataset_format, dataset_version, progress
+            )
+        except BaseException:
+            self.dataset_cache.unpin(data_path)
+            raise
+
+    @typechecked
+    def _download_cached_file(
+        self,
+        download_url: str,
+        dataset_id: str,
+        dataset_format: str,
+        dataset_version: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Path:
+        with self.dataset_cache.download_lock(
+            dataset_id, dataset_format, dataset_version
+        ):
+            cached_entry = self.dataset_cache.lookup(
+                dataset_id, dataset_format, dataset_version
+            )
+            if cached_entry is not None and not self.dataset_cache.revalidate:
+                return self.dataset_cache.touch(cached_entry)
+
+            headers: Dict[str, str] = {}
+            if cached_entry is not None:
+                if cached_entry.etag:
+                    headers["If-None-Match"] = cached_entry.etag
+                if cached_entry.last_modified:
+                    headers["If-Modified-Since"] = cached_entry.last_modified
+            destination = self.dataset_cache.download_path(
+                dataset_id, dataset_format, dataset_version
+            )
+            response = stream_download(
+                self.session,
+                download_url,
+                destination,
+                headers=headers,
+                progress=progress,
+            )
+            if cached_entry is not None and response.status_code == HTTPStatus.NOT_MODIFIED:
+                return self.dataset_cache.touch(cached_entry)
+            return self.dataset_cache.store_file(
+                dataset_id,
+                dataset_format,
+                destination,
+                version=dataset_version,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+
+    @typechecked
+    def _release_download(self, dataset_path: Path) -> None:
+        # Uncached downloads belong to the caller; cached ones are unpinned.
+        if self.dataset_cache is None:
+            dataset_path.unlink(missing_ok=True)
+        else:
+            self.dataset_cache.unpin(dataset_path)
+
+    @typechecked
+    def _download_temporary_file(
+        self,
+        download_url: str,
+        download_key: str,
+        dataset_format: str,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Path:
+        download_directory = Path(tempfile.gettempdir()) / "auctus_search"
+        download_directory.mkdir(parents=True, exist_ok=True)
+        # Unique per call so concurrent workers, threads or processes, never
+        # share a partial file.
+        file_descriptor, temporary_name = tempfile.mkstemp(
+            prefix=f"{download_key}-",
+            suffix=f".{dataset_format}",
+            dir=download_directory,
+        )
+        os.close(file_descriptor)
+        destination = Path(temporary_name)
+        try:
+            stream_download(self.session, download_url, destination, progress=progress)
+        except BaseException:
+            # Nothing can resume from a per-call name, so leave nothing behind.
+            destination.unlink(missing_ok=True)
+            remove_partial_download(destination)
+            raise
+        return destination
+
+    @typechecked
+    def _selected_dataset_metadata(self, dataset_identifier: Any) -> Optional[Metadata]:
+        selected_dataset, _ = self._selection()
+        if selected_dataset is not None and selected_dataset.id == dataset_identifier:
+            return selected_dataset.metadata
+        return None
+
+    @typechecked
+    def cache_info(self) -> Dict[str, Any]:
+        if self.dataset_cache is None:
+            raise ValueError(
+                "No dataset cache configured. Use AuctusSearch(dataset_cache=DatasetCache())."
+            )
+        return self.dataset_cache.cache_info()
+
+    @typechecked
+    def clear_cache(self, dataset_id: Optional[str] = None) -> int:
+        if self.dataset_cache is None:
+            raise ValueError(
+                "No dataset cache configured. Use AuctusSearch(dataset_cache=DatasetCache())."
+            )
+        return self.dataset_cache.clear_cache(dataset_id)
@@ -1,16 +1,16 @@
-from beartype import beartype
-from DataProfileViewer import plot_data_summary
-
 from auctus_search.helpers.ensure_dataset_identifier import ensure_dataset_identifier
+from auctus_search.helpers.typecheck import typechecked
 from auctus_search.mixins.search import AuctusSearchMixin
 
 
-@beartype
+@typechecked
 class DataProfileViewerMixin:
     @ensure_dataset_identifier
-    @beartype
+    @typechecked
     def profile_selected_dataset(self: "AuctusSearchMixin") -> None:
         if not self.selected_dataset.metadata:
             raise ValueError("No metadata found. Please load a dataset first.")
 
+        from DataProfileViewer import plot_data_summary
+
         plot_data_summary(self.selected_dataset.metadata.to_dict())
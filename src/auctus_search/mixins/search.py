@@ -1,121 +1,230 @@
-from auctus_search.API.collection import DatasetCollection
-from auctus_search.API.models import Dataset, Metadata
-import dataclasses
+from auctus_search.API.collection import DatasetCollection, SearchContext
+from auctus_search.API.models import HEAVY_METADATA_FIELDS, Dataset
 import json
-from typing import Any, Dict, List, Optional, Union
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
 
-import ipywidgets as widgets
-import requests
-from IPython.display import clear_output, display
-from ipywidgets import GridspecLayout, Output
-
-from auctus_search.API import AuctusAPI
-from auctus_search.components import AuctusDatasetCard
+from auctus_search.API import AuctusAPI, AuctusSession
+from auctus_search.API.json_backends import JSONBackend, resolve_json_backend
+from auctus_search.API.query import DatasetQuery, SearchQuery
+from auctus_search.cache import SearchCache
+from auctus_search.index import LocalIndex
 from auctus_search.helpers.ensure_non_empty_search_query import (
     ensure_non_empty_search_query,
 )
-
-from beartype import beartype
+from auctus_search.helpers.typecheck import typechecked
 
 
-@beartype
+@typechecked
 class AuctusSearchMixin:
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        session: Optional[AuctusSession] = None,
+        search_cache: Optional[SearchCache] = None,
+        lazy_metadata: bool = False,
+        json_backend: Optional[Union[str, JSONBackend]] = None,
+        local_index: Optional[LocalIndex] = None,
+    ) -> None:
+        self.session: AuctusSession = (
+            session if session is not None else AuctusSession()
+        )
+        self.search_cache: Optional[SearchCache] = search_cache
+        self.lazy_metadata: bool = lazy_metadata
+        self.json_backend: JSONBackend = resolve_json_backend(json_backend)
+        self.local_index: Optional[LocalIndex] = local_index
+        # Guards the shared selection state; searches and loads never need it.
+        self._state_lock = threading.RLock()
         self.selected_dataset: Optional[Dataset] = None
         self.selected_dataset_identifier: Optional[Any] = None
         self.selected_dataset_name: Optional[str] = None
-        self.selection_label_widget: widgets.Label = widgets.Label(
-            value="", layout=widgets.Layout(margin="10px 0")
-        )
-        self.selection_label_widget.style.font_size = "20px"
-        self.output_area_widget: Output = Output()
         self.search_query: Optional[Union[str, List[str]]] = None
 
     @ensure_non_empty_search_query
-    @beartype
+    @typechecked
     def search_datasets(
         self,
-        search_query: Union[str, List[str]],
+        search_query: SearchQuery,
         page: int = 1,
         size: int = 10,
-        display_initial_results: bool = False,
     ) -> DatasetCollection:
-        self._clear_selected_dataset_label()
-        self.search_query = search_query
+        datasets = self._fetch_datasets(search_query, page, size)
+        collection = self._collection_from_results(search_query, datasets, page, size)
+        with self._state_lock:
+            self.search_query = collection.search_query
+        return collection
+
+    @ensure_non_empty_search_query
+    @typechecked
+    def iter_search_results(
+        self,
+        search_query: SearchQuery,
+        page_size: int = 100,
+        max_pages: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> Iterator[Dataset]:
+        # Validated here, not in the generator, so bad arguments fail at the call.
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1.")
+        if max_pages is not None and max_pages < 1:
+            raise ValueError("max_pages must be at least 1.")
+        return self._iter_search_pages(search_query, page_size, max_pages, prefetch)
+
+    def _iter_search_pages(
+        self,
+        search_query: SearchQuery,
+        page_size: int,
+        max_pages: Optional[int],
+        prefetch: bool,
+    ) -> Iterator[Dataset]:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            page = 1
+            pending: Future = executor.submit(
+                self._fetch_datasets, search_query, page, page_size
+            )
+            while True:
+                datasets = pending.result()
+                is_last_page = len(datasets) < page_size or (
+                    max_pages is not None and page >= max_pages
+                )
+                if not is_last_page:
+                    page += 1
+                    if prefetch:
+                        pending = executor.submit(
+                            self._fetch_datasets, search_query, page, page_size
+                        )
+                if isinstance(search_query, DatasetQuery):
+                    datasets = search_query.apply_client_filters(
+                        DatasetCollection(datasets, self)
+                    ).datasets
+                yield from datasets
+                if is_last_page:
+                    return
+                if not prefetch:
+                    pending = executor.submit(
+                        self._fetch_datasets, search_query, page, page_size
+                    )
 
-        query_payload: Dict[str, Any] = (
-            {"keywords": search_query.split()}
-            if isinstance(search_query, str)
-            else {"keywords": search_query}
+    @ensure_non_empty_search_query
+    @typechecked
+    def search_local(
+        self,
+        search_query: SearchQuery,
+        page: int = 1,
+        size: int = 10,
+    ) -> DatasetCollection:
+        if self.local_index is None:
+            raise ValueError(
+                "No local index configured. Use AuctusSearch(local_index=LocalIndex())."
+            )
+        if isinstance(search_query, DatasetQuery):
+            datasets = self.local_index.search(search_query.search_query, page, size)
+            collection = DatasetCollection(
+                datasets,
+                self,
+                context=SearchContext.from_query(search_query.search_query, page, size),
+            )
+            # Nothing was filtered server-side, so every predicate runs here.
+            return search_query.apply_all_filters(collection)
+        datasets = self.local_index.search(search_query, page, size)
+        return DatasetCollection(
+            datasets, self, context=SearchContext.from_query(search_query, page, size)
         )
-        response: requests.Response = requests.post(
-            AuctusAPI.search(),
+
+    @typechecked
+    def _fetch_datasets(
+        self, search_query: SearchQuery, page: int = 1, size: int = 10
+    ) -> List[Dataset]:
+        if isinstance(search_query, DatasetQuery):
+            query_payload: Dict[str, Any] = search_query.to_payload()
+        elif isinstance(search_query, str):
+            query_payload = {"keywords": search_query.split()}
+        else:
+            query_payload = {"keywords": search_query}
+        raw_results = self._request_search_results(query_payload, page, size)
+        decode = self.json_backend.lazy_decoder
+        datasets = [
+            Dataset.from_result(result, self._lazy_metadata_fields(), decode)
+            for result in raw_results
+        ]
+        if self.local_index is not None:
+            self.local_index.add_in_background(datasets)
+        return datasets
+
+    @typechecked
+    def _collection_from_results(
+        self,
+        search_query: SearchQuery,
+        datasets: List[Dataset],
+        page: int,
+        size: int,
+    ) -> DatasetCollection:
+        if not isinstance(search_query, DatasetQuery):
+            return DatasetCollection(
+                datasets,
+                self,
+                context=SearchContext.from_query(search_query, page, size),
+            )
+        collection = DatasetCollection(
+            datasets,
+            self,
+            filters=search_query.server_filters(),
+            context=SearchContext.from_query(search_query.search_query, page, size),
+        )
+        return search_query.apply_client_filters(collection)
+
+    @typechecked
+    def _lazy_metadata_fields(self) -> FrozenSet[str]:
+        return HEAVY_METADATA_FIELDS if self.lazy_metadata else frozenset()
+
+    @typechecked
+    def _request_search_results(
+        self, query_payload: Dict[str, Any], page: int, size: int
+    ) -> List[Dict[str, Any]]:
+        search_url = AuctusAPI.search()
+        cache_key: Optional[str] = None
+        if self.search_cache is not None:
+            cache_key = self.search_cache.make_key(
+                search_url, query_payload, page, size
+            )
+            cached_results = self.search_cache.get_raw(cache_key)
+            if cached_results is not None:
+                return self.json_backend.decode_results(
+                    cached_results, self._lazy_metadata_fields()
+                )
+
+        response = self.session.post(
+            search_url,
             params={"page": page, "size": size},
             data={"query": json.dumps(query_payload)},
         )
         response.raise_for_status()
-        raw_results: List[Dict[str, Any]] = response.json().get("results", [])
-        datasets = []
-        for result in raw_results:
-            metadata_dict = result.get("metadata", {})
-            metadata_fields = {
-                field.name: metadata_dict.get(field.name)
-                for field in dataclasses.fields(Metadata)
-            }
-            metadata = Metadata(**metadata_fields)
-            dataset = Dataset(
-                id=result.get("id"), score=result.get("score", 0.0), metadata=metadata
+        raw_results = self.json_backend.decode_response(
+            response.content, self._lazy_metadata_fields()
+        )
+        if cache_key is not None:
+            self.search_cache.set_raw(
+                cache_key,
+                query_payload.get("keywords", []),
+                self.json_backend.dumps(raw_results),
             )
-            datasets.append(dataset)
-        datasets_collection = DatasetCollection(datasets, self)
-        if display_initial_results:
-            self._render_results(datasets_collection.datasets)
-        return datasets_collection
+        return raw_results
 
-    @beartype
-    def _clear_selected_dataset_label(self) -> None:
-        self.selected_dataset = None
-        self.selected_dataset_identifier = None
-        self.selected_dataset_name = None
-        self.selection_label_widget.value = ""
+    @typechecked
+    def select_dataset(self, dataset: Dataset) -> None:
+        with self._state_lock:
+            self.selected_dataset = dataset
+            self.selected_dataset_identifier = dataset.id
+            self.selected_dataset_name = dataset.metadata.name or "Unknown Name"
 
-    @beartype
-    def _set_selected_dataset_callback(self, dataset: Dataset) -> None:
-        self.selected_dataset = dataset
-        self.selected_dataset_identifier = dataset.id
-        self.selected_dataset_name = dataset.metadata.name or "Unknown Name"
-        self.selection_label_widget.value = (
-            f"⏭️Selected Dataset: {self.selected_dataset_name}"
-        )
-
-    @beartype
-    def _render_results(self, dataset_results: List[Dataset]) -> None:
-        with self.output_area_widget:
-            clear_output(wait=True)
-            display(self.selection_label_widget)
-            if dataset_results:
-                dataset_cards: List[widgets.Widget] = [
-                    AuctusDatasetCard(
-                        dataset_result,
-                        select_callback_function=self._set_selected_dataset_callback,
-                    ).render()
-                    for dataset_result in dataset_results
-                ]
-                dataset_grid: GridspecLayout = GridspecLayout(
-                    (len(dataset_cards) // 3) + (len(dataset_cards) % 3 > 0), 3
-                )
-                for index, dataset_card in enumerate(dataset_cards):
-                    dataset_grid[index // 3, index % 3] = dataset_card
+    @typechecked
+    def _clear_selected_dataset(self) -> None:
+        with self._state_lock:
+            self.selected_dataset = None
+            self.selected_dataset_identifier = None
+            self.selected_dataset_name = None
 
-                centered_grid = widgets.HBox(
-                    [dataset_grid],
-                    layout=widgets.Layout(
-                        justify_content="center",
-                        padding="10px",
-                        width="100%",
-                    ),
-                )
-                display(centered_grid)
-            else:
-                display(widgets.HTML("<h3>No datasets found.</h3>"))
-        display(self.output_area_widget)
+    @typechecked
+    def _selection(self) -> Tuple[Optional[Dataset], Optional[Any]]:
+        with self._state_lock:
+            return self.selected_dataset, self.selected_dataset_identifier
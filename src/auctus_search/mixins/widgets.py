@@ -0,0 +1,161 @@
+import math
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from auctus_search.API.collection import DatasetCollection
+from auctus_search.API.models import Dataset
+from auctus_search.API.query import SearchQuery
+from auctus_search.helpers.ensure_non_empty_search_query import (
+    ensure_non_empty_search_query,
+)
+from auctus_search.helpers.typecheck import typechecked
+from auctus_search.mixins.search import AuctusSearchMixin
+
+if TYPE_CHECKING:
+    import ipywidgets
+
+
+@typechecked
+class AuctusSearchWidgetsMixin:
+    RESULTS_PER_PAGE: int = 12
+
+    def __init__(self) -> None:
+        # Widgets are built on first display so headless use never imports them.
+        self._selection_label_widget: Optional[ipywidgets.Label] = None
+        self._output_area_widget: Optional[ipywidgets.Output] = None
+
+    @property
+    def selection_label_widget(self) -> "ipywidgets.Label":
+        with self._state_lock:
+            if self._selection_label_widget is None:
+                import ipywidgets as widgets
+
+                selection_label_widget = widgets.Label(value="", layout=widgets.Layout(margin="10px 0"))
+                selection_label_widget.style.font_size = "20px"
+                self._selection_label_widget = selection_label_widget
+            return self._selection_label_widget
+
+    @property
+    def output_area_widget(self) -> "ipywidgets.Output":
+        with self._state_lock:
+            if self._output_area_widget is None:
+                from ipywidgets import Output
+
+                self._output_area_widget = Output()
+            return self._output_area_widget
+
+    @ensure_non_empty_search_query
+    @typechecked
+    def search_datasets(
+        self: "AuctusSearchMixin",
+        search_query: SearchQuery,
+        page: int = 1,
+        size: int = 10,
+        display_initial_results: bool = False,
+    ) -> DatasetCollection:
+        datasets_collection = super().search_datasets(search_query, page, size)
+        # A new result grid invalidates the selection made on the previous one.
+        self._clear_selected_dataset()
+        if display_initial_results:
+            self._render_results(datasets_collection.datasets)
+        return datasets_collection
+
+    @typechecked
+    def _clear_selected_dataset(self) -> None:
+        with self._state_lock:
+            super()._clear_selected_dataset()
+            if self._selection_label_widget is not None:
+                self._selection_label_widget.value = ""
+
+    @typechecked
+    def _set_selected_dataset_callback(self, dataset: Dataset) -> None:
+        with self._state_lock:
+            self.select_dataset(dataset)
+            self.selection_label_widget.value = f"⏭️Selected Dataset: {self.selected_dataset_name}"
+
+    @typechecked
+    def _render_results(self, dataset_results: List[Dataset], page_size: Optional[int] = None) -> None:
+        import ipywidgets as widgets
+        from IPython.display import clear_output, display
+
+        # Renders share one output area, so they must not interleave.
+        with self._state_lock, self.output_area_widget:
+            clear_output(wait=True)
+            display(self.selection_label_widget)
+            if dataset_results:
+                display(self._paginated_results(dataset_results, page_size or self.RESULTS_PER_PAGE))
+            else:
+                display(widgets.HTML("<h3>No datasets found.</h3>"))
+        display(self.output_area_widget)
+
+    @typechecked
+    def _paginated_results(self, dataset_results: List[Dataset], page_size: int) -> "ipywidgets.Widget":
+        import ipywidgets as widgets
+
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1.")
+        page_count = math.ceil(len(dataset_results) / page_size)
+        page_area = widgets.Box()
+        if page_count == 1:
+            page_area.children = (self._results_grid(dataset_results),)
+            return page_area
+
+        previous_button = widgets.Button(description="◀ Previous")
+        next_button = widgets.Button(description="Next ▶")
+        page_label = widgets.Label()
+        # Pages are built on first visit only; the pager state lives in this closure.
+        built_pages: Dict[int, widgets.Widget] = {}
+        current_page = 0
+
+        def show_page(page: int) -> None:
+            nonlocal current_page
+            current_page = page
+            if page not in built_pages:
+                built_pages[page] = self._results_grid(
+                    dataset_results[page * page_size : (page + 1) * page_size],
+                    page * page_size + 1,
+                )
+            page_area.children = (built_pages[page],)
+            page_label.value = f"Page {page + 1} of {page_count} ({len(dataset_results)} datasets)"
+            previous_button.disabled = page == 0
+            next_button.disabled = page == page_count - 1
+
+        previous_button.on_click(lambda _: show_page(current_page - 1))
+        next_button.on_click(lambda _: show_page(current_page + 1))
+        show_page(0)
+        pager = widgets.HBox(
+            [previous_button, page_label, next_button],
+            layout=widgets.Layout(justify_content="center", align_items="center", width="100%"),
+        )
+        return widgets.VBox([pager, page_area])
+
+    @typechecked
+    def _results_grid(self, dataset_results: List[Dataset], first_number: int = 1) -> "ipywidgets.Widget":
+        import ipywidgets as widgets
+
+        from auctus_search.components import card_template
+
+        # One HTML payload and one selector per page, instead of a widget pair
+        # (and its comm channels) per card.
+        cards = widgets.HTML(value=card_template().render_page(dataset_results, first_number))
+        selector = widgets.Dropdown(
+            options=[("Select a dataset…", None)]
+            + [
+                (f"#{number} {dataset.metadata.name or 'Unknown Name'}", position)
+                for position, (number, dataset) in enumerate(enumerate(dataset_results, start=first_number))
+            ],
+            value=None,
+            layout=widgets.Layout(width="420px"),
+        )
+
+        def on_select(change: Dict[str, Any]) -> None:
+            if change["new"] is not None:
+                self._set_selected_dataset_callback(dataset_results[change["new"]])
+
+        selector.observe(on_select, names="value")
+        return widgets.VBox(
+            [
+                widgets.HBox([selector], layout=widgets.Layout(justify_content="center")),
+                cards,
+            ],
+            layout=widgets.Layout(align_items="center", width="100%"),
+        )
@@ -0,0 +1 @@
+"""Tests suite for `auctus_search`."""
@@ -0,0 +1,199 @@
+"""Shared fixtures: an in-memory stand-in for the Auctus API."""
+
+from __future__ import annotations
+
+import io
+import json
+import re
+from datetime import datetime, timezone
+from typing import Any
+from urllib.parse import urlparse
+
+import pytest
+import requests
+
+from auctus_search import AuctusDatasetCollection
+from auctus_search.API import AuctusSession
+from auctus_search.API.models import Dataset, Metadata
+
+_RANGE = re.compile(r"bytes=(\d+)-")
+
+
+def _response(status_code: int, content: bytes = b"", headers: dict[str, str] | None = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.raw = io.BytesIO(content)
+    response.headers.update(headers or {})
+    return response
+
+
+class FakeSession(AuctusSession):
+    """Answers search and download requests from registered datasets.
+
+    Searches return every dataset sharing a keyword with the query, by
+    descending score. Downloads honour ``Range`` and ``If-Range`` against the
+    dataset's ETag. Each call is recorded in ``calls``.
+    """
+
+    def __init__(self) -> None:
+        """Start with no datasets registered."""
+        super().__init__(max_retries=0)
+        self.results: list[tuple[frozenset[str], dict[str, Any]]] = []
+        self.files: dict[str, tuple[bytes, str]] = {}
+        self.calls: list[tuple[str, str, dict[str, Any]]] = []
+        self.fail_download_after: int | None = None
+
+    def add_dataset(
+        self,
+        dataset_id: str,
+        keywords: str,
+        score: float = 1.0,
+        content: bytes = b"a,b\n1,2\n",
+        etag: str = '"v1"',
+        **metadata: Any,
+    ) -> dict[str, Any]:
+        """Register a search result and the file served for it."""
+        result = {"id": dataset_id, "score": score, "metadata": {"name": dataset_id, **metadata}}
+        self.results.append((frozenset(keywords.lower().split()), result))
+        self.files[dataset_id] = (content, etag)
+        return result
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Serve ``url`` from the registered datasets."""
+        self.calls.append((method, url, kwargs))
+        if method == "POST":
+            return self._search(kwargs)
+        return self._download(url, kwargs.get("headers") or {})
+
+    def downloads(self) -> list[dict[str, str]]:
+        """Headers of every download request, in order."""
+        return [dict(kwargs.get("headers") or {}) for method, _, kwargs in self.calls if method == "GET"]
+
+    def _search(self, kwargs: dict[str, Any]) -> requests.Response:
+        query = json.loads(kwargs["data"]["query"])
+        keywords = {keyword.lower() for keyword in query["keywords"]}
+        params = kwargs.get("params") or {}
+        page, size = params.get("page", 1), params.get("size", 10)
+        matches = [result for result_keywords, result in self.results if keywords & result_keywords]
+        matches.sort(key=lambda result: result["score"], reverse=True)
+        body = {"results": matches[(page - 1) * size : page * size]}
+        return _response(200, json.dumps(body).encode("utf-8"))
+
+    def _download(self, url: str, headers: dict[str, str]) -> requests.Response:
+        dataset_id = urlparse(url).path.rsplit("/", 1)[-1]
+        if dataset_id not in self.files:
+            return _response(404, b"not found")
+        content, etag = self.files[dataset_id]
+        if headers.get("If-None-Match") == etag:
+            return _response(304, headers={"ETag": etag})
+        status_code, offset = 200, 0
+        match = _RANGE.fullmatch(headers.get("Range", ""))
+        if match and headers.get("If-Range") == etag:
+            status_code, offset = 206, int(match.group(1))
+        body = content[offset:]
+        if self.fail_download_after is not None:
+            body = body[: self.fail_download_after]
+            self.fail_download_after = None
+            response = _response(status_code, body, {"ETag": etag, "Content-Length": str(len(content) - offset)})
+            response.raw = _CutStream(body)
+            return response
+        return _response(status_code, body, {"ETag": etag, "Content-Length": str(len(body))})
+
+
+class _CutStream(io.BytesIO):
+    """A body that drops the connection once its bytes are read."""
+
+    def read(self, size: int | None = -1) -> bytes:
+        chunk = super().read(size)
+        if not chunk:
+            raise requests.exceptions.ChunkedEncodingError("connection cut")
+        return chunk
+
+
+@pytest.fixture
+def fake_session() -> FakeSession:
+    """A `FakeSession` with no datasets registered."""
+    return FakeSession()
+
+
+FARE = {"name": "Fare", "structural_type": "http://schema.org/Float", "semantic_types": []}
+PICKUP = {
+    "name": "pickup_datetime",
+    "structural_type": "http://schema.org/Text",
+    "semantic_types": ["http://schema.org/DateTime"],
+}
+BOROUGH = {
+    "name": "borough",
+    "structural_type": "http://schema.org/Text",
+    "semantic_types": ["http://schema.org/Enumeration"],
+}
+NYC = (-74.3, 40.5, -73.7, 40.9)
+PARIS = (2.2, 48.8, 2.5, 48.9)
+
+
+def _seconds(timestamp: str) -> float:
+    return datetime.fromisoformat(timestamp).replace(tzinfo=timezone.utc).timestamp()
+
+
+def _indexed_dataset(
+    dataset_id: str,
+    *,
+    score: float,
+    nb_rows: int,
+    types: tuple[str, ...] = (),
+    columns: tuple[dict[str, Any], ...] = (),
+    bbox: tuple[float, float, float, float] | None = None,
+    period: tuple[str, str] | None = None,
+) -> Dataset:
+    spatial_coverage: list[dict[str, Any]] = []
+    if bbox is not None:
+        min_longitude, min_latitude, max_longitude, max_latitude = bbox
+        # Auctus envelopes are the top-left and bottom-right corners.
+        envelope = [[min_longitude, max_latitude], [max_longitude, min_latitude]]
+        spatial_coverage.append({"ranges": [{"range": {"type": "envelope", "coordinates": envelope}}]})
+    temporal_coverage: list[dict[str, Any]] = []
+    if period is not None:
+        start, end = period
+        temporal_coverage.append({"ranges": [{"range": {"gte": _seconds(start), "lte": _seconds(end)}}]})
+    return Dataset(
+        id=dataset_id,
+        score=score,
+        metadata=Metadata(
+            name=dataset_id,
+            date="2020-01-01T00:00:00Z",
+            size=1000,
+            types=list(types),
+            nb_rows=nb_rows,
+            columns=list(columns),
+            spatial_coverage=spatial_coverage,
+            temporal_coverage=temporal_coverage,
+        ),
+    )
+
+
+@pytest.fixture
+def indexed_collection() -> AuctusDatasetCollection:
+    """Four results with columns and spatial and temporal coverage to index."""
+    datasets = [
+        _indexed_dataset(
+            "yellow-taxi",
+            score=9.0,
+            nb_rows=5000,
+            types=("spatial", "temporal", "numerical"),
+            columns=(FARE, PICKUP),
+            bbox=NYC,
+            period=("2019-01-01", "2019-12-31T23:00:00"),
+        ),
+        _indexed_dataset(
+            "green-taxi",
+            score=4.0,
+            nb_rows=50,
+            types=("temporal", "numerical"),
+            columns=(FARE, PICKUP, BOROUGH),
+            period=("2020-01-01", "2020-06-30"),
+        ),
+        _indexed_dataset("velib", score=7.0, nb_rows=800, types=("spatial",), columns=(BOROUGH,), bbox=PARIS),
+        _indexed_dataset("empty", score=1.0, nb_rows=10),
+    ]
+    return AuctusDatasetCollection(datasets, None)
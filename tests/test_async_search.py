@@ -0,0 +1,50 @@
+"""Tests for the concurrent multi-query search."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from auctus_search import AuctusClient, DatasetQuery
+
+if TYPE_CHECKING:
+    from tests.conftest import FakeSession
+
+
+@pytest.fixture
+def client(fake_session: FakeSession) -> AuctusClient:
+    fake_session.add_dataset("yellow", "taxi nyc", score=9.0, types=["spatial"])
+    fake_session.add_dataset("green", "taxi", score=4.0, types=["numerical"])
+    fake_session.add_dataset("citibike", "bike nyc", score=6.0, types=["spatial"])
+    return AuctusClient(session=fake_session)
+
+
+def test_search_many_returns_one_collection_per_query(client: AuctusClient) -> None:
+    collections = client.search_many(["taxi", "bike"])
+    assert [[dataset.id for dataset in collection] for collection in collections] == [
+        ["yellow", "green"],
+        ["citibike"],
+    ]
+
+
+def test_merge_keeps_the_best_score_and_each_query_apart(client: AuctusClient) -> None:
+    merged = client.search_many([["taxi", "nyc"], "bike"], merge=True)
+    assert [dataset.id for dataset in merged] == ["yellow", "citibike", "green"]
+    assert merged.search_query == ["taxi nyc", "bike"]
+
+
+def test_merge_with_dataset_queries(client: AuctusClient) -> None:
+    queries = [
+        DatasetQuery(["taxi", "nyc"]).with_score_greater_than(5),
+        DatasetQuery("bike"),
+    ]
+    merged = client.search_many(queries, merge=True)
+    assert [dataset.id for dataset in merged] == ["yellow", "citibike"]
+    assert merged.search_query == ["taxi nyc", "bike"]
+
+
+def test_asearch_many_bounds_concurrency(client: AuctusClient) -> None:
+    with pytest.raises(ValueError, match="max_concurrency"):
+        asyncio.run(client.asearch_many(["taxi"], max_concurrency=0))
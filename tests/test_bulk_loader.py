@@ -0,0 +1,85 @@
+"""Tests for `load_datasets`, the concurrent bulk download and load."""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any
+
+import pytest
+import requests
+
+from auctus_search import AuctusClient
+
+if TYPE_CHECKING:
+    from tests.conftest import FakeSession
+
+
+@pytest.fixture
+def client(fake_session: FakeSession) -> AuctusClient:
+    for position in range(6):
+        fake_session.add_dataset(f"taxi-{position}", "taxi", score=10.0 - position, content=b"a,b\n1,2\n3,4\n")
+    return AuctusClient(session=fake_session)
+
+
+@pytest.mark.parametrize("parse_workers", [None, 1])
+def test_a_failing_dataset_does_not_stop_the_others(client: AuctusClient, parse_workers: int | None) -> None:
+    results = sorted(
+        client.load_datasets(["taxi-0", "missing", "taxi-1"], max_workers=2, parse_workers=parse_workers),
+        key=lambda result: result.index,
+    )
+    assert [(result.dataset_id, result.ok) for result in results] == [
+        ("taxi-0", True),
+        ("missing", False),
+        ("taxi-1", True),
+    ]
+    assert isinstance(results[1].error, requests.exceptions.HTTPError)
+    assert results[1].dataframe is None
+    assert results[0].dataframe.shape == (2, 2)
+
+
+def test_loads_a_collection(client: AuctusClient) -> None:
+    collection = client.search_datasets("taxi").with_score_greater_than(7)
+    results = list(client.load_datasets(collection))
+    assert sorted(result.dataset_id for result in results) == ["taxi-0", "taxi-1", "taxi-2"]
+    assert all(result.ok and result.elapsed >= 0 for result in results)
+
+
+def test_breaking_out_cancels_datasets_not_started(
+    client: AuctusClient,
+    fake_session: FakeSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    release = threading.Event()
+    request = fake_session.request
+
+    def request_after_the_first(method: str, url: str, **kwargs: Any) -> requests.Response:
+        if fake_session.downloads():
+            release.wait(timeout=5)
+        return request(method, url, **kwargs)
+
+    monkeypatch.setattr(fake_session, "request", request_after_the_first)
+    results = client.load_datasets([f"taxi-{position}" for position in range(6)], max_workers=1)
+    assert next(results).dataset_id == "taxi-0"
+    # The second dataset is in flight; the rest are cancelled on close.
+    threading.Timer(0.2, release.set).start()
+    results.close()
+    assert len(fake_session.downloads()) == 2
+
+
+def test_work_starts_on_iteration(client: AuctusClient, fake_session: FakeSession) -> None:
+    results = client.load_datasets(["taxi-0"])
+    assert fake_session.downloads() == []
+    assert next(results).ok
+
+
+@pytest.mark.parametrize(
+    ("options", "message"),
+    [
+        ({"max_workers": 0}, "max_workers must be at least 1"),
+        ({"parse_workers": 0}, "parse_workers must be at least 1"),
+        ({"parse_workers": 2, "columnar_cache": "parquet"}, "cannot be combined with parse_workers"),
+    ],
+)
+def test_invalid_options_fail_the_call(client: AuctusClient, options: dict[str, Any], message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        client.load_datasets(["taxi-0"], **options)
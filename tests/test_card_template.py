@@ -0,0 +1,37 @@
+"""Tests for the HTML dataset cards rendered by `CardTemplate`."""
+
+from __future__ import annotations
+
+from auctus_search.API.models import Dataset, Metadata
+from auctus_search.components.card_template import CardTemplate, card_template
+
+
+def _dataset(**metadata: str | None) -> Dataset:
+    return Dataset(id="d1", score=42.0, metadata=Metadata(types=["spatial"], nb_rows=1200, **metadata))
+
+
+def test_metadata_is_escaped() -> None:
+    card = card_template().render_card(
+        _dataset(
+            name="<script>alert(1)</script>",
+            description="Rides <b>&</b> fares",
+            source='example.org/"><img src=x>',
+        ),
+    )
+    assert "<script>" not in card
+    assert "&lt;script&gt;alert(1)&lt;/script&gt;" in card
+    assert "Rides &lt;b&gt;&amp;&lt;/b&gt; fares" in card
+    assert "<img" not in card
+
+
+def test_urls_in_descriptions_are_linked_after_escaping() -> None:
+    description = CardTemplate.format_description("See https://example.org/trips?year=2019&month=1 <now>")
+    assert description == (
+        'See <a href="https://example.org/trips?year=2019&amp;month=1" target="_blank" '
+        'style="color: #007aff; text-decoration: none;">https://example.org/trips?year=2019&amp;month=1</a> &lt;now&gt;'
+    )
+
+
+def test_render_page_numbers_the_cards() -> None:
+    page = card_template().render_page([_dataset(name="first"), _dataset(name="second")], first_number=11)
+    assert page.index("#11") < page.index("first") < page.index("#12") < page.index("second")
@@ -0,0 +1,77 @@
+"""Tests for the lazy, fused filter chain of `DatasetCollection`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from auctus_search import AuctusDatasetCollection
+from auctus_search.API import collection as collection_module
+from auctus_search.API.models import Dataset, Metadata
+
+if TYPE_CHECKING:
+    from collections.abc import AbstractSet
+
+
+def _ids(collection: AuctusDatasetCollection) -> list[str]:
+    return [dataset.id for dataset in collection]
+
+
+@pytest.fixture
+def checked(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Ids of the datasets whose metadata fields are validated, in order."""
+    checked: list[str] = []
+    ensure_metadata_fields = collection_module.ensure_metadata_fields
+
+    def record(dataset: Dataset, fields: AbstractSet[str]) -> None:
+        checked.append(dataset.id)
+        ensure_metadata_fields(dataset, fields)
+
+    monkeypatch.setattr(collection_module, "ensure_metadata_fields", record)
+    return checked
+
+
+def test_chained_filters_run_in_one_lazy_pass(
+    indexed_collection: AuctusDatasetCollection,
+    checked: list[str],
+) -> None:
+    filtered = (
+        indexed_collection.with_score_greater_than(2)
+        .with_number_of_rows_greater_than(100)
+        .with_types(["spatial"])
+        .with_number_of_columns_less_than(2)
+    )
+    assert filtered._datasets is None
+    assert checked == []
+    assert _ids(filtered) == ["velib"]
+    # Each source dataset is visited once for the whole chain.
+    assert checked == ["yellow-taxi", "green-taxi", "velib", "empty"]
+    assert _ids(filtered) == ["velib"]
+    assert len(checked) == 4
+
+
+def test_filtering_a_materialised_collection_starts_from_its_result(
+    indexed_collection: AuctusDatasetCollection,
+    checked: list[str],
+) -> None:
+    above_two = indexed_collection.with_score_greater_than(2)
+    assert _ids(above_two) == ["yellow-taxi", "green-taxi", "velib"]
+    checked.clear()
+    assert _ids(above_two.with_number_of_rows_less_than(1000)) == ["green-taxi", "velib"]
+    assert checked == ["yellow-taxi", "green-taxi", "velib"]
+
+
+def test_filters_record_their_description(indexed_collection: AuctusDatasetCollection) -> None:
+    filtered = indexed_collection.with_score_between(1, 8).with_types(["temporal"])
+    assert filtered.filters == ["with_score_between: (1, 8)", "with_types: ['temporal']"]
+    assert indexed_collection.filters == []
+
+
+def test_missing_field_is_reported_when_the_chain_runs() -> None:
+    metadata = Metadata(name="partial", nb_rows=10)
+    del metadata.nb_rows
+    collection = AuctusDatasetCollection([Dataset(id="partial", score=1.0, metadata=metadata)], None)
+    filtered = collection.with_number_of_rows_greater_than(1)
+    with pytest.raises(ValueError, match="missing metadata field 'nb_rows'"):
+        len(filtered)
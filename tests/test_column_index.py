@@ -0,0 +1,78 @@
+"""Tests for the column index behind `DatasetCollection.with_column`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from auctus_search import AuctusDatasetCollection
+
+
+def _ids(collection: AuctusDatasetCollection) -> list[str]:
+    return [dataset.id for dataset in collection]
+
+
+@pytest.mark.parametrize(
+    ("criteria", "expected"),
+    [
+        ({"name": "fare"}, ["yellow-taxi", "green-taxi"]),
+        ({"name": "pick*"}, ["yellow-taxi", "green-taxi"]),
+        ({"structural_type": "Text"}, ["yellow-taxi", "green-taxi", "velib"]),
+        ({"semantic_type": "http://schema.org/Enumeration"}, ["green-taxi", "velib"]),
+        ({"name": "borough", "semantic_type": "DateTime"}, []),
+    ],
+)
+def test_with_column(
+    indexed_collection: AuctusDatasetCollection,
+    criteria: dict[str, str],
+    expected: list[str],
+) -> None:
+    assert _ids(indexed_collection.with_column(**criteria)) == expected
+
+
+def test_with_column_requires_a_criterion(indexed_collection: AuctusDatasetCollection) -> None:
+    with pytest.raises(ValueError, match="at least one of"):
+        indexed_collection.with_column()
+
+
+def test_with_column_combines_with_row_filters(indexed_collection: AuctusDatasetCollection) -> None:
+    assert _ids(indexed_collection.with_score_greater_than(5).with_column(name="borough")) == ["velib"]
+    assert _ids(indexed_collection.with_column(name="borough").with_score_greater_than(5)) == ["velib"]
+
+
+def test_column_index_is_shared_with_filtered_collections(indexed_collection: AuctusDatasetCollection) -> None:
+    by_fare = indexed_collection.with_column(name="fare")
+    by_pickup = by_fare.with_column(name="pickup_datetime")
+    assert by_fare._column_index is indexed_collection._column_index
+    assert by_pickup._column_index is indexed_collection._column_index
+    assert _ids(by_pickup) == ["yellow-taxi", "green-taxi"]
+
+
+def test_with_column_after_a_materialised_row_filter(indexed_collection: AuctusDatasetCollection) -> None:
+    index = indexed_collection.column_index
+    large = indexed_collection.with_number_of_rows_greater_than(60)
+    assert _ids(large) == ["yellow-taxi", "velib"]
+    # Index positions keep referring to the unfiltered source.
+    filtered = large.with_column(name="borough")
+    assert filtered._source is indexed_collection._source
+    assert filtered._column_index is index
+    assert _ids(filtered) == ["velib"]
+
+
+def test_row_filter_after_materialising_drops_the_index(indexed_collection: AuctusDatasetCollection) -> None:
+    by_fare = indexed_collection.with_column(name="fare")
+    assert _ids(by_fare) == ["yellow-taxi", "green-taxi"]
+    small = by_fare.with_number_of_rows_less_than(100)
+    # A row filter restarts from the materialised list, which the index
+    # over the original source does not describe.
+    assert small._source is not indexed_collection._source
+    assert small._column_index is None
+    assert _ids(small) == ["green-taxi"]
+    assert _ids(small.with_column(name="pickup_datetime")) == ["green-taxi"]
+
+
+def test_find_columns_follows_filters(indexed_collection: AuctusDatasetCollection) -> None:
+    matches = indexed_collection.with_score_greater_than(5).find_columns(name="borough")
+    assert [(dataset.id, column["name"]) for dataset, column in matches] == [("velib", "borough")]
@@ -0,0 +1,67 @@
+"""Tests for the columnar backing store behind vectorised collection filters."""
+
+from __future__ import annotations
+
+import dataclasses
+from typing import TYPE_CHECKING, Callable
+
+import pytest
+
+from auctus_search.API import ColumnarDatasets
+from auctus_search.API.models import Dataset, Metadata
+
+if TYPE_CHECKING:
+    from auctus_search import AuctusDatasetCollection
+
+Filter = Callable[["AuctusDatasetCollection"], "AuctusDatasetCollection"]
+
+
+def _ids(collection: AuctusDatasetCollection) -> list[str]:
+    return [dataset.id for dataset in collection]
+
+
+@pytest.mark.parametrize(
+    "apply_filters",
+    [
+        lambda collection: collection.with_types(["Spatial"]),
+        lambda collection: collection.with_number_of_rows_between(50, 800),
+        lambda collection: collection.with_number_of_columns_greater_than(1),
+        lambda collection: collection.with_score_greater_than(5).with_number_of_rows_less_than(1000),
+        lambda collection: collection.with_types(["temporal"]).with_column(name="borough"),
+        lambda collection: collection.with_spatial_overlap((-74.3, 40.5, -73.7, 40.9)).with_score_less_than(10),
+    ],
+)
+def test_masks_match_the_row_filters(
+    indexed_collection: AuctusDatasetCollection,
+    apply_filters: Filter,
+) -> None:
+    expected = _ids(apply_filters(indexed_collection))
+    columnar = indexed_collection.to_columnar()
+    assert columnar.is_columnar
+    assert _ids(apply_filters(columnar)) == expected
+
+
+def test_mask_filters_never_run_row_conditions(indexed_collection: AuctusDatasetCollection) -> None:
+    def row_condition(dataset: Dataset) -> bool:
+        raise AssertionError(f"{dataset.id} was filtered row by row")
+
+    filtered = indexed_collection.to_columnar().with_score_greater_than(2).with_types(["spatial"])
+    filtered._predicates = tuple(
+        dataclasses.replace(predicate, condition=row_condition) for predicate in filtered._predicates
+    )
+    assert _ids(filtered) == ["yellow-taxi", "velib"]
+
+
+def test_to_frame(indexed_collection: AuctusDatasetCollection) -> None:
+    frame = indexed_collection.to_columnar().to_frame()
+    assert list(frame["id"]) == ["yellow-taxi", "green-taxi", "velib", "empty"]
+    assert list(frame["nb_columns"]) == [2, 3, 1, 0]
+    assert list(frame["is_spatial"]) == [True, False, True, False]
+    assert str(frame["nb_rows"].dtype) == "Int64"
+
+
+def test_missing_field_is_reported_by_name() -> None:
+    metadata = Metadata(name="partial", nb_rows=10)
+    del metadata.nb_rows
+    with pytest.raises(ValueError, match="missing metadata field 'nb_rows'"):
+        ColumnarDatasets([Dataset(id="partial", score=1.0, metadata=metadata)])
@@ -0,0 +1,79 @@
+"""Tests for the spatial and temporal coverage filters of `DatasetCollection`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tests.conftest import NYC, PARIS
+
+if TYPE_CHECKING:
+    from auctus_search import AuctusDatasetCollection
+
+
+def _ids(collection: AuctusDatasetCollection) -> list[str]:
+    return [dataset.id for dataset in collection]
+
+
+@pytest.mark.parametrize(
+    ("bbox", "expected"),
+    [
+        ((-74.0, 40.7, -73.9, 40.8), ["yellow-taxi"]),
+        ((-180, -90, 180, 90), ["yellow-taxi", "velib"]),
+        ((0.0, 0.0, 1.0, 1.0), []),
+    ],
+)
+def test_with_spatial_overlap(
+    indexed_collection: AuctusDatasetCollection,
+    bbox: tuple[float, float, float, float],
+    expected: list[str],
+) -> None:
+    assert _ids(indexed_collection.with_spatial_overlap(bbox)) == expected
+
+
+def test_with_spatial_overlap_rejects_swapped_corners(indexed_collection: AuctusDatasetCollection) -> None:
+    with pytest.raises(ValueError, match="bbox must be"):
+        indexed_collection.with_spatial_overlap((NYC[2], NYC[1], NYC[0], NYC[3]))
+
+
+@pytest.mark.parametrize(
+    ("start", "end", "expected"),
+    [
+        # The end covers its whole unit, so 2019 reaches December 31st 23:00.
+        ("2019", "2019", ["yellow-taxi"]),
+        ("2019-12-31", "2020-01-01", ["yellow-taxi", "green-taxi"]),
+        ("2020-07", "2021", []),
+    ],
+)
+def test_with_temporal_overlap(
+    indexed_collection: AuctusDatasetCollection,
+    start: str,
+    end: str,
+    expected: list[str],
+) -> None:
+    assert _ids(indexed_collection.with_temporal_overlap(start, end)) == expected
+
+
+def test_index_filters_intersect(indexed_collection: AuctusDatasetCollection) -> None:
+    filtered = indexed_collection.with_column(name="fare").with_temporal_overlap("2020", "2020")
+    assert _ids(filtered) == ["green-taxi"]
+
+
+def test_coverage_indexes_are_built_once_and_shared(indexed_collection: AuctusDatasetCollection) -> None:
+    by_period = indexed_collection.with_temporal_overlap("2019", "2020")
+    by_place = by_period.with_spatial_overlap(NYC)
+    # Each index is built by the collection that first filters with it.
+    assert by_period._temporal_index is indexed_collection._temporal_index
+    assert by_place._temporal_index is indexed_collection._temporal_index
+    assert indexed_collection._spatial_index is None
+    assert by_place._spatial_index is by_period._spatial_index
+    assert _ids(by_place) == ["yellow-taxi"]
+
+
+def test_index_filters_on_columnar_collections(indexed_collection: AuctusDatasetCollection) -> None:
+    columnar = indexed_collection.to_columnar()
+    filtered = columnar.with_column(structural_type="Text").with_types(["spatial"]).with_spatial_overlap(PARIS)
+    assert filtered.is_columnar
+    assert _ids(filtered) == ["velib"]
+    assert _ids(columnar.with_temporal_overlap("2019", "2020")) == ["yellow-taxi", "green-taxi"]
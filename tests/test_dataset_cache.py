@@ -0,0 +1,53 @@
+"""Tests for the on-disk `DatasetCache` behind dataset loads."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from auctus_search import AuctusClient, DatasetCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from tests.conftest import FakeSession
+
+CSV = b"a,b\n" + b"".join(b"%d,%d\n" % (row, row) for row in range(2000))
+
+
+def _client(fake_session: FakeSession, tmp_path: Path, max_bytes: int | None) -> AuctusClient:
+    fake_session.add_dataset("first", "taxi", content=CSV)
+    fake_session.add_dataset("second", "taxi", content=CSV, etag='"v2"')
+    return AuctusClient(session=fake_session, dataset_cache=DatasetCache(tmp_path, max_bytes=max_bytes))
+
+
+def test_second_load_is_served_from_the_cache(fake_session: FakeSession, tmp_path: Path) -> None:
+    client = _client(fake_session, tmp_path, max_bytes=None)
+    assert client.load_dataset("first").shape == (2000, 2)
+    assert client.load_dataset("first").shape == (2000, 2)
+    # The revalidation request is answered with 304, so nothing is re-downloaded.
+    assert fake_session.downloads()[-1]["If-None-Match"] == '"v1"'
+    assert client.cache_info()["hits"] == 1
+    assert client.cache_info()["misses"] == 1
+
+
+def test_eviction_skips_files_still_being_read(fake_session: FakeSession, tmp_path: Path) -> None:
+    client = _client(fake_session, tmp_path, max_bytes=len(CSV))
+    chunks = client.load_dataset("first", chunksize=500)
+    # Storing the second dataset overruns max_bytes while the first is pinned.
+    assert client.load_dataset("second").shape == (2000, 2)
+    assert sum(len(chunk) for chunk in chunks) == 2000
+    # Releasing the first dataset lets eviction restore the bound.
+    assert client.cache_info()["entries"] == 1
+    assert client.cache_info()["bytes"] <= len(CSV)
+
+
+def test_converted_copies_count_against_max_bytes(fake_session: FakeSession, tmp_path: Path) -> None:
+    client = _client(fake_session, tmp_path, max_bytes=None)
+    client.load_dataset("first", columnar_cache="parquet")
+    stored_bytes = client.cache_info()["bytes"]
+    assert stored_bytes > len(CSV)
+    # Both downloads fit, but not along with the parquet copy of the first.
+    client.dataset_cache.max_bytes = stored_bytes + len(CSV) - 1
+    client.load_dataset("second")
+    assert client.cache_info()["entries"] == 1
+    assert list(tmp_path.glob("*.parquet")) == []
@@ -0,0 +1,89 @@
+"""Tests for streamed dataset downloads and their resume."""
+
+from __future__ import annotations
+
+import tempfile
+from typing import TYPE_CHECKING
+
+import pytest
+import requests
+
+from auctus_search import AuctusClient, DatasetCache
+from auctus_search.API.download import stream_download
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from tests.conftest import FakeSession
+
+CSV = b"a,b\n" + b"1,2\n" * 100
+URL = "https://auctus.test/api/v1/download/first"
+
+
+def _interrupted_download(fake_session: FakeSession, destination: Path) -> None:
+    fake_session.fail_download_after = 10
+    with pytest.raises(requests.exceptions.ChunkedEncodingError, match="connection cut"):
+        stream_download(fake_session, URL, destination)
+
+
+def test_interrupted_download_resumes_with_if_range(fake_session: FakeSession, tmp_path: Path) -> None:
+    fake_session.add_dataset("first", "taxi", content=CSV)
+    destination = tmp_path / "first.csv"
+    _interrupted_download(fake_session, destination)
+    assert (tmp_path / "first.csv.part").read_bytes() == CSV[:10]
+
+    response = stream_download(fake_session, URL, destination)
+    assert response.status_code == 206
+    assert fake_session.downloads()[-1] == {"Range": "bytes=10-", "If-Range": '"v1"'}
+    assert destination.read_bytes() == CSV
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["first.csv"]
+
+
+def test_changed_file_restarts_the_download(fake_session: FakeSession, tmp_path: Path) -> None:
+    fake_session.add_dataset("first", "taxi", content=CSV)
+    destination = tmp_path / "first.csv"
+    _interrupted_download(fake_session, destination)
+    fake_session.files["first"] = (b"c,d\n" + b"3,4\n" * 50, '"v2"')
+
+    # The stale validator makes the server send the new file whole.
+    response = stream_download(fake_session, URL, destination)
+    assert response.status_code == 200
+    assert destination.read_bytes() == b"c,d\n" + b"3,4\n" * 50
+
+
+def test_weak_etag_is_not_used_to_resume(fake_session: FakeSession, tmp_path: Path) -> None:
+    fake_session.add_dataset("first", "taxi", content=CSV, etag='W/"v1"')
+    destination = tmp_path / "first.csv"
+    _interrupted_download(fake_session, destination)
+
+    stream_download(fake_session, URL, destination)
+    assert fake_session.downloads()[-1] == {}
+    assert destination.read_bytes() == CSV
+
+
+def test_cached_load_resumes_after_a_dropped_connection(fake_session: FakeSession, tmp_path: Path) -> None:
+    fake_session.add_dataset("first", "taxi", content=CSV)
+    client = AuctusClient(session=fake_session, dataset_cache=DatasetCache(tmp_path))
+    fake_session.fail_download_after = 10
+    with pytest.raises(requests.exceptions.ChunkedEncodingError, match="connection cut"):
+        client.load_dataset("first")
+
+    assert client.load_dataset("first").shape == (100, 2)
+    assert fake_session.downloads()[-1] == {"Range": "bytes=10-", "If-Range": '"v1"'}
+
+
+def test_failed_uncached_loads_leave_no_files(
+    fake_session: FakeSession,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    fake_session.add_dataset("first", "taxi", content=CSV)
+    client = AuctusClient(session=fake_session)
+    with pytest.raises(requests.exceptions.HTTPError, match="404"):
+        client.load_dataset("missing")
+    fake_session.fail_download_after = 10
+    with pytest.raises(requests.exceptions.ChunkedEncodingError, match="connection cut"):
+        client.load_dataset("first")
+    assert client.load_dataset("first").shape == (100, 2)
+    assert list((tmp_path / "auctus_search").iterdir()) == []
@@ -0,0 +1,60 @@
+"""Guard `import auctus_search` against pulling heavy dependencies back in."""
+
+import importlib.util
+import json
+import re
+import subprocess
+import sys
+
+import pytest
+
+# Imported on first use by the display, profile and loader features only.
+DEFERRED_MODULES = (
+    "pandas",
+    "geopandas",
+    "shapely",
+    "pyarrow",
+    "ipywidgets",
+    "IPython",
+    "skrub",
+    "DataProfileViewer",
+)
+
+# Cumulative `-X importtime` budget, in microseconds. The deferred imports
+# cost several seconds, so this only trips when one of them comes back.
+IMPORT_TIME_BUDGET_US = 2_000_000
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(  # noqa: S603 - runs this interpreter on fixed arguments
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+@pytest.mark.parametrize("module", DEFERRED_MODULES)
+def test_deferred_module_names_are_importable(module: str) -> None:
+    # A misspelt name would never show up in sys.modules and always pass.
+    assert importlib.util.find_spec(module) is not None
+
+
+def test_import_does_not_load_deferred_modules() -> None:
+    result = _run_python(
+        "-c",
+        "import json, sys, auctus_search; print(json.dumps(sorted(sys.modules)))",
+    )
+    loaded = {name.split(".")[0] for name in json.loads(result.stdout)}
+    assert sorted(loaded.intersection(DEFERRED_MODULES)) == []
+
+
+def test_import_time_within_budget() -> None:
+    result = _run_python("-X", "importtime", "-c", "import auctus_search")
+    match = re.search(
+        r"^import time:\s+\d+ \|\s+(\d+) \| auctus_search$",
+        result.stderr,
+        re.MULTILINE,
+    )
+    assert match is not None, result.stderr
+    assert int(match.group(1)) < IMPORT_TIME_BUDGET_US
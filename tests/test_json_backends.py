@@ -0,0 +1,75 @@
+"""Tests for the pluggable JSON backends that decode search responses."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from auctus_search import AuctusClient, SearchCache
+from auctus_search.API import resolve_json_backend
+from auctus_search.API.models import HEAVY_METADATA_FIELDS
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from tests.conftest import FakeSession
+
+COLUMNS = [{"name": "fare", "structural_type": "http://schema.org/Float"}]
+
+
+@pytest.fixture(params=["json", "orjson", "msgspec"])
+def backend_name(request: pytest.FixtureRequest) -> str:
+    if request.param != "json":
+        pytest.importorskip(request.param)
+    return request.param
+
+
+@pytest.fixture
+def session(fake_session: FakeSession) -> FakeSession:
+    fake_session.add_dataset("yellow", "taxi", score=9.0, nb_rows=5000, columns=COLUMNS, extra={"ignored": [1, 2]})
+    fake_session.add_dataset("green", "taxi", score=4.0, types=["numerical"])
+    return fake_session
+
+
+@pytest.mark.parametrize("lazy_metadata", [False, True])
+def test_backends_decode_the_same_datasets(session: FakeSession, backend_name: str, lazy_metadata: bool) -> None:
+    client = AuctusClient(session=session, json_backend=backend_name, lazy_metadata=lazy_metadata)
+    yellow, green = client.search_datasets("taxi")
+    assert (yellow.id, yellow.score, yellow.metadata.nb_rows) == ("yellow", 9.0, 5000)
+    assert yellow.metadata.columns == COLUMNS
+    assert green.metadata.columns == []
+    assert green.metadata.types == ["numerical"]
+
+
+def test_cached_pages_are_decoded_by_the_same_backend(session: FakeSession, backend_name: str, tmp_path: Path) -> None:
+    client = AuctusClient(
+        session=session,
+        json_backend=backend_name,
+        lazy_metadata=True,
+        search_cache=SearchCache(tmp_path / "cache.sqlite"),
+    )
+    fresh = client.search_datasets("taxi")
+    cached = client.search_datasets("taxi")
+    assert sum(method == "POST" for method, _, _ in session.calls) == 1
+    assert list(cached) == list(fresh)
+
+
+def test_msgspec_leaves_heavy_fields_undecoded() -> None:
+    msgspec = pytest.importorskip("msgspec")
+    backend = resolve_json_backend("msgspec")
+    body = json.dumps(
+        {"results": [{"id": "yellow", "score": 9.0, "metadata": {"name": "yellow", "columns": COLUMNS, "extra": 1}}]},
+    )
+    (result,) = backend.decode_response(body, HEAVY_METADATA_FIELDS)
+    assert set(result["metadata"]) == {"name", "columns"}
+    assert isinstance(result["metadata"]["columns"], msgspec.Raw)
+    assert backend.lazy_decoder(result["metadata"]["columns"]) == COLUMNS
+    (result,) = backend.decode_response(body)
+    assert result["metadata"]["columns"] == COLUMNS
+
+
+def test_unknown_backend_is_rejected() -> None:
+    with pytest.raises(ValueError, match="Unknown JSON backend 'simdjson'"):
+        resolve_json_backend("simdjson")
@@ -0,0 +1,68 @@
+"""Tests for the offline `LocalIndex`."""
+
+from __future__ import annotations
+
+import sqlite3
+from typing import TYPE_CHECKING
+
+import pytest
+
+from auctus_search import AuctusClient, LocalIndex
+from auctus_search.API.models import Dataset, Metadata
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from tests.conftest import FakeSession
+
+
+def _dataset(dataset_id: str, name: str, description: str = "") -> Dataset:
+    return Dataset(
+        id=dataset_id,
+        score=1.0,
+        metadata=Metadata(name=name, description=description, columns=[{"name": "fare"}]),
+    )
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> LocalIndex:
+    return LocalIndex(tmp_path / "index.sqlite")
+
+
+def test_search_ranks_name_matches_first(index: LocalIndex) -> None:
+    index.add([_dataset("described", "rides", "yellow taxi rides"), _dataset("named", "taxi trips")])
+    results = index.search("taxi")
+    assert [dataset.id for dataset in results] == ["named", "described"]
+    assert results[0].score > results[1].score > 0
+
+
+def test_adding_a_dataset_again_replaces_it(index: LocalIndex) -> None:
+    index.add([_dataset("d1", "taxi trips")])
+    index.add([_dataset("d1", "bicycle trips")])
+    assert len(index) == 1
+    assert index.search("taxi") == []
+    assert [dataset.metadata.name for dataset in index.search("bicycle")] == ["bicycle trips"]
+    assert index.remove("d1")
+    assert not index.remove("d1")
+    assert index.search("bicycle") == []
+
+
+def test_searches_record_results_in_the_background(fake_session: FakeSession, index: LocalIndex) -> None:
+    fake_session.add_dataset("yellow", "taxi", description="yellow cab rides")
+    client = AuctusClient(session=fake_session, local_index=index)
+    client.search_datasets("taxi")
+    # search_local waits for the queued write before reading.
+    assert [dataset.id for dataset in client.search_local("cab")] == ["yellow"]
+
+
+def test_flush_reraises_failed_background_writes(index: LocalIndex, monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(_datasets: list[Dataset]) -> int:
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(index, "add", fail)
+    index.add_in_background([_dataset("d1", "taxi")]).exception()
+    index.add_in_background([_dataset("d2", "taxi")]).exception()
+    with pytest.raises(sqlite3.OperationalError, match="disk I/O error"):
+        index.flush()
+    # The failures are reported once, not on every later flush.
+    index.flush()
@@ -0,0 +1,80 @@
+"""Tests for the slotted result models and their lazily decoded fields."""
+
+from __future__ import annotations
+
+import copy
+import json
+import pickle
+from typing import Any, Callable
+
+import pytest
+
+from auctus_search.API.models import HEAVY_METADATA_FIELDS, Dataset
+
+RESULT = {
+    "id": "yellow-taxi",
+    "score": 9.0,
+    "metadata": {
+        "name": "Yellow taxi trips",
+        "nb_rows": 5000,
+        "types": ["spatial"],
+        "columns": json.dumps([{"name": "fare"}, {"name": "pickup_datetime"}]),
+        "temporal_coverage": None,
+    },
+}
+
+
+class _CountingDecoder:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, raw: str) -> Any:
+        self.calls += 1
+        return json.loads(raw)
+
+
+@pytest.fixture
+def eager() -> Dataset:
+    result = {**RESULT, "metadata": {**RESULT["metadata"], "columns": json.loads(RESULT["metadata"]["columns"])}}
+    return Dataset.from_result(result)
+
+
+def _lazy() -> Dataset:
+    return Dataset.from_result(RESULT, HEAVY_METADATA_FIELDS, json.loads)
+
+
+def test_heavy_fields_are_decoded_once_on_first_access() -> None:
+    decode = _CountingDecoder()
+    dataset = Dataset.from_result(RESULT, HEAVY_METADATA_FIELDS, decode)
+    assert dataset.metadata.nb_rows == 5000
+    assert decode.calls == 0
+    assert [column["name"] for column in dataset.metadata.columns] == ["fare", "pickup_datetime"]
+    assert dataset.metadata.columns is dataset.metadata.columns
+    assert decode.calls == 1
+
+
+def test_missing_and_null_fields_take_their_defaults() -> None:
+    metadata = _lazy().metadata
+    assert metadata.temporal_coverage is None
+    assert metadata.spatial_coverage == []
+    assert metadata.sample is None
+
+
+def test_lazy_results_equal_eager_ones(eager: Dataset) -> None:
+    assert _lazy() == eager
+    assert _lazy().metadata.to_dict() == eager.metadata.to_dict()
+    assert repr(_lazy()) == repr(eager)
+
+
+@pytest.mark.parametrize(
+    "clone",
+    [
+        lambda dataset: pickle.loads(pickle.dumps(dataset)),  # noqa: S301
+        copy.copy,
+        copy.deepcopy,
+    ],
+)
+def test_lazy_results_survive_pickle_and_copy(eager: Dataset, clone: Callable[[Dataset], Dataset]) -> None:
+    cloned = clone(_lazy())
+    assert cloned == eager
+    assert cloned.metadata.columns == eager.metadata.columns
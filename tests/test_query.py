@@ -0,0 +1,124 @@
+"""Tests for the Auctus payload built by `DatasetQuery`."""
+
+import pytest
+
+from auctus_search import DatasetQuery
+
+
+def test_keywords_only() -> None:
+    assert DatasetQuery("taxi trips").to_payload() == {"keywords": ["taxi", "trips"]}
+    assert DatasetQuery(["taxi", "nyc"]).to_payload() == {"keywords": ["taxi", "nyc"]}
+
+
+def test_spatial_overlap_sends_top_left_and_bottom_right_corners() -> None:
+    query = DatasetQuery("taxi").with_spatial_overlap((-74.3, 40.5, -73.7, 40.9))
+    assert query.to_payload()["variables"] == [
+        {
+            "type": "geospatial_variable",
+            "latitude1": 40.9,
+            "longitude1": -74.3,
+            "latitude2": 40.5,
+            "longitude2": -73.7,
+        },
+    ]
+
+
+@pytest.mark.parametrize(
+    ("bbox", "message"),
+    [
+        ((-73.7, 40.5, -74.3, 40.9), "bbox must be"),
+        ((-74.3, 40.9, -73.7, 40.5), "bbox must be"),
+        ((-74.3, -91, -73.7, 40.5), "Latitudes must be between"),
+    ],
+)
+def test_spatial_overlap_rejects_invalid_bounding_box(bbox: tuple, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        DatasetQuery("taxi").with_spatial_overlap(bbox)
+
+
+@pytest.mark.parametrize(
+    ("start", "end", "expected_start", "expected_end"),
+    [
+        ("2019", "2019", "2019-01-01T00:00:00", "2019-12-31T23:59:59"),
+        ("2019-06", "2019", "2019-06-01T00:00:00", "2019-12-31T23:59:59"),
+        ("2019-01-01", "2019-01-31", "2019-01-01T00:00:00", "2019-01-31T23:59:59"),
+    ],
+)
+def test_temporal_overlap_sends_normalised_bounds(start: str, end: str, expected_start: str, expected_end: str) -> None:
+    query = DatasetQuery("taxi").with_temporal_overlap(start, end)
+    assert query.to_payload()["variables"] == [
+        {"type": "temporal_variable", "start": expected_start, "end": expected_end},
+    ]
+
+
+def test_temporal_overlap_rejects_start_after_end() -> None:
+    with pytest.raises(ValueError, match="start must not be after end"):
+        DatasetQuery("taxi").with_temporal_overlap("2020", "2019")
+
+
+def test_first_with_types_is_pushed_down_and_later_ones_narrow_client_side() -> None:
+    query = DatasetQuery("taxi").with_types(["Spatial", "temporal"])
+    query = query.with_types(["numerical"])
+    assert query.to_payload() == {
+        "keywords": ["taxi"],
+        "types": ["spatial", "temporal"],
+    }
+    assert [predicate.args for predicate in query.client_side] == [(["numerical"],)]
+
+
+def test_predicates_split_between_server_and_client() -> None:
+    query = (
+        DatasetQuery("taxi")
+        .with_number_of_rows_greater_than(100)
+        .with_types(["spatial"])
+        .with_column(name="fare")
+        .with_spatial_overlap((-74.3, 40.5, -73.7, 40.9))
+        .with_score_greater_than(0.5)
+        .with_temporal_overlap("2019", "2020")
+    )
+    assert [predicate.name for predicate in query.pushed_down] == [
+        "with_types",
+        "with_spatial_overlap",
+        "with_temporal_overlap",
+    ]
+    assert [predicate.name for predicate in query.client_side] == [
+        "with_number_of_rows_greater_than",
+        "with_column",
+        "with_score_greater_than",
+    ]
+    payload = query.to_payload()
+    assert set(payload) == {"keywords", "types", "variables"}
+    assert [variable["type"] for variable in payload["variables"]] == [
+        "geospatial_variable",
+        "temporal_variable",
+    ]
+    assert query.server_filters() == [
+        "with_types: ['spatial'] (server)",
+        "with_spatial_overlap: (-74.3, 40.5, -73.7, 40.9) (server)",
+        "with_temporal_overlap: ('2019', '2020') (server)",
+    ]
+
+
+def test_with_methods_return_new_queries() -> None:
+    query = DatasetQuery("taxi")
+    narrowed = query.with_types(["spatial"])
+    assert query.predicates == ()
+    assert len(narrowed.predicates) == 1
+
+
+def test_empty_search_query_is_rejected() -> None:
+    with pytest.raises(ValueError, match="cannot be empty"):
+        DatasetQuery("   ")
+
+
+def test_explain_returns_the_query_plan() -> None:
+    plan = DatasetQuery("taxi").with_score_greater_than(0.5).explain()
+    assert plan.splitlines() == [
+        "Dataset Query Plan:",
+        "├── Search Query: taxi",
+        "├── Pushed down to Auctus:",
+        "│   └── None",
+        "├── Applied client-side:",
+        "│   └── with_score_greater_than: 0.5",
+        '└── Request: {"keywords": ["taxi"]}',
+    ]
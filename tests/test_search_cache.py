@@ -0,0 +1,90 @@
+"""Tests for the on-disk `SearchCache` of search responses."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from auctus_search import AuctusClient, SearchCache
+from auctus_search.cache import search_cache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from tests.conftest import FakeSession
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(search_cache, "time", clock)
+    return clock
+
+
+def _searches(fake_session: FakeSession) -> int:
+    return sum(method == "POST" for method, _, _ in fake_session.calls)
+
+
+def test_repeated_searches_are_served_from_the_cache(fake_session: FakeSession, tmp_path: Path) -> None:
+    fake_session.add_dataset("yellow", "taxi nyc")
+    client = AuctusClient(session=fake_session, search_cache=SearchCache(tmp_path / "cache.sqlite"))
+    assert [dataset.id for dataset in client.search_datasets("taxi nyc")] == ["yellow"]
+    # Keywords are normalised, so order and case do not matter.
+    assert [dataset.id for dataset in client.search_datasets("NYC Taxi")] == ["yellow"]
+    assert _searches(fake_session) == 1
+    client.search_datasets("taxi nyc", page=2)
+    assert _searches(fake_session) == 2
+
+
+def test_entries_expire_after_ttl(tmp_path: Path, clock: _Clock) -> None:
+    cache = SearchCache(tmp_path / "cache.sqlite", ttl=60)
+    cache.set("key", "taxi", [{"id": "yellow"}])
+    clock.now += 60
+    assert cache.get("key") == [{"id": "yellow"}]
+    clock.now += 1
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_purge_expired(tmp_path: Path, clock: _Clock) -> None:
+    cache = SearchCache(tmp_path / "cache.sqlite", ttl=60)
+    cache.set("old", "taxi", [])
+    clock.now += 30
+    cache.set("new", "bike", [])
+    clock.now += 31
+    assert cache.purge_expired() == 1
+    assert cache.get("new") == []
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path, clock: _Clock) -> None:
+    cache = SearchCache(tmp_path / "cache.sqlite", max_entries=2)
+    cache.set("first", "taxi", [])
+    clock.now += 1
+    cache.set("second", "bike", [])
+    clock.now += 1
+    assert cache.get("first") == []
+    clock.now += 1
+    cache.set("third", "bus", [])
+    assert len(cache) == 2
+    assert cache.get("second") is None
+    assert cache.get("first") == []
+
+
+def test_invalidate_one_query_or_everything(tmp_path: Path) -> None:
+    cache = SearchCache(tmp_path / "cache.sqlite")
+    for page in (1, 2):
+        cache.set(SearchCache.make_key("url", {"keywords": ["taxi", "nyc"]}, page, 10), ["taxi", "nyc"], [])
+    cache.set(SearchCache.make_key("url", {"keywords": ["bike"]}, 1, 10), ["bike"], [])
+    assert cache.invalidate("NYC taxi") == 2
+    assert len(cache) == 1
+    assert cache.invalidate() == 1
+    assert len(cache) == 0